@@ -0,0 +1,221 @@
+"""Spatial join between Spanish cameras and DATEX II alerts.
+
+Attaches to every alert the nearest cameras on the same road, so the
+overlay can show them and the slideshow can put incident cameras first.
+
+Example::
+
+    join = CameraAlertJoin(spain_camera_data)
+    cameras = join.match(alerts)
+    camera_ids = incident_first(loop_camera_ids, cameras)
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from config import CONSTANTS
+from tools.spatial_index import SphereGrid
+from tools.utils import haversine_km
+
+from .datex_models import LocationPoint, TruckDashboardAlert
+
+INCIDENT_CAMERAS: int = CONSTANTS.SPAIN.INCIDENT_CAMERAS
+INCIDENT_KM_MARGIN: float = CONSTANTS.SPAIN.INCIDENT_KM_MARGIN
+INCIDENT_RADIUS_KM: float = CONSTANTS.SPAIN.INCIDENT_RADIUS_KM
+
+#: Alert identity, ``(situation_id, record_id)``.
+AlertKey = tuple[str, str]
+
+
+def road_key(name: str) -> str:
+    """Normalize a road name so camera highways and DATEX roads compare equal.
+
+    Args:
+        name: Road name (e.g. ``"AP-7"``, ``"ap 7"``).
+
+    Returns:
+        The upper-cased name without spaces or dashes.
+    """
+    return name.upper().replace(" ", "").replace("-", "")
+
+
+def alert_key(alert: TruckDashboardAlert) -> AlertKey:
+    """Identity of an alert across polls.
+
+    Args:
+        alert: The alert.
+
+    Returns:
+        ``(situation_id, record_id)``.
+    """
+    return alert.situation_id, alert.record_id
+
+
+def _points(alert: TruckDashboardAlert) -> list[LocationPoint]:
+    return [p for p in (alert.location_from, alert.location_to) if p is not None]
+
+
+class _RoadCameras:
+    """Cameras of one road, sorted by km point."""
+
+    def __init__(self) -> None:
+        self.kms: list[float] = []
+        self.cameras: list[dict[str, Any]] = []
+
+    def between(self, low: float, high: float) -> list[dict[str, Any]]:
+        return self.cameras[bisect_left(self.kms, low) : bisect_right(self.kms, high)]
+
+
+class CameraAlertJoin:
+    """Join engine from DATEX II alerts to the cameras watching them.
+
+    Cameras are indexed once: per road in km order, and on a
+    :class:`SphereGrid` by coordinates.  For each alert, cameras on the
+    same road whose km point lies within the alert's km interval
+    (widened by ``km_margin``) come first, nearest to the interval
+    first.  Remaining slots are filled with cameras on the same road
+    within ``radius_km`` of an alert endpoint, nearest first, which
+    covers alerts and cameras without km points.
+
+    Args:
+        camera_data: Parsed Spanish camera data, in the highway list
+            format of :class:`~Parsers.base_parser.BaseParser`.
+        limit: Cameras attached to each alert.  Defaults to
+            ``INCIDENT_CAMERAS``.
+        km_margin: Km beyond the alert's interval still counted as
+            overlapping.  Defaults to ``INCIDENT_KM_MARGIN``.
+        radius_km: Radius of the coordinate fallback.  Defaults to
+            ``INCIDENT_RADIUS_KM``.
+    """
+
+    def __init__(
+        self,
+        camera_data: list[dict[str, Any]],
+        limit: int = INCIDENT_CAMERAS,
+        km_margin: float = INCIDENT_KM_MARGIN,
+        radius_km: float = INCIDENT_RADIUS_KM,
+    ) -> None:
+        self.limit = limit
+        self.km_margin = km_margin
+        self.radius_km = radius_km
+        self._roads: dict[str, _RoadCameras] = {}
+        self._grid = SphereGrid(radius_km)
+
+        located: dict[str, list[tuple[float, dict[str, Any]]]] = {}
+        for entry in camera_data:
+            road = road_key(entry["highway"]["name"])
+            for cam in entry["highway"]["cameras"]:
+                km = cam.get("camera_km_point")
+                # format_camera stores a missing km point as 0.0
+                if km and math.isfinite(km):
+                    located.setdefault(road, []).append((km, cam))
+                coords = cam.get("coords") or {}
+                lon, lat = coords.get("X"), coords.get("Y")
+                if lat is not None and lon is not None:
+                    self._grid.add(lat, lon, (road, lat, lon, cam))
+
+        for road, cams in located.items():
+            cams.sort(key=lambda item: item[0])
+            index = self._roads[road] = _RoadCameras()
+            index.kms = [km for km, _ in cams]
+            index.cameras = [cam for _, cam in cams]
+
+    def cameras_for(self, alert: TruckDashboardAlert) -> list[dict[str, Any]]:
+        """Nearest cameras on the alert's road.
+
+        Args:
+            alert: The alert.
+
+        Returns:
+            Up to ``limit`` camera dicts, best match first.
+        """
+        if not alert.road_name or self.limit <= 0:
+            return []
+        road = road_key(alert.road_name)
+        points = _points(alert)
+        selected: list[dict[str, Any]] = []
+
+        # 1. Km-point overlap
+        kms = [p.km_point for p in points if p.km_point is not None]
+        road_cameras = self._roads.get(road)
+        if kms and road_cameras is not None:
+            low, high = min(kms), max(kms)
+            overlapping = road_cameras.between(
+                low - self.km_margin, high + self.km_margin
+            )
+            # Distance to the interval, 0 inside it
+            overlapping.sort(
+                key=lambda cam: max(
+                    low - cam["camera_km_point"], cam["camera_km_point"] - high, 0.0
+                )
+            )
+            selected = overlapping[: self.limit]
+
+        # 2. Coordinate fallback, for the remaining slots
+        if len(selected) < self.limit:
+            chosen = {id(cam) for cam in selected}
+            nearest: dict[int, tuple[float, dict[str, Any]]] = {}
+            for point in points:
+                if point.latitude is None or point.longitude is None:
+                    continue
+                for cam_road, lat, lon, cam in self._grid.candidates(
+                    point.latitude, point.longitude
+                ):
+                    if cam_road != road or id(cam) in chosen:
+                        continue
+                    distance = haversine_km(point.latitude, point.longitude, lat, lon)
+                    if distance <= self.radius_km and (
+                        id(cam) not in nearest or distance < nearest[id(cam)][0]
+                    ):
+                        nearest[id(cam)] = (distance, cam)
+            ranked = sorted(nearest.values(), key=lambda item: item[0])
+            selected += [cam for _, cam in ranked[: self.limit - len(selected)]]
+
+        return selected
+
+    def match(
+        self, alerts: list[TruckDashboardAlert]
+    ) -> dict[AlertKey, list[dict[str, Any]]]:
+        """Cameras of every alert that has at least one.
+
+        Args:
+            alerts: The alerts, e.g. the active ones after heuristic
+                filtering.
+
+        Returns:
+            Camera dicts keyed by :func:`alert_key`, in alert order.
+        """
+        matches: dict[AlertKey, list[dict[str, Any]]] = {}
+        for alert in alerts:
+            cameras = self.cameras_for(alert)
+            if cameras:
+                matches[alert_key(alert)] = cameras
+        return matches
+
+
+def incident_first(
+    camera_ids: list[str],
+    matches: dict[AlertKey, list[dict[str, Any]]],
+    limit: int | None = None,
+) -> list[str]:
+    """Reorder a slideshow so cameras watching an alert come first.
+
+    Args:
+        camera_ids: The slideshow camera IDs, in order.
+        matches: Output of :meth:`CameraAlertJoin.match`, in alert
+            priority order.
+        limit: Maximum number of incident cameras put first.  Defaults
+            to ``None`` (all of them).
+
+    Returns:
+        The incident cameras, then the remaining slideshow cameras, each
+        camera once.
+    """
+    incident_ids = dict.fromkeys(
+        cam["camera_id"] for cameras in matches.values() for cam in cameras
+    )
+    ordered = list(incident_ids)[:limit]
+    return list(dict.fromkeys(ordered + camera_ids))
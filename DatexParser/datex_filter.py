@@ -20,7 +20,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
 
 from .datex_models import AlertConfidence, TruckDashboardAlert
 
@@ -93,6 +95,25 @@ class FilterConfig:
     suspicious_threshold: float = 0.75
 
 
+@dataclass(frozen=True, slots=True)
+class AlertColumns:
+    """Columnar view of alerts for :meth:`HeuristicFilter.classify_batch`.
+
+    Attributes:
+        ttl_days: TTL of each alert after the severity override and
+            fail-safe bonus.
+        start_us: ``start_time`` in microseconds since the epoch.
+        reference_us: ``version_time``, else ``start_time``, in
+            microseconds since the epoch.
+
+    Missing timestamps are ``numpy.iinfo(numpy.int64).min``.
+    """
+
+    ttl_days: np.ndarray
+    start_us: np.ndarray
+    reference_us: np.ndarray
+
+
 # ---------------------------------------------------------------------------
 # Filter result
 # ---------------------------------------------------------------------------
@@ -147,6 +168,25 @@ def _sort_key(alert: TruckDashboardAlert) -> datetime:
 # ---------------------------------------------------------------------------
 
 
+#: Confidence of each code returned by :meth:`HeuristicFilter.classify_batch`.
+CONFIDENCE_CODES: tuple[AlertConfidence, ...] = (
+    AlertConfidence.VERIFIED_ACTIVE,
+    AlertConfidence.SUSPICIOUS,
+    AlertConfidence.ZOMBIE,
+)
+_ACTIVE, _SUSPICIOUS, _ZOMBIE = range(3)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+#: Placeholder for missing timestamps in microsecond columns.
+_NO_TIME = np.iinfo(np.int64).min
+
+
+def _microseconds(value: datetime | None) -> int:
+    """Exact microseconds since the epoch, or ``_NO_TIME``."""
+    return _NO_TIME if value is None else (value - _EPOCH) // _MICROSECOND
+
+
 #: Severity levels ranked from lowest to highest.
 SEVERITY_RANK: dict[str, int] = {
     "low": 0,
@@ -174,6 +214,9 @@ class HeuristicFilter:
         self,
         alerts: list[TruckDashboardAlert],
         min_severity: str | None = None,
+        vectorized: bool = True,
+        now: datetime | None = None,
+        columns: AlertColumns | None = None,
     ) -> FilterResult:
         """Run the heuristic engine over a list of parsed alerts.
 
@@ -183,25 +226,44 @@ class HeuristicFilter:
                 Only alerts at or above this level are processed
                 (one of ``"low"``, ``"medium"``, ``"high"``, ``"highest"``).
                 Alerts with ``None`` severity are kept regardless.
+            vectorized: Classify all alerts at once with
+                :meth:`classify_batch` (the default) instead of one at a
+                time with :meth:`_classify`.  Both give the same result.
+            now: Reference UTC time, e.g. to replay a historical feed.
+                Defaults to the current time.
+            columns: Precomputed :meth:`columns` of *alerts*, reused by
+                the vectorized path.  Ignored with *min_severity*.
 
         Returns:
             A :class:`FilterResult` with categorized alerts.
         """
-        now = datetime.now(UTC)
+        now = now or datetime.now(UTC)
         result = FilterResult()
 
         if min_severity:
             alerts = self.filter_by_severity(alerts, min_severity)
-
-        for alert in alerts:
-            confidence = self._classify(alert, now)
-
-            if confidence == AlertConfidence.VERIFIED_ACTIVE:
-                result.active.append(alert)
-            elif confidence == AlertConfidence.SUSPICIOUS:
-                result.suspicious.append(alert)
-            else:
-                result.dropped_count += 1
+            columns = None
+
+        if vectorized:
+            codes = self.classify_batch(alerts if columns is None else columns, now)
+            result.active = [alerts[i] for i in np.flatnonzero(codes == _ACTIVE)]
+            result.suspicious = [alerts[i] for i in np.flatnonzero(codes == _SUSPICIOUS)]
+            dropped = [alerts[i] for i in np.flatnonzero(codes == _ZOMBIE)]
+        else:
+            dropped = []
+            for alert in alerts:
+                confidence = self._classify(alert, now)
+                if confidence == AlertConfidence.VERIFIED_ACTIVE:
+                    result.active.append(alert)
+                elif confidence == AlertConfidence.SUSPICIOUS:
+                    result.suspicious.append(alert)
+                else:
+                    dropped.append(alert)
+
+        result.dropped_count = len(dropped)
+        # Drop reasons are only built when they are logged
+        if logger.isEnabledFor(logging.INFO):
+            for alert in dropped:
                 logger.info(
                     "DROPPED %s (record %s): %s",
                     alert.situation_id,
@@ -247,6 +309,84 @@ class HeuristicFilter:
     # Classification pipeline
     # ------------------------------------------------------------------
 
+    def columns(self, alerts: list[TruckDashboardAlert]) -> AlertColumns:
+        """Turn alerts into the columns :meth:`classify_batch` works on.
+
+        Cause, severity and management type are resolved to a TTL
+        through lookups computed once per distinct value (steps 2-4 of
+        :meth:`_classify`), timestamps to exact microseconds.  The
+        columns do not depend on the current time, so they can be
+        classified repeatedly, e.g. to replay a feed at several times.
+
+        Args:
+            alerts: The alerts.
+
+        Returns:
+            The columns, one row per alert.
+        """
+        config = self.config
+        causes = [a.cause_type for a in alerts]
+        severities = [a.severity for a in alerts]
+        managements = [a.management_type for a in alerts]
+
+        # Bit 0: low severity + non-blocking, bit 1: highest + road closed
+        cause_ttl = {c: self._get_cause_ttl_for(c) for c in set(causes)}
+        severity_rules: dict[str | None, int] = {}
+        for value in set(severities):
+            lowered = (value or "").lower()
+            severity_rules[value] = (lowered in ("low", "")) | ((lowered == "highest") << 1)
+        management_rules: dict[str | None, int] = {}
+        for value in set(managements):
+            lowered = (value or "").lower()
+            management_rules[value] = (lowered in NON_BLOCKING_MANAGEMENT) | (
+                (lowered == "roadclosed") << 1
+            )
+        base_ttl = np.array([cause_ttl[c] for c in causes], dtype=np.int64)
+        rules = np.array([severity_rules[v] for v in severities], dtype=np.int8) & np.array(
+            [management_rules[v] for v in managements], dtype=np.int8
+        )
+        ttl = np.where(
+            rules & 1, np.minimum(base_ttl, config.low_severity_ttl_days), base_ttl
+        )
+        ttl += np.where(rules & 2, config.highest_road_closed_bonus, 0)
+
+        start = np.array([_microseconds(a.start_time) for a in alerts], dtype=np.int64)
+        version = np.array([_microseconds(a.version_time) for a in alerts], dtype=np.int64)
+        return AlertColumns(
+            ttl_days=ttl,
+            start_us=start,
+            reference_us=np.where(version != _NO_TIME, version, start),
+        )
+
+    def classify_batch(
+        self, alerts: list[TruckDashboardAlert] | AlertColumns, now: datetime
+    ) -> np.ndarray:
+        """Classify many alerts at once, with the rules of :meth:`_classify`.
+
+        Args:
+            alerts: The alerts, or their :meth:`columns`.
+            now: Current UTC time.
+
+        Returns:
+            One code per alert, indexing :data:`CONFIDENCE_CODES`.
+        """
+        columns = alerts if isinstance(alerts, AlertColumns) else self.columns(alerts)
+        ttl = columns.ttl_days
+        now_us = _microseconds(now)
+
+        # Step 5: age, as timedelta.total_seconds() / 86400 would compute it
+        has_reference = columns.reference_us != _NO_TIME
+        age_us = now_us - np.where(has_reference, columns.reference_us, now_us)
+        age_days = age_us / 10**6 / 86400
+
+        # Step 6: classification; step 1 and unknown ages stay active
+        codes = np.full(len(ttl), _ZOMBIE, dtype=np.int8)
+        codes[age_days < ttl] = _SUSPICIOUS
+        codes[age_days < ttl * self.config.suspicious_threshold] = _ACTIVE
+        future = (columns.start_us != _NO_TIME) & (columns.start_us > now_us)
+        codes[future | ~has_reference] = _ACTIVE
+        return codes
+
     def _classify(self, alert: TruckDashboardAlert, now: datetime) -> AlertConfidence:
         """Classify a single alert through the rules pipeline.
 
@@ -293,7 +433,18 @@ class HeuristicFilter:
         Returns:
             TTL in days.
         """
-        cause = (alert.cause_type or "").lower()
+        return self._get_cause_ttl_for(alert.cause_type)
+
+    def _get_cause_ttl_for(self, cause_type: str | None) -> int:
+        """Look up the base TTL of a cause type.
+
+        Args:
+            cause_type: The alert's ``cause_type``.
+
+        Returns:
+            TTL in days.
+        """
+        cause = (cause_type or "").lower()
 
         if cause in TRANSIENT_CAUSES:
             return self.config.transient_ttl_days
@@ -0,0 +1,248 @@
+"""Query indexes over parsed DATEX II alerts.
+
+Built once per parse by :class:`~DatexParser.datex_parser.DatexParser`
+and reused by every filter call until the next parse.
+"""
+
+from __future__ import annotations
+
+import math
+import unicodedata
+from bisect import bisect_left
+
+import numpy as np
+
+from config import CONSTANTS
+from tools.utils import haversine_km, haversine_km_many
+
+from .datex_models import TruckDashboardAlert
+
+EARTH_RADIUS_KM: float = CONSTANTS.COMMON.EARTH_RADIUS_KM
+
+# Widens the bounding box so floating-point rounding can never exclude a
+# point that the exact distance check would accept.
+_BOX_PADDING_DEG = 1e-6
+# Batch distances this close to the radius are re-checked with the scalar
+# haversine_km, as vectorized trig can differ from it by a few ulps.
+_BOUNDARY_EPS_KM = 1e-9
+
+_ADMIN_FIELDS = ("community", "province", "municipality")
+
+
+def fold_key(text: str) -> str:
+    """Normalize text for case- and accent-insensitive matching.
+
+    Args:
+        text: The text to normalize.
+
+    Returns:
+        The case-folded text without diacritics (``"Écija"`` → ``"ecija"``).
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class LocationIndex:
+    """Radius index over the ``location_from`` / ``location_to`` endpoints
+    of a list of alerts.
+
+    Endpoints are sorted by latitude.  A query bisects the latitude band
+    the radius can reach, skips endpoints outside the matching longitude
+    band, and confirms the rest in one batch with
+    :func:`~tools.utils.haversine_km_many`.  Distances within
+    ``_BOUNDARY_EPS_KM`` of the radius are confirmed with the scalar
+    :func:`~tools.utils.haversine_km`, so results are exactly those of a
+    full scan.  Endpoints without finite coordinates are not indexed, as
+    they are never within any radius.
+
+    Args:
+        alerts: The alerts to index.  Results are positions in this list.
+    """
+
+    def __init__(self, alerts: list[TruckDashboardAlert]) -> None:
+        endpoints = sorted(
+            (point.latitude, point.longitude, position)
+            for position, alert in enumerate(alerts)
+            for point in (alert.location_from, alert.location_to)
+            if point is not None
+            and point.latitude is not None
+            and point.longitude is not None
+            # NaN would break the latitude sort
+            and math.isfinite(point.latitude)
+            and math.isfinite(point.longitude)
+        )
+        self._lats = np.array([lat for lat, _, _ in endpoints], dtype=np.float64)
+        self._lons = np.array([lon for _, lon, _ in endpoints], dtype=np.float64)
+        self._positions = np.array(
+            [position for _, _, position in endpoints], dtype=np.int64
+        )
+
+    def __len__(self) -> int:
+        return len(self._lats)
+
+    def query(self, lat: float, lon: float, radius_km: float) -> list[int]:
+        """Positions of the alerts with an endpoint within *radius_km*.
+
+        Args:
+            lat: Latitude of the query center.
+            lon: Longitude of the query center.
+            radius_km: Maximum distance in kilometers.
+
+        Returns:
+            Matching alert positions, in ascending order.
+        """
+        if radius_km < 0 or not len(self._lats):
+            return []
+
+        # Great-circle distance is at least the latitude difference
+        angle = radius_km / EARTH_RADIUS_KM
+        d_lat = math.degrees(angle) + _BOX_PADDING_DEG
+        lo = np.searchsorted(self._lats, lat - d_lat, side="left")
+        hi = np.searchsorted(self._lats, lat + d_lat, side="right")
+        lats = self._lats[lo:hi]
+        lons = self._lons[lo:hi]
+        positions = self._positions[lo:hi]
+
+        # Widest longitude difference reachable from the query latitude,
+        # unless the radius reaches a pole
+        d_lon = math.inf
+        cos_lat = math.cos(math.radians(lat))
+        if angle < math.pi / 2 and math.sin(angle) < cos_lat:
+            d_lon = math.degrees(math.asin(math.sin(angle) / cos_lat)) + _BOX_PADDING_DEG
+
+        if d_lon != math.inf:
+            band = np.abs((lons - lon + 180.0) % 360.0 - 180.0) <= d_lon
+            lats, lons, positions = lats[band], lons[band], positions[band]
+        distances = haversine_km_many(lat, lon, lats, lons)
+        within = distances <= radius_km - _BOUNDARY_EPS_KM
+        for i in np.flatnonzero(np.abs(distances - radius_km) < _BOUNDARY_EPS_KM).tolist():
+            within[i] = haversine_km(lat, lon, float(lats[i]), float(lons[i])) <= radius_km
+        return np.unique(positions[within]).tolist()
+
+
+class AttributeIndex:
+    """Inverted indexes over the road name and administrative areas of a
+    list of alerts.
+
+    Road names are indexed as-is for exact lookups and folded with
+    :func:`fold_key` in sorted order for prefix lookups; substring
+    lookups scan the distinct folded names only.  Community,
+    province and municipality names are indexed per endpoint
+    (``location_from`` / ``location_to``) under their folded value, so
+    a substring query only scans the distinct names, not the alerts.
+
+    Args:
+        alerts: The alerts to index.  Results are positions in this list.
+    """
+
+    def __init__(self, alerts: list[TruckDashboardAlert]) -> None:
+        self._roads: dict[str, list[int]] = {}
+        folded_roads: dict[str, list[int]] = {}
+        # Endpoint ID -> alert position, for every non-missing endpoint
+        self._endpoint_alerts: list[int] = []
+        self._admin: dict[str, dict[str, list[int]]] = {f: {} for f in _ADMIN_FIELDS}
+
+        for position, alert in enumerate(alerts):
+            if alert.road_name:
+                self._roads.setdefault(alert.road_name, []).append(position)
+                folded_roads.setdefault(fold_key(alert.road_name), []).append(position)
+            for point in (alert.location_from, alert.location_to):
+                if point is None:
+                    continue
+                endpoint = len(self._endpoint_alerts)
+                self._endpoint_alerts.append(position)
+                for name, values in self._admin.items():
+                    value = getattr(point, name)
+                    if value:
+                        values.setdefault(fold_key(value), []).append(endpoint)
+
+        self._road_keys = sorted(folded_roads)
+        self._road_postings = [folded_roads[key] for key in self._road_keys]
+
+    def road(self, road: str) -> list[int]:
+        """Positions of the alerts on a road, matched exactly.
+
+        Args:
+            road: Road code (e.g. ``"AP-7"``), case-sensitive.
+
+        Returns:
+            Matching alert positions, in ascending order.
+        """
+        return list(self._roads.get(road, ()))
+
+    def road_prefix(self, prefix: str) -> list[int]:
+        """Positions of the alerts on roads starting with *prefix*,
+        ignoring case and accents.
+
+        Args:
+            prefix: Road code prefix (e.g. ``"ap-"``).
+
+        Returns:
+            Matching alert positions, in ascending order.
+        """
+        key = fold_key(prefix)
+        lo = bisect_left(self._road_keys, key)
+        positions: list[int] = []
+        for i in range(lo, len(self._road_keys)):
+            if not self._road_keys[i].startswith(key):
+                break
+            positions.extend(self._road_postings[i])
+        return sorted(positions)
+
+    def road_substring(self, text: str) -> list[int]:
+        """Positions of the alerts on roads containing *text*, ignoring
+        case and accents.
+
+        Args:
+            text: Part of a road code (e.g. ``"7"`` matches ``"AP-7"``
+                and ``"A-7"``).
+
+        Returns:
+            Matching alert positions, in ascending order.
+        """
+        key = fold_key(text)
+        return sorted(
+            position
+            for road_key, postings in zip(self._road_keys, self._road_postings, strict=True)
+            if key in road_key
+            for position in postings
+        )
+
+    def admin(
+        self,
+        community: str | None = None,
+        province: str | None = None,
+        municipality: str | None = None,
+    ) -> list[int]:
+        """Positions of the alerts with an endpoint matching every given
+        area, as a substring ignoring case and accents.
+
+        Args:
+            community: Autonomous Community to match.
+            province: Province to match.
+            municipality: Municipality to match.
+
+        Returns:
+            Matching alert positions, in ascending order.
+        """
+        endpoints: set[int] | None = None
+        for name, query in zip(
+            _ADMIN_FIELDS, (community, province, municipality), strict=True
+        ):
+            if not query:
+                continue
+            key = fold_key(query)
+            matched = {
+                endpoint
+                for value, postings in self._admin[name].items()
+                if key in value
+                for endpoint in postings
+            }
+            endpoints = matched if endpoints is None else endpoints & matched
+            if not endpoints:
+                return []
+
+        if endpoints is None:
+            # No criteria: every alert with at least one endpoint
+            return sorted(set(self._endpoint_alerts))
+        return sorted({self._endpoint_alerts[e] for e in endpoints})
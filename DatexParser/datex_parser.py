@@ -14,15 +14,19 @@ Example::
 
 from __future__ import annotations
 
-import json
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from lxml import etree
 
 from Downloaders.base_downloader import GenericDownloader
 from Parsers.base_parser import BaseParser
-from tools.utils import haversine_km
+from tools.utils import atomic_write, dump_json
 
+from .datex_index import AttributeIndex, LocationIndex
 from .datex_models import (
     NON_TRUCK_VEHICLE_TYPES,
     LocationPoint,
@@ -32,6 +36,105 @@ from .datex_models import (
 # The live DGT DATEX II v3.6 feed URL.
 _DGT_DATEX_URL = "https://nap.dgt.es/datex2/v3/dgt/SituationPublication/datex2_v36.xml"
 
+_SUPPLEMENTARY = "loc:supplementaryPositionalDescription"
+_TPEG_POINT_EXT = "loc:_tpegNonJunctionPointExtension/loc:extendedTpegNonJunctionPoint"
+
+# Identity of a record version between polls: situation ID, record ID,
+# version time and the parent's overall severity (inherited by records
+# without their own severity).
+_RecordKey = tuple[str, str, str | None, str | None]
+
+# Every element path the parser reads, keyed by field name.  Paths are
+# relative to the element they are evaluated on (noted per group), and
+# compiled once per namespace map by :func:`_compile_paths`.
+_EXTRACTION_PATHS: dict[str, str] = {
+    # <sit:situation>
+    "overall_severity": "sit:overallSeverity",
+    "records": "sit:situationRecord",
+    # <sit:situationRecord>
+    "severity": "sit:severity",
+    "creation_time": "sit:situationRecordCreationTime",
+    "version_time": "sit:situationRecordVersionTime",
+    "start_time": "sit:validity/com:validityTimeSpecification/com:overallStartTime",
+    "end_time": "sit:validity/com:validityTimeSpecification/com:overallEndTime",
+    "cause_type": "sit:cause/sit:causeType",
+    "detailed_cause_type": "sit:cause/sit:detailedCauseType/sit:roadMaintenanceType",
+    "management_type": "sit:roadOrCarriagewayOrLaneManagementType",
+    "vehicle_type": "sit:forVehiclesWithCharacteristicsOf/com:vehicleType",
+    "location_reference": "sit:locationReference",
+    # <sit:locationReference>
+    "road_name": f"{_SUPPLEMENTARY}/loc:roadInformation/loc:roadName",
+    "road_destination": f"{_SUPPLEMENTARY}/loc:roadInformation/loc:roadDestination",
+    "carriageway": f"{_SUPPLEMENTARY}/loc:carriageway/loc:carriageway",
+    "lane_usage": f"{_SUPPLEMENTARY}/loc:carriageway/loc:lane/loc:laneUsage",
+    "linear_location": "loc:tpegLinearLocation",
+    "point_location": "loc:tpegPointLocation",
+    # <loc:tpegLinearLocation>
+    "from": "loc:from",
+    "to": "loc:to",
+    "linear_direction": "loc:_tpegLinearLocationExtension/loc:extendedTpegLinearLocation/lse:tpegDirectionRoad",
+    # <loc:tpegPointLocation>
+    "point": "loc:point",
+    "point_direction": "loc:_tpegSimplePointExtension/loc:extendedTpegSimplePoint/lse:tpegDirectionRoad",
+    # <loc:from>, <loc:to>, <loc:point>
+    "latitude": "loc:pointCoordinates/loc:latitude",
+    "longitude": "loc:pointCoordinates/loc:longitude",
+    "km_point": f"{_TPEG_POINT_EXT}/lse:kilometerPoint",
+    "community": f"{_TPEG_POINT_EXT}/lse:autonomousCommunity",
+    "province": f"{_TPEG_POINT_EXT}/lse:province",
+    "municipality": f"{_TPEG_POINT_EXT}/lse:municipality",
+}
+
+
+@lru_cache(maxsize=8)
+def _compile_paths(
+    nsmap_items: tuple[tuple[str, str], ...],
+) -> dict[str, etree.XPath]:
+    """Compile :data:`_EXTRACTION_PATHS` for a namespace map.
+
+    Args:
+        nsmap_items: The namespace map as sorted ``(prefix, uri)`` pairs,
+            so it can be cached.
+
+    Returns:
+        Compiled evaluators keyed by field name, each returning the
+        matching elements in document order, plus ``xsi_type``.
+    """
+    nsmap = dict(nsmap_items)
+    compiled = {
+        name: etree.XPath(path, namespaces=nsmap)
+        for name, path in _EXTRACTION_PATHS.items()
+    }
+    # Location type attribute, as a string ("" when missing)
+    compiled["xsi_type"] = etree.XPath(
+        "string(@xsi:type)" if "xsi" in nsmap else "string(@type)", namespaces=nsmap
+    )
+    return compiled
+
+
+@dataclass
+class AlertDelta:
+    """Changes between two consecutive polls of the feed.
+
+    Alerts are matched by ``(situation_id, record_id)``; a record whose
+    ``version_time`` changed is *updated*.
+
+    Attributes:
+        added: Alerts of records absent from the previous poll.
+        updated: New versions of records present in the previous poll.
+        removed: Previous alerts of records no longer in the feed.
+    """
+
+    added: list[TruckDashboardAlert] = field(default_factory=list)
+    updated: list[TruckDashboardAlert] = field(default_factory=list)
+    removed: list[TruckDashboardAlert] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def __str__(self) -> str:
+        return f"+{len(self.added)} ~{len(self.updated)} -{len(self.removed)}"
+
 
 class DatexParser(BaseParser):
     """Parser for DATEX II SituationPublication XML from Spain's DGT.
@@ -40,6 +143,11 @@ class DatexParser(BaseParser):
     internally and can be queried via :meth:`filter_by_road`,
     :meth:`filter_by_admin`, and :meth:`filter_by_location`.
 
+    Each parse remembers its records keyed by situation ID, record ID and
+    version time.  On the next parse, records whose key is unchanged reuse
+    the previous alert instead of being extracted again, and
+    :attr:`last_delta` reports what was added, updated or removed.
+
     Args:
         downloader: HTTP downloader instance.  Defaults to ``None``.
         truck_only: When ``True`` (the default), alerts whose
@@ -48,11 +156,20 @@ class DatexParser(BaseParser):
     """
 
     def __init__(
-        self, downloader: GenericDownloader | None = None, truck_only: bool = True
+        self,
+        downloader: GenericDownloader | None = None,
+        truck_only: bool = True,
     ) -> None:
         super().__init__(downloader)
         self.truck_only = truck_only
         self._alerts: list[TruckDashboardAlert] = []
+        self._last_delta = AlertDelta()
+        # Every record of the previous / current parse, before truck filtering
+        self._previous_records: dict[_RecordKey, TruckDashboardAlert] = {}
+        self._current_records: dict[_RecordKey, TruckDashboardAlert] = {}
+        # Query indexes over _alerts, built on first use after each parse
+        self._location_index: LocationIndex | None = None
+        self._attribute_index: AttributeIndex | None = None
 
     @property
     def country(self) -> str:
@@ -64,6 +181,15 @@ class DatexParser(BaseParser):
         """The most recently parsed list of alerts."""
         return self._alerts
 
+    @property
+    def last_delta(self) -> AlertDelta:
+        """Changes in :attr:`alerts` made by the most recent parse.
+
+        Everything is *added* on the first parse, and the delta is empty
+        when the feed was not modified.
+        """
+        return self._last_delta
+
     # ------------------------------------------------------------------
     # Core parsing
     # ------------------------------------------------------------------
@@ -79,20 +205,106 @@ class DatexParser(BaseParser):
         """
         root = etree.fromstring(raw_data.encode("utf-8"))  # noqa: S320
         nsmap = self._build_nsmap(root)
+        paths = self._paths(nsmap)
         alerts: list[TruckDashboardAlert] = []
+        self._current_records = {}
 
         for situation in root.findall("sit:situation", nsmap):
-            situation_id = situation.get("id", "")
-            overall_severity = self._text(situation, "sit:overallSeverity", nsmap)
+            alerts.extend(self._parse_situation(situation, paths))
+
+        self._finish_parse(alerts)
+        return alerts
+
+    async def parse_stream(
+        self, chunks: AsyncIterator[bytes]
+    ) -> list[TruckDashboardAlert]:
+        """Parse a DATEX II document streamed in chunks into a list of alerts.
+
+        Same result as :meth:`parse`, without ever holding the whole
+        document in memory.
+
+        Args:
+            chunks: The XML document as raw byte chunks.
 
-            for record in situation.findall("sit:situationRecord", nsmap):
-                alert = self._parse_record(record, situation_id, overall_severity, nsmap)
-                if self.truck_only and self._is_non_truck_only(alert):
+        Returns:
+            A list of :class:`TruckDashboardAlert` instances.
+        """
+        alerts = [alert async for alert in self.iter_alerts(chunks)]
+        self._finish_parse(alerts)
+        return alerts
+
+    async def iter_alerts(
+        self, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[TruckDashboardAlert]:
+        """Incrementally parse streamed DATEX II XML, yielding alerts as
+        each ``<sit:situation>`` completes.
+
+        Every processed situation subtree is cleared and detached from
+        the root, so memory stays flat whatever the feed size.
+
+        Args:
+            chunks: The XML document as raw byte chunks.
+
+        Yields:
+            :class:`TruckDashboardAlert` instances, in document order.
+        """
+        pull_parser = etree.XMLPullParser(events=("end",), tag="{*}situation")
+        nsmap: dict[str, str] | None = None
+        paths: dict[str, etree.XPath] = {}
+        self._current_records = {}
+
+        async for chunk in chunks:
+            pull_parser.feed(chunk)
+            for _, situation in pull_parser.read_events():
+                root = situation.getparent()
+                # Only the root's direct <sit:situation> children, as in parse()
+                if root is None or root.getparent() is not None:
                     continue
-                alerts.append(alert)
+                if nsmap is None:
+                    nsmap = self._build_nsmap(root)
+                    paths = self._paths(nsmap)
+                if situation.tag == f"{{{nsmap.get('sit')}}}situation":
+                    for alert in self._parse_situation(situation, paths):
+                        yield alert
+                situation.clear(keep_tail=False)
+                while situation.getprevious() is not None:
+                    del root[0]
+        pull_parser.close()
+
+    def _parse_situation(
+        self, situation: etree.ElementBase, paths: dict[str, etree.XPath]
+    ) -> list[TruckDashboardAlert]:
+        """Parse the records of a ``<sit:situation>`` element.
 
-        self._alerts = alerts
-        print(f"Parsed {len(alerts)} DATEX II alerts.")
+        Records unchanged since the previous parse reuse its alert.
+
+        Args:
+            situation: The situation XML element.
+            paths: Compiled extraction paths, see :meth:`_paths`.
+
+        Returns:
+            The situation's alerts, minus non-truck ones in ``truck_only`` mode.
+        """
+        situation_id = situation.get("id", "")
+        overall_severity = self._text(situation, paths["overall_severity"])
+        alerts: list[TruckDashboardAlert] = []
+
+        for record in paths["records"](situation):
+            key = (
+                situation_id,
+                record.get("id", ""),
+                self._text(record, paths["version_time"]),
+                overall_severity,
+            )
+            alert = self._previous_records.get(key)
+            if alert is None:
+                alert = self._parse_record(
+                    record, situation_id, overall_severity, paths
+                )
+            self._current_records[key] = alert
+            if self.truck_only and self._is_non_truck_only(alert):
+                continue
+            alerts.append(alert)
         return alerts
 
     async def get_parsed_data(
@@ -102,6 +314,11 @@ class DatexParser(BaseParser):
     ) -> list[TruckDashboardAlert]:
         """Download, parse, and optionally save DATEX II alerts.
 
+        The feed is streamed into the parser as it downloads, with a
+        conditional request; when it has not changed since the previous
+        call on this parser, the previously parsed alerts are returned
+        without parsing again.
+
         Args:
             output_file: Explicit file path to save JSON output.
             output_folder: Folder — file will be named
@@ -110,30 +327,82 @@ class DatexParser(BaseParser):
         Returns:
             The list of parsed alerts.
         """
-        raw_data = await self.downloader.download(_DGT_DATEX_URL)
-        alerts = await self.parse(raw_data)
-
+        async with self.downloader.open_stream(
+            _DGT_DATEX_URL, conditional=True
+        ) as chunks:
+            if self._can_reuse_parsed():
+                # 304 Not Modified: the previous poll's alerts are still current
+                print("DATEX II feed not modified, skipping parsing.")
+                alerts = self._alerts
+                self._last_delta = AlertDelta()
+            else:
+                alerts = await self.parse_stream(chunks)
+                self._last_parsed = alerts
+
+        # Saving fsyncs the file, keep it off the event loop
         if output_file:
-            self.save_alerts(alerts, Path(output_file))
+            await asyncio.to_thread(self.save_alerts, alerts, Path(output_file))
         elif output_folder:
-            self.save_alerts(alerts, Path(output_folder) / "datex_alerts.json")
+            await asyncio.to_thread(
+                self.save_alerts, alerts, Path(output_folder) / "datex_alerts.json"
+            )
 
         return alerts
 
+    def _finish_parse(self, alerts: list[TruckDashboardAlert]) -> None:
+        """Store a parse result and compute its delta to the previous one.
+
+        Args:
+            alerts: The alerts of the new parse.
+        """
+        previous = {(a.situation_id, a.record_id): a for a in self._alerts}
+        delta = AlertDelta()
+        for alert in alerts:
+            old = previous.pop((alert.situation_id, alert.record_id), None)
+            if old is None:
+                delta.added.append(alert)
+            elif old is not alert:
+                delta.updated.append(alert)
+        delta.removed = list(previous.values())
+
+        self._alerts = alerts
+        self._location_index = None
+        self._attribute_index = None
+        self._last_delta = delta
+        self._previous_records = self._current_records
+        self._current_records = {}
+        print(f"Parsed {len(alerts)} DATEX II alerts ({delta}).")
+
     # ------------------------------------------------------------------
     # Filtering (Phase 4)
     # ------------------------------------------------------------------
 
-    def filter_by_road(self, road: str) -> list[TruckDashboardAlert]:
-        """Return alerts whose ``road_name`` matches *road* (case-sensitive).
+    def filter_by_road(
+        self, road: str, prefix: bool = False, substring: bool = False
+    ) -> list[TruckDashboardAlert]:
+        """Return alerts whose ``road_name`` matches *road*.
 
         Args:
-            road: Road code to match exactly (e.g. ``"AP-7"``).
+            road: Road code to match exactly, case-sensitive (e.g.
+                ``"AP-7"``).
+            prefix: When ``True``, match road names starting with *road*,
+                ignoring case and accents (e.g. ``"ap-"``).
+            substring: When ``True``, match road names containing *road*,
+                ignoring case and accents (e.g. ``"7"``).  Takes
+                precedence over *prefix*.
 
         Returns:
-            Filtered list of alerts.
+            Filtered list of alerts, in parse order.
         """
-        return [a for a in self._alerts if a.road_name and road == a.road_name]
+        index = self._get_attribute_index()
+        if substring:
+            positions = index.road_substring(road)
+        elif prefix:
+            positions = index.road_prefix(road)
+        else:
+            positions = index.road(road)
+        alerts = self._alerts
+        return [alerts[i] for i in positions]
 
     def filter_by_admin(
         self,
@@ -141,10 +410,12 @@ class DatexParser(BaseParser):
         province: str | None = None,
         municipality: str | None = None,
     ) -> list[TruckDashboardAlert]:
-        """Return alerts matching administrative metadata (case-insensitive).
+        """Return alerts matching administrative metadata (case- and
+        accent-insensitive substring match).
 
         Checks **both** ``location_from`` and ``location_to`` so that
-        cross-province incidents are not missed.
+        cross-province incidents are not missed; all given criteria must
+        match the same point.
 
         Args:
             community: Autonomous Community to match.
@@ -152,32 +423,11 @@ class DatexParser(BaseParser):
             municipality: Municipality to match.
 
         Returns:
-            Filtered list of alerts.
+            Filtered list of alerts, in parse order.
         """
-
-        def _matches_point(point: LocationPoint | None) -> bool:
-            if point is None:
-                return False
-            if community and (
-                not point.community or community.lower() not in point.community.lower()
-            ):
-                return False
-            if province and (
-                not point.province or province.lower() not in point.province.lower()
-            ):
-                return False
-            if municipality and (
-                not point.municipality
-                or municipality.lower() not in point.municipality.lower()
-            ):
-                return False
-            return True
-
-        return [
-            a
-            for a in self._alerts
-            if _matches_point(a.location_from) or _matches_point(a.location_to)
-        ]
+        positions = self._get_attribute_index().admin(community, province, municipality)
+        alerts = self._alerts
+        return [alerts[i] for i in positions]
 
     def filter_by_location(
         self, lat: float, lon: float, radius_km: float
@@ -185,7 +435,8 @@ class DatexParser(BaseParser):
         """Return alerts within *radius_km* of a GPS coordinate.
 
         Uses the Haversine formula.  Checks distance to **both**
-        ``location_from`` and ``location_to`` coordinates.
+        ``location_from`` and ``location_to`` coordinates.  Queries go
+        through a :class:`LocationIndex` built once per parse.
 
         Args:
             lat: Latitude of the query center.
@@ -193,19 +444,12 @@ class DatexParser(BaseParser):
             radius_km: Maximum distance in kilometers.
 
         Returns:
-            Filtered list of alerts.
+            Filtered list of alerts, in parse order.
         """
-
-        def _within(point: LocationPoint | None) -> bool:
-            if point is None or point.latitude is None or point.longitude is None:
-                return False
-            return haversine_km(lat, lon, point.latitude, point.longitude) <= radius_km
-
-        return [
-            a
-            for a in self._alerts
-            if _within(a.location_from) or _within(a.location_to)
-        ]
+        if self._location_index is None:
+            self._location_index = LocationIndex(self._alerts)
+        alerts = self._alerts
+        return [alerts[i] for i in self._location_index.query(lat, lon, radius_km)]
 
     # Convenience alias from the plan's "Final Delivery Format"
     def get_alerts_near(
@@ -223,6 +467,16 @@ class DatexParser(BaseParser):
         """
         return self.filter_by_location(lat, lon, radius)
 
+    def _get_attribute_index(self) -> AttributeIndex:
+        """Road and admin-area indexes of the current alerts.
+
+        Returns:
+            The index, built on first use after each parse.
+        """
+        if self._attribute_index is None:
+            self._attribute_index = AttributeIndex(self._alerts)
+        return self._attribute_index
+
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
@@ -235,12 +489,8 @@ class DatexParser(BaseParser):
             alerts: The alert list to save.
             path: Destination file path.
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
         data = [a.model_dump(mode="json") for a in alerts]
-        path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        atomic_write(path, dump_json(data))
         print(f"Saved {len(alerts)} alerts → {path}")
 
     # ------------------------------------------------------------------
@@ -260,30 +510,53 @@ class DatexParser(BaseParser):
         return {prefix: uri for prefix, uri in root.nsmap.items() if prefix is not None}
 
     @staticmethod
-    def _text(
-        element: etree.ElementBase,
-        xpath: str,
-        nsmap: dict[str, str],
-    ) -> str | None:
-        """Safe text extraction via XPath.
+    def _paths(nsmap: dict[str, str]) -> dict[str, etree.XPath]:
+        """Return the compiled extraction paths for a namespace map.
 
         Args:
-            element: Parent element.
-            xpath: XPath expression.
             nsmap: Namespace map.
 
+        Returns:
+            Compiled evaluators keyed by field name.
+        """
+        return _compile_paths(tuple(sorted(nsmap.items())))
+
+    @staticmethod
+    def _first(
+        element: etree.ElementBase, path: etree.XPath
+    ) -> etree.ElementBase | None:
+        """First element matched by a compiled path, like ``element.find``.
+
+        Args:
+            element: Context element.
+            path: Compiled path.
+
+        Returns:
+            The first match in document order, or ``None``.
+        """
+        nodes = path(element)
+        return nodes[0] if nodes else None
+
+    @staticmethod
+    def _text(element: etree.ElementBase, path: etree.XPath) -> str | None:
+        """Safe text extraction via a compiled path.
+
+        Args:
+            element: Parent element.
+            path: Compiled path.
+
         Returns:
             The text content, or ``None`` if the node is missing.
         """
-        node = element.find(xpath, nsmap)
-        return node.text if node is not None else None
+        nodes = path(element)
+        return nodes[0].text if nodes else None
 
     def _parse_record(
         self,
         record: etree.ElementBase,
         situation_id: str,
         overall_severity: str | None,
-        nsmap: dict[str, str],
+        paths: dict[str, etree.XPath],
     ) -> TruckDashboardAlert:
         """Parse a single ``<sit:situationRecord>`` into a model.
 
@@ -291,52 +564,33 @@ class DatexParser(BaseParser):
             record: The situationRecord XML element.
             situation_id: Parent situation ID.
             overall_severity: Severity from the parent situation.
-            nsmap: Namespace map.
+            paths: Compiled extraction paths, see :meth:`_paths`.
 
         Returns:
             A populated alert.
         """
+        text = self._text
         record_id = record.get("id", "")
 
         # --- Severity (record-level overrides situation-level) ---
-        severity = self._text(record, "sit:severity", nsmap) or overall_severity
+        severity = text(record, paths["severity"]) or overall_severity
 
         # --- Timestamps ---
-        creation_time = self._text(record, "sit:situationRecordCreationTime", nsmap)
-        version_time = self._text(record, "sit:situationRecordVersionTime", nsmap)
-        start_time = self._text(
-            record,
-            "sit:validity/com:validityTimeSpecification/com:overallStartTime",
-            nsmap,
-        )
-        end_time = self._text(
-            record,
-            "sit:validity/com:validityTimeSpecification/com:overallEndTime",
-            nsmap,
-        )
+        creation_time = text(record, paths["creation_time"])
+        version_time = text(record, paths["version_time"])
+        start_time = text(record, paths["start_time"])
+        end_time = text(record, paths["end_time"])
 
         # --- Cause ---
-        cause_type = self._text(record, "sit:cause/sit:causeType", nsmap)
-        detailed_cause_type = self._text(
-            record,
-            "sit:cause/sit:detailedCauseType/sit:roadMaintenanceType",
-            nsmap,
-        )
+        cause_type = text(record, paths["cause_type"])
+        detailed_cause_type = text(record, paths["detailed_cause_type"])
 
         # --- Restriction ---
-        management_type = self._text(
-            record,
-            "sit:roadOrCarriagewayOrLaneManagementType",
-            nsmap,
-        )
-        vehicle_type = self._text(
-            record,
-            "sit:forVehiclesWithCharacteristicsOf/com:vehicleType",
-            nsmap,
-        )
+        management_type = text(record, paths["management_type"])
+        vehicle_type = text(record, paths["vehicle_type"])
 
         # --- Location reference ---
-        loc_ref = record.find("sit:locationReference", nsmap)
+        loc_ref = self._first(record, paths["location_reference"])
         road_name: str | None = None
         road_destination: str | None = None
         direction: str | None = None
@@ -347,36 +601,20 @@ class DatexParser(BaseParser):
 
         if loc_ref is not None:
             # Road info (shared across both location types)
-            road_name = self._text(
-                loc_ref,
-                "loc:supplementaryPositionalDescription/loc:roadInformation/loc:roadName",
-                nsmap,
-            )
-            road_destination = self._text(
-                loc_ref,
-                "loc:supplementaryPositionalDescription/loc:roadInformation/loc:roadDestination",
-                nsmap,
-            )
-            carriageway = self._text(
-                loc_ref,
-                "loc:supplementaryPositionalDescription/loc:carriageway/loc:carriageway",
-                nsmap,
-            )
-            lane_usage = self._text(
-                loc_ref,
-                "loc:supplementaryPositionalDescription/loc:carriageway/loc:lane/loc:laneUsage",
-                nsmap,
-            )
+            road_name = text(loc_ref, paths["road_name"])
+            road_destination = text(loc_ref, paths["road_destination"])
+            carriageway = text(loc_ref, paths["carriageway"])
+            lane_usage = text(loc_ref, paths["lane_usage"])
 
             # Branch on location type
-            loc_type = loc_ref.get(f"{{{nsmap.get('xsi', '')}}}type", "")
+            loc_type = paths["xsi_type"](loc_ref)
 
             if "SingleRoadLinearLocation" in loc_type:
                 location_from, location_to, direction = self._parse_linear_location(
-                    loc_ref, nsmap
+                    loc_ref, paths
                 )
             elif "PointLocation" in loc_type:
-                location_from, direction = self._parse_point_location(loc_ref, nsmap)
+                location_from, direction = self._parse_point_location(loc_ref, paths)
 
         return TruckDashboardAlert(
             situation_id=situation_id,
@@ -400,95 +638,83 @@ class DatexParser(BaseParser):
         )
 
     def _parse_tpeg_point(
-        self, point_el: etree.ElementBase, nsmap: dict[str, str]
+        self, point_el: etree.ElementBase, paths: dict[str, etree.XPath]
     ) -> LocationPoint:
         """Extract a LocationPoint from a TpegNonJunctionPoint element.
 
         Args:
             point_el: The ``<loc:from>``, ``<loc:to>``, or ``<loc:point>``
                 element.
-            nsmap: Namespace map.
+            paths: Compiled extraction paths, see :meth:`_paths`.
 
         Returns:
             Populated LocationPoint.
         """
-        lat = self._text(point_el, "loc:pointCoordinates/loc:latitude", nsmap)
-        lon = self._text(point_el, "loc:pointCoordinates/loc:longitude", nsmap)
-
-        ext_path = "loc:_tpegNonJunctionPointExtension/loc:extendedTpegNonJunctionPoint"
-        km = self._text(point_el, f"{ext_path}/lse:kilometerPoint", nsmap)
-        community = self._text(point_el, f"{ext_path}/lse:autonomousCommunity", nsmap)
-        province = self._text(point_el, f"{ext_path}/lse:province", nsmap)
-        municipality = self._text(point_el, f"{ext_path}/lse:municipality", nsmap)
+        text = self._text
+        lat = text(point_el, paths["latitude"])
+        lon = text(point_el, paths["longitude"])
+        km = text(point_el, paths["km_point"])
 
         return LocationPoint(
             latitude=float(lat) if lat else None,
             longitude=float(lon) if lon else None,
             km_point=float(km) if km else None,
-            community=community,
-            province=province,
-            municipality=municipality,
+            community=text(point_el, paths["community"]),
+            province=text(point_el, paths["province"]),
+            municipality=text(point_el, paths["municipality"]),
         )
 
     def _parse_linear_location(
-        self, loc_ref: etree.ElementBase, nsmap: dict[str, str]
+        self, loc_ref: etree.ElementBase, paths: dict[str, etree.XPath]
     ) -> tuple[LocationPoint | None, LocationPoint | None, str | None]:
         """Parse a ``SingleRoadLinearLocation`` into from/to points.
 
         Args:
             loc_ref: The ``<sit:locationReference>`` element.
-            nsmap: Namespace map.
+            paths: Compiled extraction paths, see :meth:`_paths`.
 
         Returns:
             Tuple of ``(location_from, location_to, direction)``.
         """
-        linear = loc_ref.find("loc:tpegLinearLocation", nsmap)
+        linear = self._first(loc_ref, paths["linear_location"])
         if linear is None:
             return None, None, None
 
-        from_el = linear.find("loc:from", nsmap)
-        to_el = linear.find("loc:to", nsmap)
+        from_el = self._first(linear, paths["from"])
+        to_el = self._first(linear, paths["to"])
 
         location_from = (
-            self._parse_tpeg_point(from_el, nsmap) if from_el is not None else None
+            self._parse_tpeg_point(from_el, paths) if from_el is not None else None
         )
         location_to = (
-            self._parse_tpeg_point(to_el, nsmap) if to_el is not None else None
+            self._parse_tpeg_point(to_el, paths) if to_el is not None else None
         )
 
-        direction = self._text(
-            linear,
-            "loc:_tpegLinearLocationExtension/loc:extendedTpegLinearLocation/lse:tpegDirectionRoad",
-            nsmap,
-        )
+        direction = self._text(linear, paths["linear_direction"])
         return location_from, location_to, direction
 
     def _parse_point_location(
-        self, loc_ref: etree.ElementBase, nsmap: dict[str, str]
+        self, loc_ref: etree.ElementBase, paths: dict[str, etree.XPath]
     ) -> tuple[LocationPoint | None, str | None]:
         """Parse a ``PointLocation`` into a single point.
 
         Args:
             loc_ref: The ``<sit:locationReference>`` element.
-            nsmap: Namespace map.
+            paths: Compiled extraction paths, see :meth:`_paths`.
 
         Returns:
             Tuple of ``(location_from, direction)``.
         """
-        point_loc = loc_ref.find("loc:tpegPointLocation", nsmap)
+        point_loc = self._first(loc_ref, paths["point_location"])
         if point_loc is None:
             return None, None
 
-        point_el = point_loc.find("loc:point", nsmap)
+        point_el = self._first(point_loc, paths["point"])
         location = (
-            self._parse_tpeg_point(point_el, nsmap) if point_el is not None else None
+            self._parse_tpeg_point(point_el, paths) if point_el is not None else None
         )
 
-        direction = self._text(
-            point_loc,
-            "loc:_tpegSimplePointExtension/loc:extendedTpegSimplePoint/lse:tpegDirectionRoad",
-            nsmap,
-        )
+        direction = self._text(point_loc, paths["point_direction"])
         return location, direction
 
     @staticmethod
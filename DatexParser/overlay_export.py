@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from Downloaders.base_downloader import GenericDownloader
 from config import CONSTANTS
+from tools.utils import atomic_write, dump_json
 
-from .datex_filter import FilterConfig, HeuristicFilter, SEVERITY_RANK
+from .camera_join import CameraAlertJoin
+from .datex_filter import FilterConfig, FilterResult, HeuristicFilter, SEVERITY_RANK
 from .datex_models import TruckDashboardAlert
 from .datex_parser import DatexParser
 
@@ -61,12 +64,48 @@ def _serialize_alert(alert: TruckDashboardAlert, confidence: str) -> dict[str, A
     }
 
 
+def _rank_key(entry: tuple[TruckDashboardAlert, str]) -> tuple[int, str]:
+    # Severity, then the serialized recency timestamp (compared as a string)
+    alert = entry[0]
+    timestamp = alert.version_time or alert.creation_time or alert.start_time
+    return (
+        SEVERITY_RANK.get((alert.severity or "").lower(), 0),
+        timestamp.isoformat() if timestamp else "",
+    )
+
+
+def select_overlay_alerts(
+    result: FilterResult, max_items: int = 50
+) -> list[tuple[TruckDashboardAlert, str]]:
+    """Top alerts by (severity rank, recency), with their confidence.
+
+    Only the winners are kept, with a heap when ``max_items`` is set, so
+    callers serialize ``max_items`` alerts whatever the feed size.  Ties
+    keep active alerts before suspicious ones, in filter order.
+
+    Args:
+        result: The heuristic filter output.
+        max_items: Number of alerts to keep, all of them if not positive.
+
+    Returns:
+        ``(alert, confidence)`` pairs, best first.
+    """
+    candidates = [(a, "verified_active") for a in result.active]
+    candidates += [(a, "suspicious") for a in result.suspicious]
+    if max_items > 0:
+        return heapq.nlargest(max_items, candidates, key=_rank_key)
+    return sorted(candidates, key=_rank_key, reverse=True)
+
+
 async def build_overlay_payload(
     roads: list[str] | None = None,
     max_items: int = 50,
     filter_config: FilterConfig | None = None,
+    parser: DatexParser | None = None,
+    camera_join: CameraAlertJoin | None = None,
 ) -> dict[str, Any]:
-    parser = DatexParser(downloader=GenericDownloader())
+    # Reusing a parser across polls lets it skip parsing an unchanged feed
+    parser = parser or DatexParser(downloader=GenericDownloader())
     await parser.get_parsed_data()
 
     alerts = parser.alerts
@@ -79,22 +118,16 @@ async def build_overlay_payload(
     heuristic = HeuristicFilter(config=filter_config)
     result = heuristic.filter(alerts)
 
-    active = [_serialize_alert(a, "verified_active") for a in result.active]
-    suspicious = [_serialize_alert(a, "suspicious") for a in result.suspicious]
-    merged = active + suspicious
-    merged.sort(
-        key=lambda item: (
-            SEVERITY_RANK.get((item.get("severity") or "").lower(), 0),
-            item.get("version_time")
-            or item.get("creation_time")
-            or item.get("start_time")
-            or "",
-        ),
-        reverse=True,
-    )
-
-    if max_items > 0:
-        merged = merged[:max_items]
+    # Only the selected alerts are serialized
+    merged = []
+    for alert, confidence in select_overlay_alerts(result, max_items):
+        item = _serialize_alert(alert, confidence)
+        if camera_join is not None:
+            # Cameras watching the alert, nearest first
+            item["cameras"] = [
+                cam["camera_id"] for cam in camera_join.cameras_for(alert)
+            ]
+        merged.append(item)
 
     return {
         "generated_at": datetime.now(UTC).isoformat(),
@@ -106,10 +139,8 @@ async def build_overlay_payload(
 
 
 def write_overlay_payload(payload: dict[str, Any], output_file: Path) -> None:
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    # Atomic, so browser sources polling the file never read half of it
+    atomic_write(output_file, dump_json(payload))
 
 
 async def export_overlay_data(
@@ -117,12 +148,18 @@ async def export_overlay_data(
     roads: list[str] | None = None,
     max_items: int = 50,
     filter_config: FilterConfig | None = None,
+    parser: DatexParser | None = None,
+    camera_join: CameraAlertJoin | None = None,
 ) -> Path:
     target = output_file or (CONSTANTS.COMMON.DATA_DIR / "overlay_data.json")
     payload = await build_overlay_payload(
-        roads=roads, max_items=max_items, filter_config=filter_config
+        roads=roads,
+        max_items=max_items,
+        filter_config=filter_config,
+        parser=parser,
+        camera_join=camera_join,
     )
-    write_overlay_payload(payload, target)
+    await asyncio.to_thread(write_overlay_payload, payload, target)
     return target
 
 
@@ -132,13 +169,23 @@ async def run_overlay_export_loop(
     roads: list[str] | None = None,
     max_items: int = 50,
     filter_config: FilterConfig | None = None,
+    camera_join: CameraAlertJoin | None = None,
+    on_payload: Callable[[dict[str, Any]], None] | None = None,
 ) -> None:
+    parser = DatexParser(downloader=GenericDownloader())
+    target = output_file or (CONSTANTS.COMMON.DATA_DIR / "overlay_data.json")
     while True:
-        target = await export_overlay_data(
-            output_file=output_file,
+        payload = await build_overlay_payload(
             roads=roads,
             max_items=max_items,
             filter_config=filter_config,
+            parser=parser,
+            camera_join=camera_join,
         )
-        print(f"Overlay data updated: {target}")
+        # The write is fsynced, keep it off the event loop
+        await asyncio.to_thread(write_overlay_payload, payload, target)
+        # Push to live clients (e.g. OverlayServer.publish) as soon as the poll ends
+        if on_payload is not None:
+            on_payload(payload)
+        print(f"Overlay data updated: {target} (alerts {parser.last_delta})")
         await asyncio.sleep(interval_seconds)
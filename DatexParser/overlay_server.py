@@ -0,0 +1,225 @@
+"""Server-Sent Events push server for the DATEX II overlay.
+
+Keeps the latest overlay payload in memory and pushes it to every
+connected overlay as soon as a poll finishes: a full ``snapshot`` event
+on connect, then ``delta`` events carrying only the alerts that changed
+and the new alert order.
+
+Routes:
+
+* ``/events``: the SSE stream.
+* ``/overlay_data.json``: the latest payload, for polling clients.
+* ``/overlay/``: the overlay page (``data/overlay/``).
+
+Example::
+
+    server = OverlayServer()
+    await server.start()
+    await run_overlay_export_loop(on_payload=server.publish)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+from config import CONSTANTS
+from tools.utils import dump_json
+
+OVERLAY_HOST: str = CONSTANTS.SPAIN.OVERLAY_HOST
+OVERLAY_PORT: int = CONSTANTS.SPAIN.OVERLAY_PORT
+OVERLAY_KEEPALIVE_S: float = CONSTANTS.SPAIN.OVERLAY_KEEPALIVE_S
+
+# Events buffered per client; a client that falls further behind is
+# disconnected and gets a fresh snapshot when its EventSource reconnects.
+_CLIENT_QUEUE_SIZE = 16
+
+# Overlay pages may be opened from disk (OBS local file) and still
+# connect to the server
+_CORS_HEADERS = {"Access-Control-Allow-Origin": "*"}
+
+
+def overlay_key(item: dict[str, Any]) -> str:
+    """Identity of a serialized overlay alert, as used in deltas.
+
+    Args:
+        item: An alert of the overlay payload.
+
+    Returns:
+        ``"<situation_id>/<record_id>"``.
+    """
+    return f"{item.get('situation_id')}/{item.get('record_id')}"
+
+
+def payload_delta(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Changes from one overlay payload to the next.
+
+    Args:
+        previous: The payload the clients have.
+        current: The new payload.
+
+    Returns:
+        The metadata of *current*, plus ``upsert`` (new or changed
+        alerts) and ``order`` (:func:`overlay_key` of every alert of
+        *current*, in order) instead of ``alerts``.
+    """
+    known = {overlay_key(item): item for item in previous.get("alerts", [])}
+    delta = {key: value for key, value in current.items() if key != "alerts"}
+    delta["upsert"] = [
+        item for item in current["alerts"] if known.get(overlay_key(item)) != item
+    ]
+    delta["order"] = [overlay_key(item) for item in current["alerts"]]
+    return delta
+
+
+def _event(name: str, event_id: int, data: str) -> bytes:
+    # Compact JSON is a single line, so one data field is enough
+    return f"id: {event_id}\nevent: {name}\ndata: {data}\n\n".encode()
+
+
+class OverlayServer:
+    """In-memory overlay payload pushed over Server-Sent Events.
+
+    Args:
+        host: Interface to listen on.  Defaults to ``OVERLAY_HOST``.
+        port: Port to listen on.  Defaults to ``OVERLAY_PORT``.
+        static_dir: Directory served under ``/overlay/``.  Defaults to
+            ``data/overlay``.
+        keepalive_s: Seconds between keep-alive comments on idle
+            streams.  Defaults to ``OVERLAY_KEEPALIVE_S``.
+    """
+
+    def __init__(
+        self,
+        host: str = OVERLAY_HOST,
+        port: int = OVERLAY_PORT,
+        static_dir: Path | None = None,
+        keepalive_s: float = OVERLAY_KEEPALIVE_S,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.static_dir = static_dir or (CONSTANTS.COMMON.DATA_DIR / "overlay")
+        self.keepalive_s = keepalive_s
+        self._payload: dict[str, Any] | None = None
+        self._payload_json: str | None = None
+        self._version = 0
+        self._clients: set[asyncio.Queue[bytes | None]] = set()
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def clients(self) -> int:
+        """Number of connected SSE clients."""
+        return len(self._clients)
+
+    def publish(self, payload: dict[str, Any]) -> None:
+        """Make *payload* the latest one and push it to every client.
+
+        Clients get a ``delta`` event, or a ``snapshot`` when the delta
+        would not be smaller than the full payload.
+
+        Args:
+            payload: Output of
+                :func:`~DatexParser.overlay_export.build_overlay_payload`.
+        """
+        payload_json = dump_json(payload, compact=True).decode()
+        self._version += 1
+        message = _event("snapshot", self._version, payload_json)
+        if self._payload is not None:
+            delta_json = dump_json(
+                payload_delta(self._payload, payload), compact=True
+            ).decode()
+            if len(delta_json) < len(payload_json):
+                message = _event("delta", self._version, delta_json)
+        self._payload = payload
+        self._payload_json = payload_json
+
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Too far behind for deltas: end its stream
+                self._disconnect(queue)
+
+    async def start(self) -> None:
+        """Start listening on ``host:port``."""
+        app = web.Application()
+        app.router.add_get("/events", self._events)
+        app.router.add_get("/overlay_data.json", self._latest)
+        app.router.add_get("/", self._index)
+        app.router.add_static("/overlay/", self.static_dir)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        print(f"Overlay server listening on http://{self.host}:{self.port}/")
+
+    async def stop(self) -> None:
+        """Disconnect every client and stop listening."""
+        for queue in list(self._clients):
+            self._disconnect(queue)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _disconnect(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """End a client's stream, dropping the messages it has not read yet."""
+        self._clients.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def _index(self, request: web.Request) -> web.StreamResponse:
+        raise web.HTTPFound("/overlay/index.html")
+
+    async def _latest(self, request: web.Request) -> web.Response:
+        if self._payload_json is None:
+            raise web.HTTPServiceUnavailable(
+                text="No overlay data yet", headers=_CORS_HEADERS
+            )
+        return web.Response(
+            text=self._payload_json,
+            content_type="application/json",
+            headers={"Cache-Control": "no-store", **_CORS_HEADERS},
+        )
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-store",
+                "X-Accel-Buffering": "no",
+                **_CORS_HEADERS,
+            }
+        )
+        await response.prepare(request)
+
+        # Subscribe and take the snapshot without yielding, so no publish
+        # can fall between them.  A reconnecting client that already has
+        # the latest version (Last-Event-ID) gets no snapshot.
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(_CLIENT_QUEUE_SIZE)
+        self._clients.add(queue)
+        snapshot = None
+        if self._payload_json is not None and request.headers.get(
+            "Last-Event-ID"
+        ) != str(self._version):
+            snapshot = _event("snapshot", self._version, self._payload_json)
+
+        try:
+            if snapshot is not None:
+                await response.write(snapshot)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), self.keepalive_s)
+                except TimeoutError:
+                    message = b": keep-alive\n\n"
+                if message is None:
+                    break
+                await response.write(message)
+        except ConnectionResetError:
+            pass
+        finally:
+            # Also on cancellation, e.g. when the server stops
+            self._clients.discard(queue)
+        return response
@@ -1,10 +1,15 @@
+import asyncio
 import socket
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, ClassVar
 
 import aiohttp
 
 from config import CONSTANTS
+from Downloaders.validator_cache import ValidatorCache
 
 
 class HTTPError(Exception):
@@ -19,8 +24,17 @@ class BaseDownloader(ABC):
 
     Provides common functionality for creating HTTP sessions with standardized
     timeout, rate limiting, and error handling configurations.
+
+    All downloaders share a process-wide connection pool: a single TCP connector
+    (keep-alive connections and DNS cache) and one session per timeout value.
+    Use `session_pool()` or `close_sessions()` to release it on shutdown.
     """
 
+    # Process-wide pool, shared by every downloader instance
+    _shared_connector: ClassVar[aiohttp.TCPConnector | None] = None
+    _shared_sessions: ClassVar[dict[float, aiohttp.ClientSession]] = {}
+    _shared_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+
     def __init__(
         self,
         timeout_int: float = CONSTANTS.COMMON.HTTP_TIMEOUT,
@@ -37,6 +51,20 @@ class BaseDownloader(ABC):
         """
         self.timeout_int = timeout_int
         self.rate_limit = rate_limit
+        self.validator_cache = ValidatorCache()
+        # url -> whether the last conditional download returned new content
+        self.changed: dict[str, bool] = {}
+
+    @property
+    def data_changed(self) -> bool:
+        """
+        Whether any of the downloaded sources changed since the previous download.
+        Always True unless every conditional download was answered with 304 Not Modified.
+
+        Returns:
+            bool: False if the cached data can be reused as is.
+        """
+        return not self.changed or any(self.changed.values())
 
     def _get_http_settings(
         self,
@@ -51,16 +79,106 @@ class BaseDownloader(ABC):
 
         headers: dict[str, str] = CONSTANTS.COMMON.DEFAULT_HEADERS.copy()
         timeout = aiohttp.ClientTimeout(total=self.timeout_int)
+        connector = self._create_connector(self.rate_limit)
+        return headers, timeout, connector
+
+    @staticmethod
+    def _create_connector(limit: int, limit_per_host: int = 0) -> aiohttp.TCPConnector:
+        """
+        Creates a TCP connector with keep-alive and a cached DNS resolver.
 
+        Args:
+            limit (int): The maximum number of concurrent connections.
+            limit_per_host (int, optional): The maximum number of concurrent connections
+                to a single host. Defaults to 0 -> no per-host limit.
+
+        Returns:
+            aiohttp.TCPConnector: The configured connector.
+        """
         # This shouldn't be required but for some reason it is
         resolver = aiohttp.AsyncResolver(nameservers=["8.8.8.8", "1.1.1.1"])
-        connector = aiohttp.TCPConnector(
+        return aiohttp.TCPConnector(
             resolver=resolver,
-            limit=self.rate_limit,
-            ttl_dns_cache=300,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=CONSTANTS.COMMON.DNS_CACHE_TTL,
+            keepalive_timeout=CONSTANTS.COMMON.HTTP_KEEPALIVE_TIMEOUT,
             family=socket.AF_INET,
         )
-        return headers, timeout, connector
+
+    @classmethod
+    def _get_shared_connector(cls) -> aiohttp.TCPConnector:
+        """
+        Returns the process-wide connector, creating it on first use.
+        A new connector is created if the previous one was closed or belongs to another event loop.
+
+        Returns:
+            aiohttp.TCPConnector: The shared connector.
+        """
+        loop = asyncio.get_running_loop()
+        connector = BaseDownloader._shared_connector
+        if (
+            connector is None
+            or connector.closed
+            or BaseDownloader._shared_loop is not loop
+        ):
+            connector = cls._create_connector(
+                CONSTANTS.COMMON.CONNECTION_BUDGET, CONSTANTS.COMMON.HOST_CONNECTION_LIMIT
+            )
+            BaseDownloader._shared_connector = connector
+            BaseDownloader._shared_sessions = {}
+            BaseDownloader._shared_loop = loop
+        return connector
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session matching this downloader's timeout.
+        The session must not be closed by the caller, see `close_sessions()`.
+
+        Returns:
+            aiohttp.ClientSession: A long-lived session on the shared connector.
+        """
+        connector = self._get_shared_connector()
+        session = BaseDownloader._shared_sessions.get(self.timeout_int)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=CONSTANTS.COMMON.DEFAULT_HEADERS.copy(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_int),
+                connector=connector,
+                connector_owner=False,
+            )
+            BaseDownloader._shared_sessions[self.timeout_int] = session
+        return session
+
+    @classmethod
+    async def close_sessions(cls) -> None:
+        """
+        Shutdown hook closing every shared session and the shared connector.
+        """
+        sessions = list(BaseDownloader._shared_sessions.values())
+        connector = BaseDownloader._shared_connector
+        BaseDownloader._shared_sessions = {}
+        BaseDownloader._shared_connector = None
+        BaseDownloader._shared_loop = None
+        for session in sessions:
+            await session.close()
+        if connector is not None:
+            await connector.close()
+
+    @classmethod
+    @asynccontextmanager
+    async def session_pool(cls) -> AsyncIterator[None]:
+        """
+        Async context manager scoping the lifetime of the shared connection pool.
+
+        Example:
+            async with BaseDownloader.session_pool():
+                await SpainDownloader().get_data()
+        """
+        try:
+            yield
+        finally:
+            await cls.close_sessions()
 
     @staticmethod
     def _format_error_message(method: str, url: str, error: Exception) -> str:
@@ -102,19 +220,58 @@ class BaseDownloader(ABC):
             else:
                 return await response.text()
 
+    async def _conditional_request(
+        self, session: aiohttp.ClientSession, method: str, url: str
+    ) -> str:
+        """
+        Executes a conditional HTTP request backed by the validator cache.
+        Sends the cached validators and serves the cached body on 304 Not Modified.
+
+        Args:
+            session (aiohttp.ClientSession): The active client session.
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The target URL.
+
+        Returns:
+            str: The response content, fresh or from the cache.
+        """
+        cache = self.validator_cache
+        headers = await asyncio.to_thread(cache.request_headers, method, url)
+        async with session.request(method, url, headers=headers) as response:
+            response.raise_for_status()
+            if response.status == 304:
+                cached = await asyncio.to_thread(cache.load_body, method, url)
+                if cached is not None:
+                    self.changed[url] = False
+                    return cached
+            else:
+                content = await response.text()
+                await asyncio.to_thread(
+                    cache.store, method, url, content, response.headers
+                )
+                self.changed[url] = True
+                return content
+
+        # 304 without a usable cached body, fall back to a full download
+        self.changed[url] = True
+        return str(await self._async_request(session, method, url))
+
     async def _fetch_response(
         self,
         url: str,
         method: str,
         session: aiohttp.ClientSession | None,
+        conditional: bool = False,
     ) -> str:
         """
-        Fetches the response from a URL using an existing or new session.
+        Fetches the response from a URL using an existing or the shared session.
 
         Args:
             url (str): The target URL.
             method (str): The HTTP method.
-            session (aiohttp.ClientSession | None): An existing session or None if a new session should be created.
+            session (aiohttp.ClientSession | None): An existing session or None to use the shared session.
+            conditional (bool, optional): Whether to use a conditional request (ETag / Last-Modified)
+                backed by the on-disk validator cache. Defaults to False.
 
         Raises:
             HTTPError: If the request fails due to an aiohttp.ClientError.
@@ -124,17 +281,12 @@ class BaseDownloader(ABC):
         """
         try:
             if session is None:
-                headers, timeout_ctx, connector = self._get_http_settings()
-                async with aiohttp.ClientSession(
-                    headers=headers, timeout=timeout_ctx, connector=connector
-                ) as new_session:  # Create a new session
-                    content = await self._async_request(new_session, method, url)
-                    return str(content)  # enforce return type as str
-            else:
-                content = await self._async_request(
-                    session, method, url
-                )  # Use existing session
-                return str(content)
+                session = self.get_session()
+            if conditional:
+                return await self._conditional_request(session, method, url)
+            content = await self._async_request(session, method, url)
+            self.changed[url] = True
+            return str(content)  # enforce return type as str
         except aiohttp.ClientError as e:
             raise HTTPError(self._format_error_message(method, url, e)) from e
 
@@ -143,6 +295,7 @@ class BaseDownloader(ABC):
     ) -> tuple[dict[str, str], aiohttp.ClientTimeout, aiohttp.TCPConnector]:
         """
         Public method to get standard HTTP settings.
+        Prefer `get_session()`, which reuses pooled connections, over building a new session from these.
 
         Returns:
             tuple[dict[str, str], aiohttp.ClientTimeout, aiohttp.TCPConnector]:
@@ -151,7 +304,10 @@ class BaseDownloader(ABC):
         return self._get_http_settings()
 
     async def download(
-        self, url: str, session: aiohttp.ClientSession | None = None
+        self,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+        conditional: bool = False,
     ) -> str:
         """
         Public method to download content from a URL via a GET request.
@@ -159,14 +315,19 @@ class BaseDownloader(ABC):
         Args:
             url (str): The target URL.
             session (aiohttp.ClientSession | None, optional): An active session. Defaults to None.
+            conditional (bool, optional): Whether to revalidate a cached copy instead of
+                downloading it again. See `data_changed`. Defaults to False.
 
         Returns:
             str: The downloaded content as a string.
         """
-        return await self._fetch_response(url, "GET", session)
+        return await self._fetch_response(url, "GET", session, conditional)
 
     async def download_post(
-        self, url: str, session: aiohttp.ClientSession | None = None
+        self,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+        conditional: bool = False,
     ) -> str:
         """
         Public method to download content from a URL via a POST request.
@@ -174,11 +335,134 @@ class BaseDownloader(ABC):
         Args:
             url (str): The target URL.
             session (aiohttp.ClientSession | None, optional): An active session. Defaults to None.
+            conditional (bool, optional): Whether to revalidate a cached copy instead of
+                downloading it again. See `data_changed`. Defaults to False.
 
         Returns:
             str: The downloaded content as a string.
         """
-        return await self._fetch_response(url, "POST", session)
+        return await self._fetch_response(url, "POST", session, conditional)
+
+    @asynccontextmanager
+    async def open_stream(
+        self,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+        conditional: bool = False,
+        chunk_size: int = CONSTANTS.COMMON.STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Async context manager streaming the body of a GET request in chunks, without holding it in memory.
+        With `conditional`, the chunks are also written to the validator cache as they arrive, and a
+        304 Not Modified streams the cached body instead. `data_changed` is up to date on entry, so
+        callers can skip consuming the stream when nothing changed.
+
+        Args:
+            url (str): The target URL.
+            session (aiohttp.ClientSession | None, optional): An active session. Defaults to None.
+            conditional (bool, optional): Whether to revalidate a cached copy. Defaults to False.
+            chunk_size (int, optional): The maximum chunk size in bytes.
+                Defaults to CONSTANTS.COMMON.STREAM_CHUNK_SIZE -> 64 KiB.
+
+        Raises:
+            HTTPError: If the request fails due to an aiohttp.ClientError.
+
+        Yields:
+            AsyncIterator[bytes]: The body chunks.
+
+        Example:
+            async with downloader.open_stream(url, conditional=True) as chunks:
+                async for chunk in chunks:
+                    parser.feed(chunk)
+        """
+        method = "GET"
+        cache = self.validator_cache
+        try:
+            if session is None:
+                session = self.get_session()
+            headers = (
+                await asyncio.to_thread(cache.request_headers, method, url)
+                if conditional
+                else {}
+            )
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                if response.status != 304:
+                    self.changed[url] = True
+                    chunks = response.content.iter_chunked(chunk_size)
+                    if conditional:
+                        chunks = self._tee_to_cache(chunks, method, url, response.headers)
+                    yield chunks
+                    return
+
+                body_path = await asyncio.to_thread(cache.body_file, method, url)
+                if body_path is not None:
+                    self.changed[url] = False
+                    yield self._iter_file(body_path, chunk_size)
+                    return
+
+            # 304 without a usable cached body, fall back to a full download
+            async with session.get(url) as response:
+                response.raise_for_status()
+                self.changed[url] = True
+                yield response.content.iter_chunked(chunk_size)
+        except aiohttp.ClientError as e:
+            raise HTTPError(self._format_error_message(method, url, e)) from e
+
+    async def _tee_to_cache(
+        self,
+        chunks: AsyncIterator[bytes],
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> AsyncIterator[bytes]:
+        """
+        Passes chunks through while writing them to the validator cache.
+        The cache entry is only replaced once the whole body was received.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The response body chunks.
+            method (str): The HTTP method.
+            url (str): The request URL.
+            headers (Mapping[str, str]): The response headers.
+
+        Yields:
+            bytes: The same chunks.
+        """
+        cache = self.validator_cache
+        partial_path = await asyncio.to_thread(cache.partial_file, method, url)
+        file = await asyncio.to_thread(partial_path.open, "wb")
+        complete = False
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(file.write, chunk)
+                yield chunk
+            complete = True
+        finally:
+            await asyncio.to_thread(file.close)
+            if complete:
+                await asyncio.to_thread(cache.store_partial, method, url, headers)
+            else:
+                await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+
+    @staticmethod
+    async def _iter_file(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Reads a file in chunks off the event loop.
+
+        Args:
+            path (Path): The file to read.
+            chunk_size (int): The maximum chunk size in bytes.
+
+        Yields:
+            bytes: The file chunks.
+        """
+        file = await asyncio.to_thread(path.open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(file.close)
 
     @abstractmethod
     async def get_data(self) -> Any:
@@ -86,36 +86,31 @@ class FranceDownloader(BaseDownloader):
             tuple[str | None, str | None]: A tuple containing the raw ASFA string
                 and raw Government string respectively. Values will be None if not fetched.
         """
-        headers, timeout, connector = self._get_http_settings()
-        asfa_camera_data: str | None = None
-        gov_camera_data: str | None = None
-
-        async with aiohttp.ClientSession(
-            headers=headers, connector=connector, timeout=timeout
-        ) as session:
-            fetch_asfa: bool = asfa_only or (not gov_only)
-            fetch_gov: bool = gov_only or (not asfa_only)
-
-            asfa_task = (
-                self.download_asfa(session)
-                if fetch_asfa
-                else asyncio.sleep(0, result=None)
-            )
-            gov_task = (
-                self.download_gov(session)
-                if fetch_gov
-                else asyncio.sleep(0, result=None)
-            )
-
-            asfa_camera_data, gov_camera_data = await asyncio.gather(
-                asfa_task, gov_task
-            )
+        session = self.get_session()
+        fetch_asfa: bool = asfa_only or (not gov_only)
+        fetch_gov: bool = gov_only or (not asfa_only)
+
+        asfa_task = (
+            self.download_asfa(session) if fetch_asfa else asyncio.sleep(0, result=None)
+        )
+        gov_task = (
+            self.download_gov(session) if fetch_gov else asyncio.sleep(0, result=None)
+        )
+
+        asfa_camera_data: str | None
+        gov_camera_data: str | None
+        asfa_camera_data, gov_camera_data = await asyncio.gather(asfa_task, gov_task)
 
         return asfa_camera_data, gov_camera_data
 
 
 if __name__ == "__main__":
+
+    async def _main(asfa_only: bool, gov_only: bool) -> tuple[str | None, str | None]:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await FranceDownloader().get_data(asfa_only, gov_only)
+
     asfa_only = False
     gov_only = False
-    downloader = FranceDownloader()
-    winloop.run(downloader.get_data(asfa_only, gov_only))
+    winloop.run(_main(asfa_only, gov_only))
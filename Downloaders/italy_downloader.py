@@ -18,7 +18,7 @@ class ItalyDownloader(BaseDownloader):
         """
         url: str = CONSTANTS.ITALY.BASE_URL
         try:
-            return await self.download(url=url)
+            return await self.download(url=url, conditional=True)
         except Exception as e:
             print(f"Error downloading Autostrade data: {e}")
             return None
@@ -117,6 +117,11 @@ class ItalyDownloader(BaseDownloader):
 
 
 if __name__ == "__main__":
-    downloader = ItalyDownloader()
-    data = winloop.run(downloader.get_data())
+
+    async def _main() -> dict[str, str | None]:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await ItalyDownloader().get_data()
+
+    data = winloop.run(_main())
     print(f"Downloaded data keys: {list(data.keys())}")
@@ -46,11 +46,16 @@ class SpainDownloader(BaseDownloader):
             str: The decoded JSON data as a string.
         """
         download_link: str = DATA_URL
-        raw_data: str = await self.download_post(download_link)
+        raw_data: str = await self.download_post(download_link, conditional=True)
         decoded_data: str = self.decode_data(raw_data)
         return decoded_data
 
 
 if __name__ == "__main__":
-    downloader = SpainDownloader()
-    winloop.run(downloader.get_data())
+
+    async def _main() -> str:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await SpainDownloader().get_data()
+
+    winloop.run(_main())
@@ -21,9 +21,14 @@ class UKDownloader(BaseDownloader):
             str: The raw JSON string from the Traffic England API.
         """
         download_link: str = CAMERA_API
-        return await self.download(download_link)
+        return await self.download(download_link, conditional=True)
 
 
 if __name__ == "__main__":
-    downloader = UKDownloader()
-    winloop.run(downloader.get_data())
+
+    async def _main() -> str:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await UKDownloader().get_data()
+
+    winloop.run(_main())
@@ -0,0 +1,169 @@
+import hashlib
+from collections.abc import Mapping
+from pathlib import Path
+
+from config import CONSTANTS
+from tools.utils import atomic_write, load_json, save_json
+
+HTTP_CACHE_DIR: Path = CONSTANTS.COMMON.HTTP_CACHE_DIR
+
+
+class ValidatorCache:
+    """
+    On-disk cache of HTTP validators (ETag / Last-Modified) and response bodies.
+
+    Used for conditional requests: the stored validators are sent as
+    If-None-Match / If-Modified-Since, and the stored body is served back
+    when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR) -> None:
+        """
+        Initializes the ValidatorCache.
+
+        Args:
+            cache_dir (Path, optional): The directory holding cached entries.
+                Defaults to CONSTANTS.COMMON.HTTP_CACHE_DIR -> './data/cache/http'.
+        """
+        self.cache_dir = cache_dir
+
+    def _paths(self, method: str, url: str) -> tuple[Path, Path]:
+        """
+        Builds the metadata and body file paths for a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            tuple[Path, Path]: The metadata JSON path and the body path.
+        """
+        key = hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def request_headers(self, method: str, url: str) -> dict[str, str]:
+        """
+        Returns the conditional request headers for a cached entry.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            dict[str, str]: If-None-Match / If-Modified-Since headers, empty if nothing is cached.
+        """
+        meta_path, body_path = self._paths(method, url)
+        if not (meta_path.exists() and body_path.exists()):
+            return {}
+        try:
+            meta = load_json(meta_path)
+        except (OSError, ValueError):
+            return {}
+
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load_body(self, method: str, url: str) -> str | None:
+        """
+        Loads the cached response body.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            str | None: The cached body, or None if it is missing.
+        """
+        _, body_path = self._paths(method, url)
+        try:
+            return body_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def body_file(self, method: str, url: str) -> Path | None:
+        """
+        Returns the path of the cached response body, to read it in chunks.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            Path | None: The body path, or None if nothing is cached.
+        """
+        meta_path, body_path = self._paths(method, url)
+        if meta_path.exists() and body_path.exists():
+            return body_path
+        return None
+
+    def partial_file(self, method: str, url: str) -> Path:
+        """
+        Returns the path a streamed body is written to before it is complete.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            Path: The partial body path, its directory is created if needed.
+        """
+        _, body_path = self._paths(method, url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        return body_path.with_suffix(".part")
+
+    def store_partial(
+        self, method: str, url: str, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Stores a completely streamed body (see `partial_file`) with its validators.
+        Responses without an ETag or Last-Modified header drop the body and any existing entry instead.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            headers (Mapping[str, str]): The response headers.
+        """
+        meta_path, body_path = self._paths(method, url)
+        partial_path = body_path.with_suffix(".part")
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified):
+            partial_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            return
+
+        partial_path.replace(body_path)
+        save_json(
+            {"url": url, "etag": etag, "last_modified": last_modified}, meta_path
+        )
+
+    def store(
+        self, method: str, url: str, body: str, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Stores a response body with its validators.
+        Responses without an ETag or Last-Modified header drop any existing entry instead.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            body (str): The response body.
+            headers (Mapping[str, str]): The response headers.
+        """
+        meta_path, body_path = self._paths(method, url)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified):
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            return
+
+        atomic_write(body_path, body)
+        save_json(
+            {"url": url, "etag": etag, "last_modified": last_modified}, meta_path
+        )
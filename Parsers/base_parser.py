@@ -1,9 +1,11 @@
-import copy
+import asyncio
 import inspect
+import math
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from tools.spatial_index import LineGrid, SphereGrid
 from tools.utils import haversine_km, save_json
 
 
@@ -25,6 +27,8 @@ class BaseParser(ABC):
                 fetching raw camera data. Defaults to None.
         """
         self.downloader = downloader
+        # Result of the previous parse, reused when the downloaded data did not change
+        self._last_parsed: Any = None
 
     @property
     @abstractmethod
@@ -116,6 +120,8 @@ class BaseParser(ABC):
         """
         Merges one or more datasets of highway cameras, removing duplicates per highway.
         Datasets should be ordered by priority (highest priority first).
+        Camera dictionaries (and their coords) are shared with the input, so callers must not modify
+        them in place. Renamed cameras are copied, coords included.
 
         Args:
             *datasets (list[dict[str, Any]]): Variable number of datasets to merge.
@@ -162,9 +168,33 @@ class BaseParser(ABC):
                 return True
             return _spatial_match(cam, existing) if match_by == "coordinates" else False
 
+        def _new_index() -> SphereGrid | LineGrid:
+            """Creates a spatial index with cells sized to the matching threshold."""
+            if match_by == "coordinates":
+                return SphereGrid(threshold)
+            return LineGrid(threshold)
+
+        def _index_position(cam: dict[str, Any]) -> tuple[float, ...] | None:
+            """Returns the indexed position of a camera, (lat, lon) or (km,), or None if it can't match."""
+            if match_by == "coordinates":
+                p = _coords(cam)
+                position = (p[1], p[0]) if p is not None else None
+            else:
+                km = cam.get("camera_km_point")
+                position = (km,) if km is not None else None
+            # NaN positions never match anything
+            if position is None or not all(map(math.isfinite, position)):
+                return None
+            return position
+
         # name -> list of cameras
         merged: dict[str, list[dict[str, Any]]] = {}
         countries: dict[str, str] = {}
+        # name -> indexes of the cameras already kept on that highway, maintained
+        # incrementally so highways split across many entries are not re-scanned
+        spatial_indexes: dict[str, SphereGrid | LineGrid] = {}
+        urls_by_highway: dict[str, set[str]] = {}
+        ids_by_highway: dict[str, dict[str, dict[str, Any]]] = {}
 
         for dataset in datasets:
             if not dataset:
@@ -177,19 +207,13 @@ class BaseParser(ABC):
 
                 countries.setdefault(name, highway.get("country", self.country))
                 target = merged.setdefault(name, [])
-                seen_urls = (
-                    {c.get("url") for c in target if c.get("url")}
-                    if check_url
-                    else set()
-                )
-                cameras_by_id = (
-                    {c["camera_id"]: c for c in target if c.get("camera_id")}
-                    if check_id
-                    else {}
-                )
-
-                for cam_in in highway.get("cameras", []):
-                    cam = copy.deepcopy(cam_in)
+                spatial_index = spatial_indexes.get(name)
+                if spatial_index is None:
+                    spatial_index = spatial_indexes[name] = _new_index()
+                seen_urls = urls_by_highway.setdefault(name, set())
+                cameras_by_id = ids_by_highway.setdefault(name, {})
+
+                for cam in highway.get("cameras", []):
                     url = cam.get("url")
                     cam_id = cam.get("camera_id")
 
@@ -203,23 +227,35 @@ class BaseParser(ABC):
                         if existing:
                             if _is_duplicate(cam, existing):
                                 continue
-                            # Rename to avoid ID collision
+                            # Rename to avoid ID collision, on a copy so the input is left untouched
                             i = 1
                             new_id = f"{cam_id}_dup{i}"
                             while new_id in cameras_by_id:
                                 i += 1
                                 new_id = f"{cam_id}_dup{i}"
-                            cam["camera_id"] = new_id
+                            cam = {**cam, "camera_id": new_id}
+                            if isinstance(cam.get("coords"), dict):
+                                cam["coords"] = dict(cam["coords"])
                             cam_id = new_id
 
-                    # Spatial dedup (only when not using ID-based checks)
-                    if not check_id and any(_spatial_match(cam, c) for c in target):
+                    # Spatial dedup (only when not using ID-based checks),
+                    # comparing against the cameras in neighbouring grid cells only
+                    position = None if check_id else _index_position(cam)
+                    if (
+                        position is not None
+                        and any(
+                            _spatial_match(cam, c)
+                            for c in spatial_index.candidates(*position)
+                        )
+                    ):
                         continue
 
                     target.append(cam)
+                    if position is not None:
+                        spatial_index.add(*position, cam)
                     if check_url and url:
                         seen_urls.add(url)
-                    if cam_id:
+                    if check_id and cam_id:
                         cameras_by_id[cam_id] = cam
 
         return [
@@ -254,16 +290,59 @@ class BaseParser(ABC):
         if self.downloader:
             raw_data = await self.downloader.get_data()
 
+        if self._can_reuse_parsed():
+            print(f"{self.country} data not modified, skipping parsing.")
+            parsed_data = self._copy_highway_list(self._last_parsed)
         # Handle async/sync parse method
-        if inspect.iscoroutinefunction(self.parse):
+        elif inspect.iscoroutinefunction(self.parse):
             parsed_data = await self.parse(raw_data)
         else:
             parsed_data = self.parse(raw_data)
+        self._last_parsed = self._copy_highway_list(parsed_data)
 
+        # Saving fsyncs the file, keep it off the event loop
         if output_file:
-            save_json(parsed_data, output_file)
+            await asyncio.to_thread(save_json, parsed_data, output_file)
         elif output_folder:
             file_name = f"cameras_{self.country.lower()}{'_gov' if self.country in ['ES', 'UK'] else ''}.json"  # France(FR) and Italy(IT) handle saving independently
-            save_json(parsed_data, Path(output_folder) / file_name)
+            await asyncio.to_thread(save_json, parsed_data, Path(output_folder) / file_name)
 
         return parsed_data
+
+    @staticmethod
+    def _copy_highway_list(data: Any) -> Any:
+        """
+        Copies the highway list structure while sharing the camera dictionaries.
+        Consumers such as camera_check remove cameras and highways in place, which must not
+        leak into the result kept for reuse.
+
+        Args:
+            data (Any): The parsed highway list.
+
+        Returns:
+            Any: A structural copy of the list, or the data unchanged if it is not a list.
+        """
+        if not isinstance(data, list):
+            return data
+        return [
+            {
+                **entry,
+                "highway": {
+                    **entry["highway"],
+                    "cameras": list(entry["highway"]["cameras"]),
+                },
+            }
+            for entry in data
+        ]
+
+    def _can_reuse_parsed(self) -> bool:
+        """
+        Checks whether the previous parse result is still valid, i.e. the downloader
+        reports that none of its sources changed (all answered 304 Not Modified).
+
+        Returns:
+            bool: True if parsing can be skipped.
+        """
+        return self._last_parsed is not None and not getattr(
+            self.downloader, "data_changed", True
+        )
@@ -1,4 +1,5 @@
 import ast
+import asyncio
 import json
 import re
 import winloop
@@ -6,7 +7,8 @@ from collections import defaultdict
 from typing import Any
 from pathlib import Path
 
-from tools.utils import convert_to_wgs84, save_json
+from tools.utils import convert_to_wgs84, parse_json, save_json
+from Downloaders.base_downloader import BaseDownloader
 from Downloaders.france_downloader import FranceDownloader
 from config import CONSTANTS
 from Parsers.base_parser import BaseParser
@@ -97,7 +99,7 @@ class FranceParser(BaseParser):
             return km_pt
 
         try:
-            raw_data = json.loads(gov_baguettes)
+            raw_data = parse_json(gov_baguettes)
         except (json.JSONDecodeError, Exception) as e:
             print(f"Error decoding Gov JSON: {e}")
             return []
@@ -241,14 +243,15 @@ async def get_parsed_data(
 
     gov_cameras, asfa_cameras, merged_data = await parser.parse(raw_data)
 
+    # Saving fsyncs the files, keep it off the event loop
     if output_file_merged:
-        save_json(merged_data, output_file_merged)
+        await asyncio.to_thread(save_json, merged_data, output_file_merged)
 
     # Allow saving camera sources separately
     if output_file_gov and gov_cameras:
-        save_json(gov_cameras, output_file_gov)
+        await asyncio.to_thread(save_json, gov_cameras, output_file_gov)
     if output_file_asfa and asfa_cameras:
-        save_json(asfa_cameras, output_file_asfa)
+        await asyncio.to_thread(save_json, asfa_cameras, output_file_asfa)
 
     if output_folder:
         # If output folder is specified, save all files
@@ -256,18 +259,22 @@ async def get_parsed_data(
         output_file_gov_name = "cameras_fr_gov.json"
         output_file_asfa_name = "cameras_fr_asfa.json"
         output_file_merged_name = "cameras_fr_merged.json"
-        save_json(asfa_raw, folder_path / output_file_asfa_name)
-        save_json(gov_raw, folder_path / output_file_gov_name)
-        save_json(merged_data, folder_path / output_file_merged_name)
+        await asyncio.to_thread(save_json, asfa_raw, folder_path / output_file_asfa_name)
+        await asyncio.to_thread(save_json, gov_raw, folder_path / output_file_gov_name)
+        await asyncio.to_thread(save_json, merged_data, folder_path / output_file_merged_name)
 
     return merged_data
 
 
 if __name__ == "__main__":
-    winloop.run(
-        get_parsed_data(
-            output_file_gov="data/cameras_fr_gov.json",
-            output_file_asfa="data/cameras_fr_asfa.json",
-            output_file_merged="data/cameras_fr.json",
-        )
-    )
+
+    async def _main() -> list[dict[str, Any]]:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await get_parsed_data(
+                output_file_gov="data/cameras_fr_gov.json",
+                output_file_asfa="data/cameras_fr_asfa.json",
+                output_file_merged="data/cameras_fr.json",
+            )
+
+    winloop.run(_main())
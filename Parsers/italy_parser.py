@@ -6,6 +6,7 @@ from typing import Any
 
 from tools.utils import load_json
 from config import CONSTANTS
+from Downloaders.base_downloader import BaseDownloader
 from Downloaders.italy_downloader import ItalyDownloader
 from Parsers.base_parser import BaseParser
 
@@ -369,5 +370,11 @@ async def get_parsed_data(
 
 
 if __name__ == "__main__":
+
+    async def _main(output_file: Path) -> Any:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await get_parsed_data(output_file)
+
     output = Path(__file__).parent.parent / "data" / "cameras_it.json"
-    winloop.run(get_parsed_data(output))
+    winloop.run(_main(output))
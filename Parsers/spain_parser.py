@@ -4,8 +4,10 @@ from pathlib import Path
 from typing import Any
 import asyncio
 
+from Downloaders.base_downloader import BaseDownloader
 from Downloaders.spain_downloader import SpainDownloader
 from Parsers.base_parser import BaseParser
+from tools.utils import parse_json
 
 
 class SpainParser(BaseParser):
@@ -35,7 +37,7 @@ class SpainParser(BaseParser):
                 or None if parsing fails.
         """
         try:
-            parsed_data = json.loads(raw_data)
+            parsed_data = parse_json(raw_data)
         except json.JSONDecodeError:
             print("Error: Failed to decode the input JSON file.")
             return None
@@ -89,4 +91,10 @@ async def get_parsed_data(
 
 
 if __name__ == "__main__":
-    asyncio.run(get_parsed_data(output_folder=Path("../data")))
+
+    async def _main() -> Any:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await get_parsed_data(output_folder=Path("../data"))
+
+    asyncio.run(_main())
@@ -3,6 +3,7 @@ from collections import defaultdict
 from typing import Any
 from pathlib import Path
 
+from Downloaders.base_downloader import BaseDownloader
 from Downloaders.uk_downloader import UKDownloader
 from tools.utils import load_json
 from Parsers.base_parser import BaseParser
@@ -76,4 +77,10 @@ async def get_parsed_data(
 
 
 if __name__ == "__main__":
-    winloop.run(get_parsed_data())
+
+    async def _main() -> Any:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await get_parsed_data()
+
+    winloop.run(_main())
@@ -0,0 +1,184 @@
+"""
+Synthetic DGT DATEX II v3 SituationPublication feeds for benchmarks.
+
+The documents follow the structure DatexParser reads (situations, records,
+linear and point TPEG locations with the Spanish extension), so a generated
+feed exercises the same code paths as the live national feed.
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+NAMESPACES: dict[str, str] = {
+    "d2": "http://levelC/schema/3/d2Payload",
+    "sit": "http://levelC/schema/3/situation",
+    "com": "http://levelC/schema/3/common",
+    "loc": "http://levelC/schema/3/locationReferencing",
+    "lse": "http://levelC/schema/3/locationReferencingSpanishExtension",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+}
+
+_ROADS = ["AP-7", "A-7", "A-4", "A-2", "A-66", "N-340", "AP-68", "A-49", "M-30", "A-8"]
+_PLACES = [
+    ("Andalucía", "Sevilla", "Écija"),
+    ("Cataluña", "Barcelona", "Martorell"),
+    ("Comunidad de Madrid", "Madrid", "Alcobendas"),
+    ("Extremadura", "Badajoz", "Mérida"),
+    ("Castilla y León", "León", "Astorga"),
+    ("País Vasco", "Gipuzkoa", "Irún"),
+]
+_CAUSES = [("roadMaintenance", "roadworks"), ("accident", None), ("obstruction", None)]
+_VEHICLES = [None, "lorry", "anyVehicle", "bicycle"]
+
+
+def _point(rng: random.Random, tag: str) -> str:
+    community, province, municipality = rng.choice(_PLACES)
+    ext = "loc:_tpegNonJunctionPointExtension/loc:extendedTpegNonJunctionPoint"
+    ext_open = "".join(f"<{p}>" for p in ext.split("/"))
+    ext_close = "".join(f"</{p}>" for p in reversed(ext.split("/")))
+    return (
+        f"<loc:{tag}>"
+        "<loc:pointCoordinates>"
+        f"<loc:latitude>{rng.uniform(36.0, 43.5):.6f}</loc:latitude>"
+        f"<loc:longitude>{rng.uniform(-9.0, 3.0):.6f}</loc:longitude>"
+        "</loc:pointCoordinates>"
+        f"{ext_open}"
+        f"<lse:kilometerPoint>{rng.uniform(0, 900):.3f}</lse:kilometerPoint>"
+        f"<lse:autonomousCommunity>{escape(community)}</lse:autonomousCommunity>"
+        f"<lse:province>{escape(province)}</lse:province>"
+        f"<lse:municipality>{escape(municipality)}</lse:municipality>"
+        f"{ext_close}"
+        f"</loc:{tag}>"
+    )
+
+
+def _record(rng: random.Random, record_id: str, now: datetime) -> str:
+    created = now - timedelta(minutes=rng.randint(5, 60 * 24 * 30))
+    version = created + timedelta(minutes=rng.randint(0, 600))
+    cause, detail = rng.choice(_CAUSES)
+    vehicle = rng.choice(_VEHICLES)
+    road = rng.choice(_ROADS)
+    parts = [
+        f'<sit:situationRecord id="{record_id}" version="1">',
+        f"<sit:situationRecordCreationTime>{created.isoformat()}</sit:situationRecordCreationTime>",
+        f"<sit:situationRecordVersionTime>{version.isoformat()}</sit:situationRecordVersionTime>",
+    ]
+    if rng.random() < 0.5:
+        parts.append(f"<sit:severity>{rng.choice(['low', 'medium', 'high'])}</sit:severity>")
+    parts.append(
+        "<sit:validity><com:validityTimeSpecification>"
+        f"<com:overallStartTime>{created.isoformat()}</com:overallStartTime>"
+        + (
+            f"<com:overallEndTime>{(created + timedelta(days=rng.randint(1, 60))).isoformat()}</com:overallEndTime>"
+            if rng.random() < 0.6
+            else ""
+        )
+        + "</com:validityTimeSpecification></sit:validity>"
+    )
+    parts.append(
+        "<sit:cause>"
+        f"<sit:causeType>{cause}</sit:causeType>"
+        + (
+            f"<sit:detailedCauseType><sit:roadMaintenanceType>{detail}</sit:roadMaintenanceType></sit:detailedCauseType>"
+            if detail
+            else ""
+        )
+        + "</sit:cause>"
+    )
+    if vehicle:
+        parts.append(
+            "<sit:forVehiclesWithCharacteristicsOf>"
+            f"<com:vehicleType>{vehicle}</com:vehicleType>"
+            "</sit:forVehiclesWithCharacteristicsOf>"
+        )
+    parts.append(
+        "<sit:roadOrCarriagewayOrLaneManagementType>laneClosures</sit:roadOrCarriagewayOrLaneManagementType>"
+    )
+
+    supplementary = (
+        "<loc:supplementaryPositionalDescription>"
+        "<loc:roadInformation>"
+        f"<loc:roadName>{road}</loc:roadName>"
+        f"<loc:roadDestination>{escape(rng.choice(_PLACES)[2])}</loc:roadDestination>"
+        "</loc:roadInformation>"
+        "<loc:carriageway><loc:carriageway>mainCarriageway</loc:carriageway>"
+        "<loc:lane><loc:laneUsage>rightLane</loc:laneUsage></loc:lane></loc:carriageway>"
+        "</loc:supplementaryPositionalDescription>"
+    )
+    direction = rng.choice(["positive", "negative", "both"])
+    if rng.random() < 0.6:
+        parts.append(
+            '<sit:locationReference xsi:type="loc:SingleRoadLinearLocation">'
+            f"{supplementary}"
+            "<loc:tpegLinearLocation>"
+            f"{_point(rng, 'to')}{_point(rng, 'from')}"
+            "<loc:_tpegLinearLocationExtension><loc:extendedTpegLinearLocation>"
+            f"<lse:tpegDirectionRoad>{direction}</lse:tpegDirectionRoad>"
+            "</loc:extendedTpegLinearLocation></loc:_tpegLinearLocationExtension>"
+            "</loc:tpegLinearLocation>"
+            "</sit:locationReference>"
+        )
+    else:
+        parts.append(
+            '<sit:locationReference xsi:type="loc:PointLocation">'
+            f"{supplementary}"
+            "<loc:tpegPointLocation>"
+            f"{_point(rng, 'point')}"
+            "<loc:_tpegSimplePointExtension><loc:extendedTpegSimplePoint>"
+            f"<lse:tpegDirectionRoad>{direction}</lse:tpegDirectionRoad>"
+            "</loc:extendedTpegSimplePoint></loc:_tpegSimplePointExtension>"
+            "</loc:tpegPointLocation>"
+            "</sit:locationReference>"
+        )
+    parts.append("</sit:situationRecord>")
+    return "".join(parts)
+
+
+def make_feed(situations: int, seed: int = 0) -> str:
+    """
+    Builds a synthetic SituationPublication document.
+
+    Args:
+        situations (int): The number of situations, each with one to three records.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The XML document.
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
+    ns = " ".join(f'xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items())
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<d2:payload {ns} xsi:type="sit:SituationPublication" lang="es" modelBaseVersion="3">',
+        f"<com:publicationTime>{now.isoformat()}</com:publicationTime>",
+    ]
+    for i in range(situations):
+        parts.append(f'<sit:situation id="SIT{i}" version="1">')
+        parts.append(
+            f"<sit:overallSeverity>{rng.choice(['low', 'medium', 'high'])}</sit:overallSeverity>"
+        )
+        parts.extend(
+            _record(rng, f"SIT{i}_R{j}", now) for j in range(rng.randint(1, 3))
+        )
+        parts.append("</sit:situation>")
+    parts.append("</d2:payload>")
+    return "".join(parts)
+
+
+def load_feed(path: Path | None, situations: int) -> str:
+    """
+    Loads a recorded feed, or generates a synthetic one.
+
+    Args:
+        path (Path | None): A recorded DATEX II XML file, or None to generate one.
+        situations (int): The number of situations of a generated feed.
+
+    Returns:
+        str: The XML document.
+    """
+    if path is not None:
+        return path.read_text(encoding="utf-8")
+    return make_feed(situations)
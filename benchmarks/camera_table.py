@@ -0,0 +1,157 @@
+"""
+Benchmark for tools.camera_table.CameraTable against the dict representation.
+
+Checks that export(import(data)) reproduces the JSON exactly, including
+cameras that do not follow the BaseParser.format_camera layout, then compares
+memory use and a few typical walks over the data (per-highway counts,
+camera ID/type listing as the slideshow builder does, per-highway coordinate
+centroids).
+
+Usage:
+    python -m benchmarks.camera_table --cameras 50000 --highways 200
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from benchmarks.merge_camera_data import make_datasets
+from tools.camera_table import CameraTable
+
+
+def _best(func: Callable[[], Any], repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _allocated(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def check_lossless(data: list[dict[str, Any]]) -> None:
+    """
+    Checks the JSON round trip on the dataset and on irregular cameras and entries.
+
+    Args:
+        data (list[dict[str, Any]]): A dataset in the highway list format.
+
+    Raises:
+        SystemExit: If an export differs from its input.
+    """
+    irregular = json.loads(json.dumps(data[:3]))
+    cams = irregular[0]["highway"]["cameras"]
+    cams[0]["coords"] = {"X": 2, "Y": None}
+    cams[1]["description"] = "Cámara – extra key"
+    cams[2] = {"camera_type": "img", "camera_id": 12, "coords": None}
+    del cams[3]["url"]
+    cams[4]["url"] = None
+    cams[5]["camera_km_point"] = None
+    irregular[1]["highway"] = {"cameras": irregular[1]["highway"]["cameras"], "name": "A-1"}
+    irregular[2]["source"] = "gov"
+    irregular.append({"highway": {"name": "empty", "country": "FR", "cameras": []}})
+
+    for dataset in (data, irregular):
+        expected = json.dumps(dataset)
+        if json.dumps(CameraTable(dataset).to_json()) != expected:
+            raise SystemExit("Round trip changed the data")
+        if json.dumps(dataset) != expected:
+            raise SystemExit("CameraTable modified its input")
+    print("Lossless round trip: OK")
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--cameras", type=int, default=50_000)
+    arg_parser.add_argument("--highways", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    primary, secondary = make_datasets(args.cameras, args.highways)
+    text = json.dumps(primary + secondary)
+    check_lossless(json.loads(text))
+
+    data, dict_bytes = _allocated(lambda: json.loads(text))
+    table, table_bytes = _allocated(lambda: CameraTable(data))
+    print(f"{len(table)} cameras in {table.highway_count} highway entries")
+    print(f"memory: dicts {dict_bytes / 1e6:7.1f} MB, table {table_bytes / 1e6:7.1f} MB "
+          f"(nbytes {table.nbytes / 1e6:.1f} MB)")
+    print(f"build table:  {_best(lambda: CameraTable(data), 3) * 1e3:8.1f} ms")
+    print(f"export JSON:  {_best(table.to_json, 3) * 1e3:8.1f} ms")
+
+    def dict_counts() -> list[tuple[str, int]]:
+        return [(h["highway"]["name"], len(h["highway"]["cameras"])) for h in data]
+
+    def dict_listing() -> list[tuple[str, str, str]]:
+        return [
+            (cam["camera_id"], cam["camera_type"], h["highway"]["name"])
+            for h in data
+            for cam in h["highway"]["cameras"]
+        ]
+
+    def table_listing() -> list[tuple[str, str, str]]:
+        types = np.array(table.types, dtype=object)[table.type_codes].tolist()
+        names = np.array(table.names, dtype=object)[table.highway_index].tolist()
+        return list(zip(table.ids.tolist(), types, names, strict=True))
+
+    def table_rows() -> list[tuple[str, str, str]]:
+        return [(row.camera_id, row.camera_type, row.highway) for row in table.rows()]
+
+    def dict_centroids() -> list[tuple[float, float]]:
+        result = []
+        for h in data:
+            points = [
+                (c["coords"]["X"], c["coords"]["Y"])
+                for c in h["highway"]["cameras"]
+                if c["coords"]["X"] is not None and c["coords"]["Y"] is not None
+            ]
+            result.append(
+                (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+                if points else (float("nan"), float("nan"))
+            )
+        return result
+
+    def table_centroids() -> list[tuple[float, float]]:
+        counts = np.diff(table.starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            xs = np.add.reduceat(table.x, table.starts[:-1]) / counts
+            ys = np.add.reduceat(table.y, table.starts[:-1]) / counts
+        return list(zip(xs.tolist(), ys.tolist(), strict=True))
+
+    if dict_counts() != table.camera_counts() or not (
+        dict_listing() == table_listing() == table_rows()
+    ):
+        raise SystemExit("Table walks differ from dict walks")
+    if not np.allclose(dict_centroids(), table_centroids(), equal_nan=True):
+        raise SystemExit("Centroids differ")
+
+    for name, dict_walk, table_walk in (
+        ("highway counts", dict_counts, table.camera_counts),
+        ("id/type listing", dict_listing, table_listing),
+        ("rows()", dict_listing, table_rows),
+        ("centroids", dict_centroids, table_centroids),
+    ):
+        dict_time, table_time = _best(dict_walk), _best(table_walk)
+        print(f"{name:<16} dicts {dict_time * 1e3:8.2f} ms, table {table_time * 1e3:8.2f} ms "
+              f"(x{dict_time / table_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark and parity check for the vectorized HeuristicFilter.
+
+Replays a historical set of alerts (synthetic, with every cause, severity and
+management type the rules distinguish, missing and future timestamps, and ages
+right on the TTL boundaries) through HeuristicFilter.filter, once with the
+scalar per-alert pipeline and once with the batch classifier. Checks that both
+return the same FilterResult and prints the timings, then replays the alerts at
+a day of 5-minute polls with columns built once.
+
+Usage:
+    python -m benchmarks.datex_filter --alerts 100000
+"""
+
+import argparse
+import logging
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+from DatexParser.datex_filter import FilterConfig, FilterResult, HeuristicFilter
+from DatexParser.datex_models import TruckDashboardAlert
+
+_CAUSES = [
+    None, "accident", "Accident", "vehicleObstruction", "obstruction",
+    "roadMaintenance", "infrastructureDamageObstruction", "poorWeatherConditions",
+]
+_SEVERITIES = [None, "", "low", "Low", "medium", "high", "highest", "HIGHEST"]
+_MANAGEMENTS = [
+    None, "roadClosed", "roadclosed", "laneClosures", "narrowLanes",
+    "narrowlanes", "singleAlternateLineTraffic",
+]
+
+
+def make_alerts(count: int, now: datetime, config: FilterConfig, seed: int = 0) -> list[TruckDashboardAlert]:
+    """
+    Builds a synthetic historical alert set.
+
+    Args:
+        count (int): The number of alerts.
+        now (datetime): The replay time.
+        config (FilterConfig): The filter thresholds, to place ages on TTL boundaries.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list[TruckDashboardAlert]: The alerts.
+    """
+    rng = random.Random(seed)
+    ttls = [
+        config.transient_ttl_days,
+        config.roadworks_ttl_days,
+        config.infrastructure_ttl_days,
+        config.low_severity_ttl_days,
+    ]
+    alerts = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            age = None
+        elif roll < 0.15:
+            # Exactly on a suspicious or zombie boundary
+            ttl = rng.choice(ttls)
+            age = timedelta(days=ttl * rng.choice([config.suspicious_threshold, 1.0]))
+        else:
+            age = timedelta(seconds=rng.uniform(-5, 1500) * 86400)
+        reference = now - age if age is not None else None
+        use_version = rng.random() < 0.7
+        alerts.append(
+            TruckDashboardAlert(
+                situation_id=f"SIT{i}",
+                record_id=f"SIT{i}_R0",
+                cause_type=rng.choice(_CAUSES),
+                severity=rng.choice(_SEVERITIES),
+                management_type=rng.choice(_MANAGEMENTS),
+                version_time=reference if use_version else None,
+                start_time=(reference if not use_version else now + timedelta(days=rng.uniform(-30, 30)))
+                if rng.random() < 0.9
+                else None,
+            )
+        )
+    return alerts
+
+
+def _summary(result: FilterResult) -> tuple:
+    return (
+        [id(a) for a in result.active],
+        [id(a) for a in result.suspicious],
+        result.dropped_count,
+    )
+
+
+def main() -> None:
+    """
+    Runs the parity check and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--alerts", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--replay-polls", type=int, default=288)
+    args = arg_parser.parse_args()
+    logging.disable(logging.INFO)
+
+    now = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
+    heuristic = HeuristicFilter(FilterConfig(suspicious_threshold=0.75))
+    alerts = make_alerts(args.alerts, now, heuristic.config)
+
+    timings = {}
+    results = {}
+    for label, vectorized in (("scalar", False), ("batch", True)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[label] = heuristic.filter(alerts, vectorized=vectorized, now=now)
+            best = min(best, time.perf_counter() - start)
+        timings[label] = best
+
+    if _summary(results["scalar"]) != _summary(results["batch"]):
+        raise SystemExit("Mismatch between scalar and batch classification")
+
+    result = results["batch"]
+    print(
+        f"{len(alerts)} alerts: {len(result.active)} active, "
+        f"{len(result.suspicious)} suspicious, {result.dropped_count} zombie"
+    )
+    for label, elapsed in timings.items():
+        print(f"{label:>7}: {elapsed * 1e3:8.1f} ms")
+
+    # Historical replay: columns built once, classified at every poll time
+    start = time.perf_counter()
+    columns = heuristic.columns(alerts)
+    columns_time = time.perf_counter() - start
+    poll_times = [now - timedelta(minutes=5 * i) for i in range(args.replay_polls)]
+    start = time.perf_counter()
+    for poll_time in poll_times:
+        heuristic.classify_batch(columns, poll_time)
+    replay_time = time.perf_counter() - start
+    for poll_time in poll_times[:: max(1, len(poll_times) // 5)]:
+        expected = heuristic.filter(alerts, vectorized=False, now=poll_time)
+        if _summary(heuristic.filter(alerts, now=poll_time, columns=columns)) != _summary(expected):
+            raise SystemExit(f"Mismatch in replay at {poll_time}")
+    print(
+        f" replay: columns {columns_time * 1e3:.1f} ms, then "
+        f"{replay_time / len(poll_times) * 1e3:.2f} ms per poll ({len(poll_times)} polls)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark for DatexParser.filter_by_location.
+
+Runs many radius queries (one per simulated camera) against the alerts of a
+feed, once with a full scan computing the distance to every alert endpoint
+(the previous implementation) and once through the parser's LocationIndex,
+checks that both return the same alerts in the same order, and prints the
+timings.
+
+Usage:
+    python -m benchmarks.datex_location --situations 20000 --queries 5000
+    python -m benchmarks.datex_location --feed recorded_datex2_v36.xml --radius 25
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from pathlib import Path
+
+from benchmarks._datex_fixtures import load_feed
+from DatexParser.datex_models import LocationPoint, TruckDashboardAlert
+from DatexParser.datex_parser import DatexParser
+from tools.utils import haversine_km
+
+
+def legacy_filter_by_location(
+    alerts: list[TruckDashboardAlert], lat: float, lon: float, radius_km: float
+) -> list[TruckDashboardAlert]:
+    """
+    Full-scan filter_by_location, as implemented before the index.
+
+    Args:
+        alerts (list[TruckDashboardAlert]): The parsed alerts.
+        lat (float): Latitude of the query center.
+        lon (float): Longitude of the query center.
+        radius_km (float): Maximum distance in kilometers.
+
+    Returns:
+        list[TruckDashboardAlert]: The alerts within the radius.
+    """
+
+    def _within(point: LocationPoint | None) -> bool:
+        if point is None or point.latitude is None or point.longitude is None:
+            return False
+        return haversine_km(lat, lon, point.latitude, point.longitude) <= radius_km
+
+    return [a for a in alerts if _within(a.location_from) or _within(a.location_to)]
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--feed", type=Path, default=None)
+    arg_parser.add_argument("--situations", type=int, default=20_000)
+    arg_parser.add_argument("--queries", type=int, default=2_000)
+    arg_parser.add_argument("--radius", type=float, default=10.0)
+    args = arg_parser.parse_args()
+
+    parser = DatexParser(truck_only=False)
+    alerts = asyncio.run(parser.parse(load_feed(args.feed, args.situations)))
+    rng = random.Random(0)
+    queries = [
+        (rng.uniform(36.0, 43.5), rng.uniform(-9.0, 3.0)) for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    expected = [legacy_filter_by_location(alerts, lat, lon, args.radius) for lat, lon in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [parser.filter_by_location(lat, lon, args.radius) for lat, lon in queries]
+    index_time = time.perf_counter() - start
+
+    if any(
+        [id(a) for a in got] != [id(a) for a in want]
+        for got, want in zip(results, expected, strict=True)
+    ):
+        raise SystemExit("Mismatch between full scan and index")
+
+    matches = sum(len(r) for r in results)
+    print(f"{len(alerts)} alerts, {len(queries)} queries of {args.radius} km, {matches} matches")
+    print(f" scan: {scan_time:7.3f}s ({scan_time / len(queries) * 1e3:.3f} ms/query)")
+    print(f"index: {index_time:7.3f}s ({index_time / len(queries) * 1e3:.3f} ms/query, incl. build)")
+    print(f"speedup: {scan_time / index_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark for streaming DATEX II parsing.
+
+Parses the same feed with DatexParser.parse (whole document) and
+DatexParser.parse_stream (chunks fed to an incremental parser), each in its
+own process, and prints wall time and peak memory. The feed is read from disk
+in both cases, as the downloader would hand it over.
+
+Usage:
+    python -m benchmarks.datex_streaming --situations 20000
+    python -m benchmarks.datex_streaming --feed recorded_datex2_v36.xml
+"""
+
+import argparse
+import asyncio
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from benchmarks._datex_fixtures import load_feed
+from DatexParser.datex_parser import DatexParser
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def _file_chunks(path: Path) -> AsyncIterator[bytes]:
+    file = await asyncio.to_thread(path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+            yield chunk
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+async def _run(mode: str, path: Path) -> None:
+    parser = DatexParser(truck_only=False)
+    start = time.perf_counter()
+    if mode == "stream":
+        alerts = await parser.parse_stream(_file_chunks(path))
+    else:
+        alerts = await parser.parse(await asyncio.to_thread(path.read_text, encoding="utf-8"))
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:>8}: {elapsed:7.3f}s, peak RSS {peak_mb:8.1f} MB, {len(alerts)} alerts")
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--feed", type=Path, default=None)
+    arg_parser.add_argument("--situations", type=int, default=20_000)
+    arg_parser.add_argument("--mode", choices=["full", "stream"], default=None)
+    args = arg_parser.parse_args()
+
+    if args.mode:
+        asyncio.run(_run(args.mode, args.feed))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_path = args.feed
+        if feed_path is None:
+            feed_path = Path(tmp) / "feed.xml"
+            feed_path.write_text(load_feed(None, args.situations), encoding="utf-8")
+        print(f"Feed: {feed_path.stat().st_size / 1e6:.1f} MB")
+        for mode in ("full", "stream"):
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.datex_streaming",
+                 "--mode", mode, "--feed", str(feed_path)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark for DATEX II record extraction with precompiled paths.
+
+Reads every field DatexParser extracts from each situation record, once with
+per-call ``find`` lookups on prefixed path strings (the previous approach,
+which re-parses each path against the namespace map on every call) and once
+with the compiled evaluators from ``_EXTRACTION_PATHS``, checks that both
+return the same values, and prints records per second. Full ``parse`` time is
+printed for reference.
+
+Usage:
+    python -m benchmarks.datex_xpath --situations 20000
+    python -m benchmarks.datex_xpath --feed recorded_datex2_v36.xml
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from lxml import etree
+
+from benchmarks._datex_fixtures import load_feed
+from DatexParser.datex_parser import _EXTRACTION_PATHS, DatexParser
+
+# Fields read from the record element and from its location reference
+_RECORD_FIELDS = [
+    "severity", "creation_time", "version_time", "start_time", "end_time",
+    "cause_type", "detailed_cause_type", "management_type", "vehicle_type",
+]
+_LOCATION_FIELDS = ["road_name", "road_destination", "carriageway", "lane_usage"]
+_POINT_FIELDS = ["latitude", "longitude", "km_point", "community", "province", "municipality"]
+
+
+def _point_elements(loc_ref: etree._Element, nsmap: dict[str, str]) -> list[etree._Element]:
+    points = []
+    for container, tags in (
+        ("linear_location", ("from", "to")),
+        ("point_location", ("point",)),
+    ):
+        parent = loc_ref.find(_EXTRACTION_PATHS[container], nsmap)
+        if parent is not None:
+            points.extend(
+                el for tag in tags
+                if (el := parent.find(_EXTRACTION_PATHS[tag], nsmap)) is not None
+            )
+    return points
+
+
+def extract_find(records: list[etree._Element], nsmap: dict[str, str]) -> list[list]:
+    """
+    Extracts the record fields with ``find`` and prefixed path strings.
+
+    Args:
+        records (list[etree._Element]): The situationRecord elements.
+        nsmap (dict[str, str]): The namespace map.
+
+    Returns:
+        list[list]: The extracted values of each record.
+    """
+    def text(el: etree._Element, name: str) -> str | None:
+        node = el.find(_EXTRACTION_PATHS[name], nsmap)
+        return node.text if node is not None else None
+
+    rows = []
+    for record in records:
+        row = [text(record, name) for name in _RECORD_FIELDS]
+        loc_ref = record.find(_EXTRACTION_PATHS["location_reference"], nsmap)
+        if loc_ref is not None:
+            row += [text(loc_ref, name) for name in _LOCATION_FIELDS]
+            for point in _point_elements(loc_ref, nsmap):
+                row += [text(point, name) for name in _POINT_FIELDS]
+        rows.append(row)
+    return rows
+
+
+def extract_compiled(records: list[etree._Element], nsmap: dict[str, str]) -> list[list]:
+    """
+    Extracts the record fields with the parser's compiled paths.
+
+    Args:
+        records (list[etree._Element]): The situationRecord elements.
+        nsmap (dict[str, str]): The namespace map.
+
+    Returns:
+        list[list]: The extracted values of each record.
+    """
+    paths = DatexParser._paths(nsmap)
+    text, first = DatexParser._text, DatexParser._first
+    record_paths = [paths[name] for name in _RECORD_FIELDS]
+    location_paths = [paths[name] for name in _LOCATION_FIELDS]
+    point_paths = [paths[name] for name in _POINT_FIELDS]
+
+    rows = []
+    for record in records:
+        row = [text(record, path) for path in record_paths]
+        loc_ref = first(record, paths["location_reference"])
+        if loc_ref is not None:
+            row += [text(loc_ref, path) for path in location_paths]
+            points = []
+            if (linear := first(loc_ref, paths["linear_location"])) is not None:
+                points += [first(linear, paths["from"]), first(linear, paths["to"])]
+            if (point_loc := first(loc_ref, paths["point_location"])) is not None:
+                points.append(first(point_loc, paths["point"]))
+            for point in points:
+                if point is not None:
+                    row += [text(point, path) for path in point_paths]
+        rows.append(row)
+    return rows
+
+
+def _best_of(repeat: int, func, *args) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the throughput of each approach.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--feed", type=Path, default=None)
+    arg_parser.add_argument("--situations", type=int, default=20_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    xml = load_feed(args.feed, args.situations)
+    root = etree.fromstring(xml.encode("utf-8"))
+    nsmap = DatexParser._build_nsmap(root)
+    records = root.findall("sit:situation/sit:situationRecord", nsmap)
+    print(f"Feed: {len(xml) / 1e6:.1f} MB, {len(records)} records")
+
+    find_time, find_rows = _best_of(args.repeat, extract_find, records, nsmap)
+    compiled_time, compiled_rows = _best_of(args.repeat, extract_compiled, records, nsmap)
+    if find_rows != compiled_rows:
+        raise SystemExit("Mismatch between find and compiled extraction")
+
+    for label, elapsed in (("find", find_time), ("compiled", compiled_time)):
+        print(f"{label:>9}: {elapsed:7.3f}s, {len(records) / elapsed:10,.0f} records/s")
+    print(f"  speedup: {find_time / compiled_time:.2f}x")
+
+    parser = DatexParser(truck_only=False)
+    start = time.perf_counter()
+    alerts = asyncio.run(parser.parse(xml))
+    elapsed = time.perf_counter() - start
+    print(f"    parse: {elapsed:7.3f}s, {len(alerts) / elapsed:10,.0f} records/s (end to end)")
+
+
+if __name__ == "__main__":
+    main()
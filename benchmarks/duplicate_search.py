@@ -0,0 +1,90 @@
+"""
+Benchmark for the duplicate image search of tools.diff_hash.
+
+Compares the BK-tree search (one tree.find per hash) with the vectorized
+NumPy search on synthetic dhashes, and checks both return the same duplicate set.
+
+Usage:
+    python -m benchmarks.duplicate_search --sizes 5000 20000 100000
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+import pybktree
+
+import tools.diff_hash as diff_hash
+from tools.diff_hash import Camera
+
+HASH_BITS = 128
+
+
+def make_hashes(count: int, seed: int = 0) -> list[Camera]:
+    """
+    Builds random dhashes where ~5% of the cameras are near-copies of another one
+    (a few flipped bits), and a few clusters mimic shared "camera offline" screens.
+
+    Args:
+        count (int): The number of hashes.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list[Camera]: The synthetic hashes.
+    """
+    rng = random.Random(seed)
+    offline_screens = [rng.getrandbits(HASH_BITS) for _ in range(5)]
+    hashes: list[Camera] = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.01:
+            bits = rng.choice(offline_screens)
+        elif roll < 0.06 and hashes:
+            bits = rng.choice(hashes).bits
+        else:
+            hashes.append(Camera(rng.getrandbits(HASH_BITS), f"cam{i}"))
+            continue
+        for _ in range(rng.randint(0, 10)):
+            bits ^= 1 << rng.randrange(HASH_BITS)
+        hashes.append(Camera(bits, f"cam{i}"))
+    return hashes
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 100_000])
+    # The BK-tree takes minutes at 20k and hours at 100k, pass a larger value to run it anyway
+    arg_parser.add_argument("--skip-bktree-above", type=int, default=20_000)
+    args = arg_parser.parse_args()
+
+    for size in args.sizes:
+        hashes = make_hashes(size)
+        # Both searches print every duplicate they find
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            vectorized = diff_hash.get_duplicates_vectorized(hashes)
+            vectorized_time = time.perf_counter() - start
+
+            bktree_time = None
+            if size <= args.skip_bktree_above:
+                start = time.perf_counter()
+                tree = pybktree.BKTree(diff_hash.item_distance, hashes)
+                expected = diff_hash.get_duplicates(tree, hashes)
+                bktree_time = time.perf_counter() - start
+
+        line = f"{size:>7} hashes | vectorized: {vectorized_time:8.3f}s"
+        if bktree_time is not None:
+            line += (
+                f" | BK-tree: {bktree_time:8.3f}s (x{bktree_time / vectorized_time:.1f})"
+                f" | same duplicates: {vectorized == expected}"
+            )
+        print(f"{line} | {len(vectorized)} duplicates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Micro-benchmarks for the batch haversine functions of tools.utils.
+
+Compares haversine_km_many (1 x N), haversine_km_blocks (N x M, blocked) and
+nearest_km (nearest neighbour) with loops over the scalar haversine_km, and
+prints the largest difference between both. The scalar N x M and nearest
+neighbour baselines run on a sample of rows and are extrapolated.
+
+Usage:
+    python -m benchmarks.haversine
+    python -m benchmarks.haversine --points 10000 --nn-queries 100000 --nn-refs 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tools.utils import haversine_km, haversine_km_blocks, haversine_km_many, nearest_km
+
+
+def _points(rng: np.random.Generator, count: int) -> tuple[np.ndarray, np.ndarray]:
+    # Europe-sized area, like the camera datasets
+    return rng.uniform(36.0, 58.0, count), rng.uniform(-9.0, 15.0, count)
+
+
+def _report(name: str, scalar: float, batch: float, max_diff: float) -> None:
+    print(
+        f"{name:<26} scalar {scalar * 1e3:10.1f} ms, batch {batch * 1e3:8.1f} ms "
+        f"(x{scalar / batch:.0f}), max diff {max_diff:.1e} km"
+    )
+
+
+def bench_one_to_many(rng: np.random.Generator, count: int) -> None:
+    """
+    Times one point against `count` points.
+
+    Args:
+        rng (np.random.Generator): The random generator.
+        count (int): The number of points.
+    """
+    lats, lons = _points(rng, count)
+    lat_list, lon_list = lats.tolist(), lons.tolist()
+
+    start = time.perf_counter()
+    expected = [haversine_km(45.0, 2.0, a, b) for a, b in zip(lat_list, lon_list)]
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    distances = haversine_km_many(45.0, 2.0, lats, lons)
+    batch = time.perf_counter() - start
+    _report(f"1 x {count}", scalar, batch, float(np.max(np.abs(distances - expected))))
+
+
+def bench_blocks(rng: np.random.Generator, count: int, sample: int) -> None:
+    """
+    Times `count` x `count` points, reducing every block to its row minimum.
+
+    Args:
+        rng (np.random.Generator): The random generator.
+        count (int): The number of points of each set.
+        sample (int): The number of rows the scalar loop runs on.
+    """
+    lats1, lons1 = _points(rng, count)
+    lats2, lons2 = _points(rng, count)
+    lat2_list, lon2_list = lats2.tolist(), lons2.tolist()
+
+    start = time.perf_counter()
+    row_min = np.empty(count)
+    for first, block in haversine_km_blocks(lats1, lons1, lats2, lons2):
+        row_min[first : first + len(block)] = block.min(axis=1)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [
+        min(haversine_km(a, b, c, d) for c, d in zip(lat2_list, lon2_list))
+        for a, b in zip(lats1[:sample].tolist(), lons1[:sample].tolist())
+    ]
+    scalar = (time.perf_counter() - start) * count / sample
+    _report(
+        f"{count} x {count} blocked", scalar, batch,
+        float(np.max(np.abs(row_min[:sample] - expected))),
+    )
+
+
+def bench_nearest(rng: np.random.Generator, queries: int, refs: int, sample: int) -> None:
+    """
+    Times the nearest reference point of every query point.
+
+    Args:
+        rng (np.random.Generator): The random generator.
+        queries (int): The number of query points.
+        refs (int): The number of reference points.
+        sample (int): The number of queries the scalar loop runs on.
+    """
+    lats, lons = _points(rng, queries)
+    ref_lats, ref_lons = _points(rng, refs)
+    ref_list = list(zip(ref_lats.tolist(), ref_lons.tolist()))
+
+    start = time.perf_counter()
+    indexes, distances = nearest_km(lats, lons, ref_lats, ref_lons)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [
+        min(range(refs), key=lambda i, a=a, b=b: haversine_km(a, b, *ref_list[i]))
+        for a, b in zip(lats[:sample].tolist(), lons[:sample].tolist())
+    ]
+    scalar = (time.perf_counter() - start) * queries / sample
+    # Indexes may only differ between points at the same distance (last-bit rounding)
+    max_diff = max(
+        abs(distances[q] - haversine_km(lats[q], lons[q], *ref_list[expected[q]]))
+        for q in range(sample)
+    )
+    if max_diff > 1e-9:
+        raise SystemExit("Nearest neighbours differ from the scalar search")
+    mismatches = int(np.sum(indexes[:sample] != expected))
+    if mismatches:
+        print(f"{mismatches} equidistant nearest neighbours picked differently")
+    _report(f"{queries} nearest of {refs}", scalar, batch, max_diff)
+
+
+def main() -> None:
+    """
+    Runs the micro-benchmarks and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--points", type=int, default=10_000)
+    arg_parser.add_argument("--nn-queries", type=int, default=100_000)
+    arg_parser.add_argument("--nn-refs", type=int, default=1_000)
+    arg_parser.add_argument("--sample", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    bench_one_to_many(rng, args.points)
+    bench_blocks(rng, args.points, args.sample)
+    bench_nearest(rng, args.nn_queries, args.nn_refs, args.sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark for the JSON backends of tools.utils.
+
+For each country dataset, times loading and dumping with the standard library
+(as save_json/load_json did before, indent=4) and with dump_json/parse_json on
+both backends (orjson and the standard library), pretty and compact, and prints
+the file sizes, plain and gzipped. Also checks that both backends produce the
+same bytes.
+
+Real datasets can be passed as files, otherwise synthetic ones with the size of
+each country's online dataset are generated.
+
+Usage:
+    python -m benchmarks.json_backend
+    python -m benchmarks.json_backend --files data/cameras_fr_online.json data/cameras_es_online.json
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import tools.utils as utils
+from Parsers.base_parser import BaseParser
+from tools.utils import dump_json, parse_json
+
+# Approximate online camera counts
+COUNTRY_SIZES: dict[str, int] = {"FR": 3_000, "ES": 2_000, "IT": 1_500, "UK": 4_000}
+
+
+def make_dataset(country: str, cameras: int, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Builds a synthetic dataset in the highway list format.
+
+    Args:
+        country (str): The country code.
+        cameras (int): The number of cameras.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list[dict[str, Any]]: The dataset.
+    """
+    rng = random.Random(seed)
+    highways: dict[str, list[dict[str, Any]]] = {}
+    for i in range(cameras):
+        name = f"A-{rng.randint(1, 80)}"
+        highways.setdefault(name, []).append(
+            BaseParser.format_camera(
+                f"{country}{i}", round(rng.uniform(0, 900), 3), rng.choice(["*", "N", "S"]),
+                rng.choice(["img", "vid"]), round(rng.uniform(-9, 15), 6),
+                round(rng.uniform(36, 58), 6),
+                url=f"https://cams.example/{country.lower()}/{i}.jpg",
+                description=f"Cámara {i} – {name}",
+            )
+        )
+    return [
+        {"highway": {"name": name, "country": country, "cameras": cams}}
+        for name, cams in sorted(highways.items())
+    ]
+
+
+def _best(func: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _use_backend(module: Any) -> None:
+    # None forces the standard library fallback
+    utils.orjson = module
+
+
+def bench_dataset(label: str, data: list[dict[str, Any]], repeat: int) -> None:
+    """
+    Times every backend on one dataset and prints a table.
+
+    Args:
+        label (str): The dataset name.
+        data (list[dict[str, Any]]): The dataset.
+        repeat (int): The number of runs, the best one is kept.
+    """
+    installed = utils.orjson
+    cameras = sum(len(h["highway"]["cameras"]) for h in data)
+    print(f"\n{label}: {cameras} cameras")
+    print(f"{'variant':<24}{'dump ms':>10}{'load ms':>10}{'size KB':>10}{'gzip KB':>10}")
+
+    def legacy_dump() -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=4).encode()
+
+    variants: list[tuple[str, Any, Callable[[], bytes], Callable[[bytes], Any]]] = [
+        ("json indent=4 (before)", None, legacy_dump, json.loads)
+    ]
+    backends = [("json", None)] + ([("orjson", installed)] if installed else [])
+    variants.extend(
+        (
+            f"{name} {'compact' if compact else 'pretty'}",
+            module,
+            lambda c=compact: dump_json(data, c),
+            parse_json,
+        )
+        for name, module in backends
+        for compact in (False, True)
+    )
+
+    outputs: dict[bool, set[bytes]] = {False: set(), True: set()}
+    try:
+        for name, module, dump, load in variants:
+            _use_backend(module)
+            raw = dump()
+            if load(raw) != data:
+                raise SystemExit(f"{name}: round trip changed the data")
+            if not name.endswith("(before)"):
+                outputs[name.endswith("compact")].add(raw)
+            dump_time = _best(dump, repeat)
+            load_time = _best(lambda load=load, raw=raw: load(raw), repeat)
+            print(
+                f"{name:<24}{dump_time * 1e3:>10.1f}{load_time * 1e3:>10.1f}"
+                f"{len(raw) / 1024:>10.0f}{len(gzip.compress(raw)) / 1024:>10.0f}"
+            )
+    finally:
+        _use_backend(installed)
+
+    if any(len(raws) > 1 for raws in outputs.values()):
+        raise SystemExit("Backends produce different output")
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--files", type=Path, nargs="*", default=[])
+    arg_parser.add_argument("--scale", type=float, default=1.0)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"Installed backend: {utils.JSON_BACKEND}")
+    if args.files:
+        for path in args.files:
+            bench_dataset(path.name, json.loads(path.read_bytes()), args.repeat)
+        return
+    for country, size in COUNTRY_SIZES.items():
+        bench_dataset(country, make_dataset(country, int(size * args.scale)), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Benchmark for BaseParser.merge_camera_data on a synthetic dataset.
+
+Compares the indexed merge against the previous implementation, which
+deep-copied every camera, compared it with every camera already kept on its
+highway and rebuilt the URL/ID sets for every entry, and reports whether both
+produce identical output. The full parity check on every option combination is
+tests/test_base_parser.py.
+
+Usage:
+    python -m benchmarks.merge_camera_data --cameras 50000 --highways 50 --fragments 20
+"""
+
+import argparse
+import copy
+import json
+import random
+import time
+from typing import Any
+
+from Parsers.base_parser import BaseParser
+from tools.utils import haversine_km
+
+
+class _BenchParser(BaseParser):
+    """Minimal concrete parser, only used for its merge_camera_data."""
+
+    @property
+    def country(self) -> str:
+        return "FR"
+
+    async def parse(self, raw_data: Any) -> Any:
+        return raw_data
+
+
+def legacy_merge_camera_data(
+    country: str,
+    *datasets: list[dict[str, Any]],
+    match_by: str = "coordinates",
+    threshold: float = 0.1,
+    check_id: bool = False,
+    check_url: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Reference copy of the original quadratic merge, used as baseline and for parity checks.
+    """
+
+    def _coords(cam: dict[str, Any]) -> tuple[float, float] | None:
+        c = cam.get("coords") or {}
+        x, y = c.get("X"), c.get("Y")
+        if x is not None and y is not None:
+            return (x, y)
+        return None
+
+    def _spatial_match(cam1: dict[str, Any], cam2: dict[str, Any]) -> bool:
+        if match_by == "coordinates":
+            p1, p2 = _coords(cam1), _coords(cam2)
+            if p1 is None or p2 is None:
+                return False
+            return haversine_km(p1[1], p1[0], p2[1], p2[0]) <= threshold
+        km1 = cam1.get("camera_km_point")
+        km2 = cam2.get("camera_km_point")
+        return km1 is not None and km2 is not None and abs(km1 - km2) <= threshold
+
+    def _is_duplicate(cam: dict[str, Any], existing: dict[str, Any]) -> bool:
+        if _coords(cam) is None and _coords(existing) is None:
+            return True
+        return _spatial_match(cam, existing) if match_by == "coordinates" else False
+
+    merged: dict[str, list[dict[str, Any]]] = {}
+    countries: dict[str, str] = {}
+    for dataset in datasets:
+        if not dataset:
+            continue
+        for entry in dataset:
+            highway = entry.get("highway", {})
+            name = highway.get("name")
+            if not name:
+                continue
+            countries.setdefault(name, highway.get("country", country))
+            target = merged.setdefault(name, [])
+            seen_urls = (
+                {c.get("url") for c in target if c.get("url")} if check_url else set()
+            )
+            cameras_by_id = (
+                {c["camera_id"]: c for c in target if c.get("camera_id")}
+                if check_id
+                else {}
+            )
+            for cam_in in highway.get("cameras", []):
+                cam = copy.deepcopy(cam_in)
+                url = cam.get("url")
+                cam_id = cam.get("camera_id")
+                if check_url and url and url in seen_urls:
+                    continue
+                if check_id and cam_id:
+                    existing = cameras_by_id.get(cam_id)
+                    if existing:
+                        if _is_duplicate(cam, existing):
+                            continue
+                        i = 1
+                        new_id = f"{cam_id}_dup{i}"
+                        while new_id in cameras_by_id:
+                            i += 1
+                            new_id = f"{cam_id}_dup{i}"
+                        cam["camera_id"] = new_id
+                        cam_id = new_id
+                if not check_id and any(_spatial_match(cam, c) for c in target):
+                    continue
+                target.append(cam)
+                if check_url and url:
+                    seen_urls.add(url)
+                if cam_id:
+                    cameras_by_id[cam_id] = cam
+
+    return [
+        {
+            "highway": {
+                "name": name,
+                "country": countries[name],
+                "cameras": sorted(cams, key=lambda c: c.get("camera_km_point", 0.0)),
+            }
+        }
+        for name, cams in sorted(merged.items())
+    ]
+
+
+def make_datasets(
+    total_cameras: int, highways: int, fragments: int = 1, seed: int = 0
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Builds two synthetic datasets (like France's Gov + ASFA feeds) along straight highways.
+    Roughly a third of the second dataset sits within a few meters of a camera of the first,
+    and some of its cameras reuse an ID or URL of the first one.
+
+    Args:
+        total_cameras (int): The number of cameras across both datasets.
+        highways (int): The number of highways.
+        fragments (int, optional): The number of entries each highway is split into,
+            like Italy's many A04 segments. Defaults to 1.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        tuple[list[dict[str, Any]], list[dict[str, Any]]]: The primary and secondary datasets.
+    """
+    rng = random.Random(seed)
+    per_highway = max(1, total_cameras // (2 * highways))
+    primary: list[dict[str, Any]] = []
+    secondary: list[dict[str, Any]] = []
+    for h in range(highways):
+        lat0, lon0 = rng.uniform(42.0, 50.0), rng.uniform(-4.0, 7.0)
+        bearing_lat, bearing_lon = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        cams_a: list[dict[str, Any]] = []
+        cams_b: list[dict[str, Any]] = []
+        for i in range(per_highway):
+            step = rng.uniform(0.0, 4.0)
+            lat = lat0 + bearing_lat * step
+            lon = lon0 + bearing_lon * step
+            cams_a.append(
+                BaseParser.format_camera(
+                    f"hw{h}_a{i}", round(step * 100, 3), "*", "vid",
+                    round(lon, 6), round(lat, 6), url=f"https://a.example/{h}/{i}",
+                )
+            )
+            roll = rng.random()
+            cam_id = f"hw{h}_a{i}" if roll < 0.1 else f"hw{h}_b{i}"
+            url = f"https://a.example/{h}/{i}" if roll > 0.9 else f"https://b.example/{h}/{i}"
+            if rng.random() < 0.33:
+                lat += rng.uniform(-0.0005, 0.0005)
+                lon += rng.uniform(-0.0005, 0.0005)
+            else:
+                step = rng.uniform(0.0, 4.0)
+                lat = lat0 + bearing_lat * step
+                lon = lon0 + bearing_lon * step
+            cams_b.append(
+                BaseParser.format_camera(
+                    cam_id, round(step * 100, 3), "*", "asfa_vid",
+                    round(lon, 6), round(lat, 6), url=url,
+                )
+            )
+        name = f"A-{h}"
+        for dataset, cams in ((primary, cams_a), (secondary, cams_b)):
+            size = -(-len(cams) // fragments)
+            dataset.extend(
+                {"highway": {"name": name, "country": "FR", "cameras": cams[k : k + size]}}
+                for k in range(0, len(cams), size)
+            )
+    return primary, secondary
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--cameras", type=int, default=50_000)
+    arg_parser.add_argument("--highways", type=int, default=50)
+    arg_parser.add_argument("--threshold", type=float, default=0.2)
+    arg_parser.add_argument("--fragments", type=int, default=1)
+    arg_parser.add_argument("--skip-legacy", action="store_true")
+    args = arg_parser.parse_args()
+
+    primary, secondary = make_datasets(args.cameras, args.highways, args.fragments)
+    parser = _BenchParser()
+    print(f"Merging {args.cameras} cameras on {args.highways} highways")
+
+    for match_by in ("coordinates", "km_point"):
+        start = time.perf_counter()
+        merged = parser.merge_camera_data(
+            primary, secondary, match_by=match_by, threshold=args.threshold
+        )
+        indexed = time.perf_counter() - start
+        kept = sum(len(h["highway"]["cameras"]) for h in merged)
+        print(f"[{match_by}] indexed:    {indexed:8.3f}s ({kept} cameras kept)")
+
+        if args.skip_legacy:
+            continue
+        start = time.perf_counter()
+        expected = legacy_merge_camera_data(
+            parser.country, primary, secondary, match_by=match_by, threshold=args.threshold
+        )
+        legacy = time.perf_counter() - start
+        identical = json.dumps(merged) == json.dumps(expected)
+        print(
+            f"[{match_by}] quadratic:  {legacy:8.3f}s "
+            f"(speedup x{legacy / indexed:.1f}, identical output: {identical})"
+        )
+
+
+if __name__ == "__main__":
+    main()
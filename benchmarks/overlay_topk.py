@@ -0,0 +1,109 @@
+"""
+Benchmark for the overlay alert selection.
+
+Builds the overlay alert list from a filter result the previous way
+(serialize every alert, sort, slice) and with select_overlay_alerts (heap on
+lightweight keys, serialize the winners only), checks that both give the same
+items and prints the timings.
+
+Usage:
+    python -m benchmarks.overlay_topk --alerts 100000 --max-items 50
+"""
+
+import argparse
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from DatexParser.datex_filter import SEVERITY_RANK, FilterResult
+from DatexParser.datex_models import TruckDashboardAlert
+from DatexParser.overlay_export import _serialize_alert, select_overlay_alerts
+
+
+def legacy_select(result: FilterResult, max_items: int) -> list[dict[str, Any]]:
+    """
+    Serializes every alert, sorts them all and slices, as done before.
+
+    Args:
+        result (FilterResult): The filter output.
+        max_items (int): Number of alerts to keep, all of them if not positive.
+
+    Returns:
+        list[dict[str, Any]]: The serialized alerts, best first.
+    """
+    active = [_serialize_alert(a, "verified_active") for a in result.active]
+    suspicious = [_serialize_alert(a, "suspicious") for a in result.suspicious]
+    merged = active + suspicious
+    merged.sort(
+        key=lambda item: (
+            SEVERITY_RANK.get((item.get("severity") or "").lower(), 0),
+            item.get("version_time")
+            or item.get("creation_time")
+            or item.get("start_time")
+            or "",
+        ),
+        reverse=True,
+    )
+    return merged[:max_items] if max_items > 0 else merged
+
+
+def make_result(count: int, seed: int = 0) -> FilterResult:
+    """
+    Builds a synthetic filter result with many ties on severity and time.
+
+    Args:
+        count (int): The number of alerts.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        FilterResult: Active and suspicious alerts.
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
+    result = FilterResult()
+    for i in range(count):
+        version = now - timedelta(minutes=rng.randint(0, 2000)) if rng.random() < 0.8 else None
+        alert = TruckDashboardAlert(
+            situation_id=f"SIT{i}",
+            record_id=f"SIT{i}_R0",
+            severity=rng.choice([None, "low", "medium", "high", "highest", "High"]),
+            version_time=version,
+            creation_time=now - timedelta(days=rng.randint(0, 30)) if rng.random() < 0.5 else None,
+            start_time=now - timedelta(days=rng.randint(0, 30)),
+        )
+        (result.active if rng.random() < 0.8 else result.suspicious).append(alert)
+    return result
+
+
+def main() -> None:
+    """
+    Runs the parity check and prints the timings.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--alerts", type=int, default=100_000)
+    arg_parser.add_argument("--max-items", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    result = make_result(args.alerts)
+
+    start = time.perf_counter()
+    expected = legacy_select(result, args.max_items)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    selected = [
+        _serialize_alert(alert, confidence)
+        for alert, confidence in select_overlay_alerts(result, args.max_items)
+    ]
+    topk_time = time.perf_counter() - start
+
+    if selected != expected:
+        raise SystemExit("Mismatch between legacy and top-k selection")
+    print(f"{args.alerts} alerts, top {args.max_items}")
+    print(f"serialize + sort: {legacy_time * 1e3:8.1f} ms")
+    print(f"   heap + winners: {topk_time * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
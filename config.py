@@ -9,15 +9,58 @@ class CONSTANTS:
         SEPARATOR = "=" * 36
         VIDEO_EXTENSIONS = (".mp4", ".flv")
         IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+        # Size video frames are scaled to before hashing
+        VIDEO_FRAME_SIZE = (352, 288)
         RATE_LIMIT = 50
+        # Total concurrent connections shared by all countries when the pipelines run concurrently,
+        # split proportionally to their RATE_LIMITs, which add up to 350
+        CONNECTION_BUDGET = 200
+        # Concurrent connections a single host may take from the shared pool, the largest country
+        # RATE_LIMIT, so one source never holds the whole CONNECTION_BUDGET
+        HOST_CONNECTION_LIMIT = 150
         HTTP_TIMEOUT = 20.00
+        # Per-host AIMD concurrency for camera checks, capped by the country's rate limit
+        HOST_INITIAL_CONCURRENCY = 4
+        HOST_MIN_CONCURRENCY = 1
+        # Multiplicative decrease on timeouts, 429 and 5xx responses
+        HOST_BACKOFF_FACTOR = 0.5
+        # A response slower than this many times the host's fastest one stops the increase
+        HOST_LATENCY_TOLERANCE = 4.0
+        # Idle seconds a pooled keep-alive connection is kept open per host
+        HTTP_KEEPALIVE_TIMEOUT = 60.0
+        DNS_CACHE_TTL = 300
         SLIDESHOW_INTERVAL = 7
         EARTH_RADIUS_KM = 6371.0
+        # Distances computed at once by the batch haversine functions (8 bytes each per temporary)
+        HAVERSINE_BLOCK_ELEMENTS = 1_000_000
         COUNTRY_MAP = {"ES": "Spain", "FR": "France", "IT": "Italy", "UK": "UK"}
         DATA_DIR = PROJECT_ROOT / Path("data/")
         IMG_DIR_NAME = Path("images/")
         IMG_DIR = DATA_DIR / IMG_DIR_NAME
+        # Smallest response accepted as a live camera
+        PROBE_MIN_BYTES = 1000
+        # Bytes read from a video to decode its first frame when hashing (probe mode)
+        VIDEO_PROBE_BYTES = 512 * 1024
+        # Probed bodies up to this Content-Length are read to the end instead of closing the connection,
+        # so it goes back to the keep-alive pool (cheaper than a new TCP/TLS handshake)
+        PROBE_DRAIN_BYTES = 64 * 1024
+        # Keep the downloaded verification images in IMG_DIR (hashing is done in memory)
+        DEBUG_IMAGES = False
         HTML_DIR = DATA_DIR / Path('html/')
+        HTTP_CACHE_DIR = DATA_DIR / Path("cache/http/")
+        # Windows: attempts, and first delay in seconds (doubled each time), when replacing a file another process has open
+        REPLACE_ATTEMPTS = 5
+        REPLACE_RETRY_DELAY_S = 0.05
+        # Bytes per chunk when streaming large responses (e.g. DATEX II feeds)
+        STREAM_CHUNK_SIZE = 64 * 1024
+        # Camera health store, used by incremental camera checks
+        HEALTH_DB_PATH = DATA_DIR / Path("camera_health.sqlite3")
+        INCREMENTAL_CHECK = False
+        # Seconds before an online camera is probed again (spread by +/- 25% per camera)
+        HEALTHY_RECHECK_INTERVAL = 30 * 60
+        # Seconds before a failing camera is probed again, doubled for every
+        # consecutive failure up to HEALTHY_RECHECK_INTERVAL
+        FAILING_RECHECK_INTERVAL = 2 * 60
         DEFAULT_HEADERS = {
             "accept": "*/*",
             "content-type": "application/json",
@@ -215,6 +258,19 @@ class CONSTANTS:
         XOR_KEY = "K"
         IMAGE_EXT = ".jpg"
         RATE_LIMIT = 150
+        # Cameras attached to each DATEX II alert, put first in the slideshow
+        INCIDENT_CAMERAS = 3
+        # Km beyond an alert's km interval a camera on the same road may be
+        INCIDENT_KM_MARGIN = 2.0
+        # Fallback when km points are missing: distance to an alert endpoint
+        INCIDENT_RADIUS_KM = 5.0
+        # Incident cameras put before the camera loop, at most
+        INCIDENT_MAX_CAMERAS = 30
+        # Overlay push server (get_datex_spain.py --serve)
+        OVERLAY_HOST = "127.0.0.1"
+        OVERLAY_PORT = 8765
+        # Seconds between SSE keep-alive comments
+        OVERLAY_KEEPALIVE_S = 15
 
         class HighwaySort:
             NORTH_SOUTH = ["A-1", "AP-7", "A-7", "AP-68", "A-68", "A-6", "A-4"]
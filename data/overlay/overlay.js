@@ -1,4 +1,11 @@
-const DATA_URL = "../overlay_data.json";
+// Overlay server (get_datex_spain.py --serve): the page's own origin when
+// served by it, or ?server=http://127.0.0.1:8765 when opened from disk.
+const SERVER_URL =
+  new URLSearchParams(window.location.search).get("server") ||
+  (window.location.protocol.startsWith("http") ? ".." : "");
+const DATA_URL = `${SERVER_URL || ".."}/overlay_data.json`;
+const EVENTS_URL = SERVER_URL ? `${SERVER_URL}/events` : "";
+// Polling fallback, used while the event stream is unavailable
 const FETCH_INTERVAL_MS = 10_000;
 const SCROLL_INTERVAL_MS = 15_000;
 const MAX_VISIBLE_ALERTS = 3;
@@ -96,6 +103,7 @@ let scrollIndex = 0;
 let scrollTimer = null;
 let lastAlertSignature = "";
 let isAnimating = false;
+let pollTimer = null;
 
 function severityClass(severity) {
   const key = (severity || "").toLowerCase();
@@ -227,29 +235,77 @@ function setScrollTimer() {
   scrollTimer = setInterval(scrollDown, SCROLL_INTERVAL_MS);
 }
 
+function alertKey(alert) {
+  return `${alert.situation_id}/${alert.record_id}`;
+}
+
+function applyPayload(payload) {
+  const incomingAlerts = Array.isArray(payload.alerts) ? payload.alerts : [];
+  const signature = incomingAlerts
+    .map((a) => `${a.record_id || ""}:${a.version_time || a.creation_time || a.start_time || ""}`)
+    .join("|");
+  const hasChanged = signature !== lastAlertSignature;
+
+  allAlerts = incomingAlerts;
+  if (hasChanged) {
+    lastAlertSignature = signature;
+    scrollIndex = 0;
+    renderWindow();
+    setScrollTimer();
+  }
+  statusLineEl.textContent = `Live: ${allAlerts.length} alerts`;
+}
+
+function applyDelta(delta) {
+  const known = new Map(allAlerts.map((alert) => [alertKey(alert), alert]));
+  for (const alert of delta.upsert || []) known.set(alertKey(alert), alert);
+
+  const alerts = [];
+  for (const key of delta.order || []) {
+    const alert = known.get(key);
+    if (!alert) {
+      // Out of sync with the server: fetch the full payload instead
+      loadAlerts();
+      return;
+    }
+    alerts.push(alert);
+  }
+  applyPayload({ ...delta, alerts });
+}
+
 async function loadAlerts() {
   try {
     const response = await fetch(`${DATA_URL}?t=${Date.now()}`, { cache: "no-store" });
     if (!response.ok) throw new Error(`HTTP ${response.status}`);
-    const payload = await response.json();
-    const incomingAlerts = Array.isArray(payload.alerts) ? payload.alerts : [];
-    const signature = incomingAlerts
-      .map((a) => `${a.record_id || ""}:${a.version_time || a.creation_time || a.start_time || ""}`)
-      .join("|");
-    const hasChanged = signature !== lastAlertSignature;
-
-    allAlerts = incomingAlerts;
-    if (hasChanged) {
-      lastAlertSignature = signature;
-      scrollIndex = 0;
-      renderWindow();
-      setScrollTimer();
-    }
-    statusLineEl.textContent = `Live: ${allAlerts.length} alerts`;
+    applyPayload(await response.json());
   } catch (error) {
     statusLineEl.textContent = `Overlay data unavailable (${error.message})`;
   }
 }
 
-loadAlerts();
-setInterval(loadAlerts, FETCH_INTERVAL_MS);
+function startPolling() {
+  if (pollTimer) return;
+  loadAlerts();
+  pollTimer = setInterval(loadAlerts, FETCH_INTERVAL_MS);
+}
+
+function stopPolling() {
+  if (pollTimer) clearInterval(pollTimer);
+  pollTimer = null;
+}
+
+function connectEvents() {
+  if (!EVENTS_URL || typeof EventSource === "undefined") {
+    startPolling();
+    return;
+  }
+
+  const source = new EventSource(EVENTS_URL);
+  source.addEventListener("open", stopPolling);
+  source.addEventListener("snapshot", (event) => applyPayload(JSON.parse(event.data)));
+  source.addEventListener("delta", (event) => applyDelta(JSON.parse(event.data)));
+  // EventSource reconnects by itself (and stops on HTTP errors); poll meanwhile
+  source.addEventListener("error", startPolling);
+}
+
+connectEvents();
@@ -4,8 +4,12 @@ from pathlib import Path
 import winloop
 
 from config import CONSTANTS
+from Downloaders.base_downloader import BaseDownloader
+from DatexParser.camera_join import CameraAlertJoin
 from DatexParser.datex_filter import FilterConfig
 from DatexParser.overlay_export import export_overlay_data, run_overlay_export_loop
+from DatexParser.overlay_server import OverlayServer
+from tools.utils import load_json
 
 DEFAULT_ROADS = ["A-1", "AP-7", "AP-8"]
 
@@ -51,12 +55,36 @@ def parse_args() -> Namespace:
         default=50,
         help="Maximum number of alerts to keep in overlay_data.json.",
     )
+    parser.add_argument(
+        "--cameras-file",
+        default=None,
+        help="Spanish camera JSON (e.g. cameras_es_online.json) to attach the nearest cameras to each alert.",
+    )
     parser.add_argument(
         "--once",
         action="store_true",
         help="Run once and exit. Default behavior runs continuously.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Also serve the overlay and push every update to it over Server-Sent Events.",
+    )
+    parser.add_argument(
+        "--host",
+        default=CONSTANTS.SPAIN.OVERLAY_HOST,
+        help="Interface the overlay server listens on.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=CONSTANTS.SPAIN.OVERLAY_PORT,
+        help="Port the overlay server listens on.",
+    )
+    args = parser.parse_args()
+    if args.serve and args.once:
+        parser.error("--serve runs continuously and cannot be combined with --once")
+    return args
 
 
 async def main() -> None:
@@ -64,24 +92,41 @@ async def main() -> None:
     roads = _parse_roads(args.roads) or None
     config = _build_filter_config()
     output_file = Path(args.output_file)
+    camera_join = (
+        CameraAlertJoin(load_json(Path(args.cameras_file)))
+        if args.cameras_file
+        else None
+    )
 
-    if args.once:
-        target = await export_overlay_data(
-            output_file=output_file,
-            roads=roads,
-            max_items=args.max_items,
-            filter_config=config,
-        )
-        print(f"Overlay data written to: {target}")
-        return
+    # Keep one pooled HTTP session alive across polls
+    async with BaseDownloader.session_pool():
+        if args.once:
+            target = await export_overlay_data(
+                output_file=output_file,
+                roads=roads,
+                max_items=args.max_items,
+                filter_config=config,
+                camera_join=camera_join,
+            )
+            print(f"Overlay data written to: {target}")
+            return
 
-    await run_overlay_export_loop(
-        interval_seconds=args.interval_seconds,
-        output_file=output_file,
-        roads=roads,
-        max_items=args.max_items,
-        filter_config=config,
-    )
+        server = OverlayServer(host=args.host, port=args.port) if args.serve else None
+        if server is not None:
+            await server.start()
+        try:
+            await run_overlay_export_loop(
+                interval_seconds=args.interval_seconds,
+                output_file=output_file,
+                roads=roads,
+                max_items=args.max_items,
+                filter_config=config,
+                camera_join=camera_join,
+                on_payload=server.publish if server is not None else None,
+            )
+        finally:
+            if server is not None:
+                await server.stop()
 
 
 if __name__ == "__main__":
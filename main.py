@@ -1,8 +1,16 @@
+import asyncio
+import time
 import winloop
 from argparse import Namespace
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from DatexParser.camera_join import CameraAlertJoin, incident_first
+from DatexParser.datex_filter import SEVERITY_RANK, HeuristicFilter
+from DatexParser.datex_models import TruckDashboardAlert
+from DatexParser.datex_parser import DatexParser
+from Downloaders.base_downloader import BaseDownloader, GenericDownloader
 from Parsers import france_parser, italy_parser, spain_parser, uk_parser
 from tools.camera_check import main as camera_check
 from config import CONSTANTS
@@ -15,10 +23,20 @@ SPAIN_RATE_LIMIT: int = CONSTANTS.SPAIN.RATE_LIMIT
 ITALY_RATE_LIMIT: int = CONSTANTS.ITALY.RATE_LIMIT
 UK_RATE_LIMIT: int = CONSTANTS.UK.RATE_LIMIT
 DEFAULT_INTERVAL: int = CONSTANTS.COMMON.SLIDESHOW_INTERVAL
+CONNECTION_BUDGET: int = CONSTANTS.COMMON.CONNECTION_BUDGET
+INCIDENT_MAX_CAMERAS: int = CONSTANTS.SPAIN.INCIDENT_MAX_CAMERAS
 
 JSON_OUTPUT_DIR: Path = CONSTANTS.COMMON.DATA_DIR
 HTML_OUTPUT_DIR: Path = CONSTANTS.COMMON.HTML_DIR
 
+# Per-country concurrency weights, used to split the global connection budget
+COUNTRY_RATE_LIMITS: dict[str, int] = {
+    "Spain": SPAIN_RATE_LIMIT,
+    "France": DEFAULT_RATE_LIMIT,
+    "Italy": ITALY_RATE_LIMIT,
+    "UK": UK_RATE_LIMIT,
+}
+
 
 def create_html_files(
     input_data: list[dict[str, Any]],
@@ -56,7 +74,11 @@ def create_html_files(
 
 
 async def get_camera_data(
-    country: str, save_raw: bool, save_checked: bool, output_dir: Path
+    country: str,
+    save_raw: bool,
+    save_checked: bool,
+    output_dir: Path,
+    rate_limit: int | None = None,
 ) -> list[dict[str, Any]]:
     """
     Downloads, parses, and explicitly checks cameras for a given country.
@@ -66,6 +88,8 @@ async def get_camera_data(
         save_raw (bool): Whether to save the raw JSON data.
         save_checked (bool): Whether to save the checked/online JSON data.
         output_dir (Path): The output directory for the files.
+        rate_limit (int | None, optional): Overrides the country's default concurrency limit
+            for camera checking. Defaults to None.
 
     Raises:
         ValueError: If an invalid country name is provided.
@@ -76,13 +100,13 @@ async def get_camera_data(
     print(SEP)
     print(f"Downloading {country} data...")
     print(SEP)
-    rate_limit = DEFAULT_RATE_LIMIT
+    country_rate_limit = DEFAULT_RATE_LIMIT
 
     save_raw_path = output_dir if save_raw else None
 
     if country == "Spain":
         country_data = await spain_parser.get_parsed_data(save_raw_path)
-        rate_limit = SPAIN_RATE_LIMIT
+        country_rate_limit = SPAIN_RATE_LIMIT
 
     elif country == "France":
         country_data = await france_parser.get_parsed_data(output_folder=save_raw_path)
@@ -92,20 +116,181 @@ async def get_camera_data(
 
     elif country == "UK":
         country_data = await uk_parser.get_parsed_data(output_folder=save_raw_path)
-        rate_limit = UK_RATE_LIMIT
+        country_rate_limit = UK_RATE_LIMIT
 
     else:
         raise ValueError(f"Invalid country: {country}")
 
     checked_country_data = await camera_check(
         camera_json=country_data,
-        rate_limit=rate_limit,
+        rate_limit=rate_limit or country_rate_limit,
         output_dir=output_dir,
         save_file=save_checked,
     )
     return checked_country_data
 
 
+def alert_priority(alert: TruckDashboardAlert) -> tuple[int, datetime]:
+    """
+    Sort key putting the most severe alerts first, and the newest first within a severity (with reverse=True).
+
+    Args:
+        alert (TruckDashboardAlert): The alert.
+
+    Returns:
+        tuple[int, datetime]: The severity rank and the version time (datetime.min in UTC if unknown).
+    """
+    return (
+        SEVERITY_RANK.get((alert.severity or "").lower(), 0),
+        alert.version_time or datetime.min.replace(tzinfo=UTC),
+    )
+
+
+def _incident_cameras_first(
+    camera_data: list[dict[str, Any]],
+    camera_ids: list[str],
+    alerts: list[TruckDashboardAlert],
+) -> list[str]:
+    """
+    Joins the active alerts to the cameras and puts the incident cameras first.
+
+    Args:
+        camera_data (list[dict[str, Any]]): The checked Spanish camera data.
+        camera_ids (list[str]): The slideshow camera IDs, in order.
+        alerts (list[TruckDashboardAlert]): The parsed DATEX II alerts.
+
+    Returns:
+        list[str]: The reordered camera IDs.
+    """
+    # Most severe first, newest first within a severity
+    active = sorted(
+        HeuristicFilter().filter(alerts).all_active(), key=alert_priority, reverse=True
+    )
+    matches = CameraAlertJoin(camera_data).match(active)
+    ordered = incident_first(camera_ids, matches, limit=INCIDENT_MAX_CAMERAS)
+    print(f"{len(matches)}/{len(active)} active DATEX II alerts have cameras.")
+    return ordered
+
+
+async def order_incidents_first(
+    camera_data: list[dict[str, Any]], camera_ids: list[str]
+) -> list[str]:
+    """
+    Puts the cameras watching active DGT traffic alerts at the start of the Spanish slideshow.
+
+    Args:
+        camera_data (list[dict[str, Any]]): The checked Spanish camera data.
+        camera_ids (list[str]): The slideshow camera IDs, in order.
+
+    Returns:
+        list[str]: The reordered camera IDs, or the given ones if the alerts can't be fetched.
+    """
+    try:
+        alerts = await DatexParser(downloader=GenericDownloader()).get_parsed_data()
+    except Exception as e:
+        print(f"Could not get DATEX II alerts, keeping the loop order: {e}")
+        return camera_ids
+    return await asyncio.to_thread(
+        _incident_cameras_first, camera_data, camera_ids, alerts
+    )
+
+
+def split_connection_budget(
+    countries: list[str], budget: int = CONNECTION_BUDGET
+) -> dict[str, int]:
+    """
+    Splits a global connection budget across countries.
+    Every country gets its configured rate limit when they fit in the budget together,
+    otherwise every country gets one connection and the rest of the budget is split
+    proportionally to their rate limits, so the shares never add up to more than the budget.
+
+    Args:
+        countries (list[str]): The country names (e.g., 'Spain', 'France').
+        budget (int, optional): The total number of concurrent connections. Defaults to CONNECTION_BUDGET.
+
+    Returns:
+        dict[str, int]: A mapping of country name to its share of the budget (at least 1, at most its rate limit).
+
+    Raises:
+        ValueError: If the budget is lower than the number of countries.
+    """
+    if budget < len(countries):
+        raise ValueError(
+            f"Connection budget {budget} is lower than the number of countries ({len(countries)})"
+        )
+    limits = {c: COUNTRY_RATE_LIMITS.get(c, DEFAULT_RATE_LIMIT) for c in countries}
+    total_limit = sum(limits.values())
+    if total_limit <= budget:
+        return limits
+    # Above the guaranteed connection, both the budget and the limits shrink by one per country
+    spare, spare_limit = budget - len(limits), total_limit - len(limits)
+    return {c: 1 + spare * (limit - 1) // spare_limit for c, limit in limits.items()}
+
+
+async def run_country_pipeline(
+    country: str,
+    save_raw: bool,
+    save_checked: bool,
+    create_html: bool,
+    output_dir: Path,
+    rate_limit: int | None = None,
+    incidents_first: bool = False,
+) -> float:
+    """
+    Runs the full download -> parse -> check -> loop -> HTML chain for a single country.
+
+    Args:
+        country (str): The country name (e.g., 'Spain', 'France', 'Italy', 'UK').
+        save_raw (bool): Whether to save the raw JSON data.
+        save_checked (bool): Whether to save the checked/online JSON data.
+        create_html (bool): Whether to create the HTML slideshow.
+        output_dir (Path): The output directory for the JSON files.
+        rate_limit (int | None, optional): Overrides the country's default concurrency limit. Defaults to None.
+        incidents_first (bool, optional): Whether to put the cameras watching DGT traffic alerts
+            first in the Spanish slideshow. Defaults to False.
+
+    Returns:
+        float: The wall time of the pipeline in seconds.
+    """
+    start = time.perf_counter()
+    country_data = await get_camera_data(
+        country, save_raw, save_checked, output_dir, rate_limit
+    )
+    # Loop and HTML creation are synchronous, keep them off the event loop
+    # so the other countries can keep downloading in the meantime
+    selected_cameras = await asyncio.to_thread(create_loop, country_data)
+    if selected_cameras and incidents_first and country == "Spain":
+        selected_cameras = await order_incidents_first(country_data, selected_cameras)
+    if selected_cameras and create_html:
+        await asyncio.to_thread(
+            create_html_files,
+            country_data,
+            HTML_OUTPUT_DIR,
+            camera_ids=selected_cameras,
+        )
+    return time.perf_counter() - start
+
+
+def print_timings(timings: dict[str, float | BaseException], total: float) -> None:
+    """
+    Prints the per-country wall time summary.
+
+    Args:
+        timings (dict[str, float | BaseException]): Wall time in seconds, or the raised error, per country.
+        total (float): The end-to-end wall time in seconds.
+    """
+    print(SEP)
+    print("Pipeline wall times:")
+    print(SEP)
+    for country, result in timings.items():
+        if isinstance(result, BaseException):
+            print(f"{country:10} failed: {result}")
+        else:
+            print(f"{country:10} {result:8.1f}s")
+    print(SEP)
+    print(f"{'Total':10} {total:8.1f}s")
+
+
 async def main() -> None:
     """
     Main orchestration function to download, parse, and check cameras.
@@ -115,34 +300,51 @@ async def main() -> None:
     # save_raw saves a raw json file from the API
     # save_checked saves a json file with only online cameras
     # create_html creates an html slideshow from the json file
+    # concurrent runs every country pipeline at the same time, sharing CONNECTION_BUDGET
+    # incidents_first puts the cameras watching DGT traffic alerts first in the Spanish slideshow
     default_dir = JSON_OUTPUT_DIR
     save_raw = False
     save_checked = True
     create_html = True
+    concurrent = True
+    incidents_first = True
 
-    # SPAIN
-    spain_data = await get_camera_data("Spain", save_raw, save_checked, default_dir)
-    selected_cameras = create_loop(spain_data)
-    if selected_cameras and create_html:
-        create_html_files(spain_data, HTML_OUTPUT_DIR, camera_ids=selected_cameras)
-
-    # FRANCE
-    france_data = await get_camera_data("France", save_raw, save_checked, default_dir)
-    selected_cameras = create_loop(france_data)
-    if selected_cameras and create_html:
-        create_html_files(france_data, HTML_OUTPUT_DIR, camera_ids=selected_cameras)
+    countries = ["Spain", "France", "Italy", "UK"]
+    timings: dict[str, float | BaseException] = {}
+    start = time.perf_counter()
 
-    ## ITALY
-    italy_data = await get_camera_data("Italy", save_raw, save_checked, default_dir)
-    selected_cameras = create_loop(italy_data)
-    if selected_cameras and create_html:
-        create_html_files(italy_data, HTML_OUTPUT_DIR, camera_ids=selected_cameras)
+    # All downloaders and camera checks share one pooled HTTP session
+    async with BaseDownloader.session_pool():
+        if concurrent:
+            budget = split_connection_budget(countries)
+            results = await asyncio.gather(
+                *(
+                    run_country_pipeline(
+                        country,
+                        save_raw,
+                        save_checked,
+                        create_html,
+                        default_dir,
+                        rate_limit=budget[country],
+                        incidents_first=incidents_first,
+                    )
+                    for country in countries
+                ),
+                return_exceptions=True,
+            )
+            timings = dict(zip(countries, results))
+        else:
+            for country in countries:
+                timings[country] = await run_country_pipeline(
+                    country,
+                    save_raw,
+                    save_checked,
+                    create_html,
+                    default_dir,
+                    incidents_first=incidents_first,
+                )
 
-    ## UK
-    uk_data = await get_camera_data("UK", save_raw, save_checked, default_dir)
-    selected_cameras = create_loop(uk_data)
-    if selected_cameras and create_html:
-        create_html_files(uk_data, HTML_OUTPUT_DIR, camera_ids=selected_cameras)
+    print_timings(timings, time.perf_counter() - start)
 
 
 if __name__ == "__main__":
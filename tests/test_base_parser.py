@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from Parsers.base_parser import BaseParser
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+class _Parser(BaseParser):
+    """Minimal concrete parser, only used for its merge_camera_data."""
+
+    @property
+    def country(self) -> str:
+        return "FR"
+
+    async def parse(self, raw_data: Any) -> Any:
+        return raw_data
+
+
+@pytest.fixture(scope="module")
+def recorded() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Two overlapping datasets and the merge output recorded for each option set."""
+    inputs = json.loads((DATA_DIR / "merge_camera_input.json").read_text(encoding="utf-8"))
+    expected = json.loads((DATA_DIR / "merge_camera_expected.json").read_text(encoding="utf-8"))
+    return inputs, expected
+
+
+@pytest.mark.parametrize("check_url", [False, True])
+@pytest.mark.parametrize("check_id", [False, True])
+@pytest.mark.parametrize("match_by", ["coordinates", "km_point"])
+def test_merge_matches_recorded(recorded, match_by, check_id, check_url) -> None:
+    inputs, expected = recorded
+    primary, secondary = inputs["primary"], inputs["secondary"]
+    snapshot = json.dumps(inputs)
+    options = dict(match_by=match_by, threshold=0.2, check_id=check_id, check_url=check_url)
+
+    merged = _Parser().merge_camera_data(primary, secondary, **options)
+
+    assert json.dumps(merged) == json.dumps(expected[f"{match_by}-{check_id}-{check_url}"])
+    assert json.dumps(inputs) == snapshot, "input datasets were modified"
+
+
+def test_renamed_cameras_do_not_share_input_dicts() -> None:
+    first = BaseParser.format_camera("cam", 1.0, "*", "img", 2.0, 41.0)
+    second = BaseParser.format_camera("cam", 9.0, "*", "img", 3.0, 42.0)
+    dataset = [{"highway": {"name": "A-1", "country": "FR", "cameras": [first, second]}}]
+
+    merged = _Parser().merge_camera_data(dataset, check_id=True)
+    renamed = merged[0]["highway"]["cameras"][1]
+
+    assert renamed["camera_id"] == "cam_dup1"
+    assert renamed is not second and renamed["coords"] is not second["coords"]
+    renamed["coords"]["X"] = 0.0
+    assert second == BaseParser.format_camera("cam", 9.0, "*", "img", 3.0, 42.0)
@@ -0,0 +1,139 @@
+import asyncio
+import sqlite3
+from typing import Any
+
+import pytest
+
+from Downloaders.base_downloader import BaseDownloader
+from Parsers.base_parser import BaseParser
+from tools import camera_check
+from tools.camera_health import CameraHealthStore
+from tools.diff_hash import Camera
+
+HEALTHY = 1800.0
+FAILING = 120.0
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "health" / "camera_health.sqlite3"
+
+
+@pytest.fixture
+def store(db_path):
+    with CameraHealthStore(db_path, HEALTHY, FAILING) as health_store:
+        yield health_store
+
+
+def test_schema(db_path) -> None:
+    CameraHealthStore(db_path).close()
+
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1]: row for row in conn.execute("PRAGMA table_info(camera_health)")}
+    assert list(columns) == [
+        "country",
+        "camera_id",
+        "status",
+        "dhash",
+        "consecutive_failures",
+        "last_checked",
+        "next_check",
+    ]
+    # (cid, name, type, notnull, default, primary key position)
+    primary_key = sorted((row[5], name) for name, row in columns.items() if row[5])
+    assert primary_key == [(1, "country"), (2, "camera_id")]
+    assert columns["consecutive_failures"][2:5] == ("INTEGER", 1, "0")
+
+
+def test_record_and_get_round_trip(store) -> None:
+    store.record(
+        "ES",
+        [
+            {"id": "online", "status": 200, "hash": Camera(0xABC, "online")},
+            {"id": 7, "status": None},
+        ],
+        now=1000.0,
+    )
+
+    records = store.get("ES")
+    assert set(records) == {"online", "7"}
+    online = records["online"]
+    assert (online.status, online.dhash, online.consecutive_failures) == (200, 0xABC, 0)
+    assert online.last_checked == 1000.0
+    # Spread over 0.75 to 1.25 healthy intervals
+    assert 1000.0 + 0.75 * HEALTHY <= online.next_check < 1000.0 + 1.25 * HEALTHY
+    assert records["7"][1:] == (None, None, 1, 1000.0, 1000.0 + FAILING)
+    assert store.get("FR") == {}
+
+    # Without a hash the previous one is kept, an explicit None clears it
+    store.record("ES", [{"id": "online", "status": 200}], now=2000.0)
+    assert store.get("ES")["online"].dhash == 0xABC
+    store.record("ES", [{"id": "online", "status": 200, "hash": None}], now=3000.0)
+    assert store.get("ES")["online"].dhash is None
+
+
+def test_failures_back_off_up_to_healthy_interval(store) -> None:
+    for attempt in range(1, 8):
+        store.record("ES", [{"id": "down", "status": None}], now=0.0)
+        record = store.get("ES")["down"]
+        assert record.consecutive_failures == attempt
+        assert record.next_check == min(FAILING * 2 ** (attempt - 1), HEALTHY)
+
+    store.record("ES", [{"id": "down", "status": 200}], now=0.0)
+    assert store.get("ES")["down"].consecutive_failures == 0
+
+
+def test_due_selects_unknown_and_stale_cameras(store) -> None:
+    store.record(
+        "ES", [{"id": "online", "status": 200}, {"id": "down", "status": None}], now=0.0
+    )
+    listed = ["new", "online", "down"]
+
+    assert store.due("ES", listed, now=0.0) == ["new"]
+    assert store.due("ES", listed, now=FAILING - 1) == ["new"]
+    assert store.due("ES", listed, now=FAILING) == ["new", "down"]
+    assert store.due("ES", listed, now=1.25 * HEALTHY) == ["new", "online", "down"]
+    # Other countries have their own records
+    assert store.due("FR", listed, now=0.0) == listed
+
+
+def test_reopen_keeps_records(db_path) -> None:
+    with CameraHealthStore(db_path, HEALTHY, FAILING) as first:
+        first.record("ES", [{"id": "online", "status": 200, "hash": Camera(5, "online")}], now=0.0)
+        expected = first.get("ES")
+
+    with CameraHealthStore(db_path, HEALTHY, FAILING) as reopened:
+        assert reopened.get("ES") == expected
+        assert reopened.due("ES", ["online"], now=0.0) == []
+
+
+def _camera_json() -> list[dict[str, Any]]:
+    cameras = [
+        BaseParser.format_camera(cam_id, 1.0, "*", "img", 1.0, 2.0) for cam_id in ("up", "down")
+    ]
+    return [{"highway": {"name": "A-1", "country": "ES", "cameras": cameras}}]
+
+
+def test_incremental_check_only_probes_due_cameras(monkeypatch, db_path) -> None:
+    probed: list[str] = []
+
+    async def fake_check_camera(session, source, cam_id, *args: Any) -> dict[str, Any]:
+        probed.append(cam_id)
+        return {"id": cam_id, "status": 200 if cam_id == "up" else None}
+
+    monkeypatch.setattr(camera_check, "check_camera", fake_check_camera)
+    monkeypatch.setattr(
+        camera_check, "CameraHealthStore", lambda: CameraHealthStore(db_path, HEALTHY, FAILING)
+    )
+
+    async def run() -> list[dict[str, Any]]:
+        async with BaseDownloader.session_pool():
+            return await camera_check.main(_camera_json(), download=False, incremental=True)
+
+    for expected_probes in (["down", "up"], []):
+        probed.clear()
+        checked = asyncio.run(run())
+        assert sorted(probed) == expected_probes
+        # Cameras not probed again keep their stored state
+        cameras = checked[0]["highway"]["cameras"]
+        assert [cam["camera_id"] for cam in cameras] == ["up"]
@@ -0,0 +1,132 @@
+import math
+from typing import Any
+
+import pytest
+
+from DatexParser.camera_join import CameraAlertJoin, incident_first, road_key
+from DatexParser.datex_models import LocationPoint, TruckDashboardAlert
+from Parsers.base_parser import BaseParser
+
+# Kilometers per degree of latitude, so a camera's km point is also its distance north
+KM_PER_DEGREE = 6371.0 * math.pi / 180
+
+
+def _lat(km: float) -> float:
+    return 41.0 + km / KM_PER_DEGREE
+
+
+def _camera(camera_id: str, km: float, position_km: float | None = None) -> dict[str, Any]:
+    position_km = km if position_km is None else position_km
+    return BaseParser.format_camera(camera_id, km, "*", "img", 1.0, _lat(position_km))
+
+
+CAMERA_DATA = [
+    {
+        "highway": {
+            "name": "AP-7",
+            "country": "ES",
+            "cameras": [
+                _camera("ap7-130", 130.0),
+                _camera("ap7-110", 110.0),
+                _camera("ap7-100", 100.0),
+                _camera("ap7-104", 104.0),
+                # format_camera stores a missing km point as 0.0
+                _camera("ap7-nokm", 0.0, position_km=102.5),
+            ],
+        }
+    },
+    {
+        "highway": {
+            "name": "A-2",
+            "country": "ES",
+            "cameras": [_camera("a2-104", 104.0), _camera("a2-near", 0.0, position_km=102.2)],
+        }
+    },
+]
+
+
+def _alert(
+    record_id: str, road: str | None, km_from: float, km_to: float, located: bool = True
+) -> TruckDashboardAlert:
+    def point(km: float) -> LocationPoint:
+        if not located:
+            return LocationPoint(km_point=km)
+        return LocationPoint(km_point=km, latitude=_lat(km), longitude=1.0)
+
+    return TruckDashboardAlert(
+        situation_id=record_id,
+        record_id=record_id,
+        road_name=road,
+        location_from=point(km_from),
+        location_to=point(km_to),
+    )
+
+
+def _ids(cameras: list[dict[str, Any]]) -> list[str]:
+    return [cam["camera_id"] for cam in cameras]
+
+
+def test_road_key_normalizes_names() -> None:
+    assert road_key("AP-7") == road_key("ap 7") == road_key("Ap7") == "AP7"
+
+
+def test_km_interval_hits_nearest_first_within_margin() -> None:
+    alert = _alert("a", "ap 7", 102.0, 106.0, located=False)
+
+    wide = CameraAlertJoin(CAMERA_DATA, limit=5, km_margin=5.0, radius_km=5.0)
+    assert _ids(wide.cameras_for(alert)) == ["ap7-104", "ap7-100", "ap7-110"]
+
+    narrow = CameraAlertJoin(CAMERA_DATA, limit=5, km_margin=2.0, radius_km=5.0)
+    assert _ids(narrow.cameras_for(alert)) == ["ap7-104", "ap7-100"]
+
+    assert _ids(CameraAlertJoin(CAMERA_DATA, limit=1, km_margin=5.0).cameras_for(alert)) == [
+        "ap7-104"
+    ]
+
+
+def test_coordinate_fallback_fills_remaining_slots() -> None:
+    alert = _alert("a", "AP-7", 102.0, 106.0)
+    join = CameraAlertJoin(CAMERA_DATA, limit=4, km_margin=1.0, radius_km=5.0)
+
+    # ap7-104 by km point, then by distance to the nearest endpoint:
+    # ap7-nokm 0.5 km, ap7-100 2 km, ap7-110 4 km; ap7-130 is out of range
+    assert _ids(join.cameras_for(alert)) == ["ap7-104", "ap7-nokm", "ap7-100", "ap7-110"]
+
+    join.limit = 2
+    assert _ids(join.cameras_for(alert)) == ["ap7-104", "ap7-nokm"]
+
+
+def test_cameras_on_other_roads_are_excluded() -> None:
+    join = CameraAlertJoin(CAMERA_DATA, limit=10, km_margin=5.0, radius_km=50.0)
+
+    assert _ids(join.cameras_for(_alert("a", "a 2", 102.0, 106.0))) == ["a2-104", "a2-near"]
+    assert join.cameras_for(_alert("b", "N-340", 102.0, 106.0)) == []
+    assert join.cameras_for(_alert("c", None, 102.0, 106.0)) == []
+
+
+def test_match_skips_alerts_without_cameras() -> None:
+    join = CameraAlertJoin(CAMERA_DATA, limit=1, km_margin=1.0, radius_km=5.0)
+    alerts = [_alert("a", "N-340", 102.0, 106.0), _alert("b", "AP-7", 102.0, 106.0)]
+
+    matches = join.match(alerts)
+
+    assert list(matches) == [("b", "b")]
+    assert _ids(matches["b", "b"]) == ["ap7-104"]
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [
+        (None, ["c3", "c1", "c9", "c2", "c4"]),
+        (2, ["c3", "c1", "c2", "c4", "c9"]),
+        (0, ["c1", "c2", "c3", "c4", "c9"]),
+    ],
+)
+def test_incident_first_deduplicates_and_limits(limit, expected) -> None:
+    matches = {
+        ("s1", "r1"): [{"camera_id": "c3"}, {"camera_id": "c1"}],
+        ("s2", "r2"): [{"camera_id": "c1"}, {"camera_id": "c9"}],
+    }
+    slideshow = ["c1", "c2", "c3", "c4", "c9"]
+
+    assert incident_first(slideshow, matches, limit) == expected
@@ -0,0 +1,79 @@
+import copy
+import json
+import math
+
+import pytest
+
+from tools.camera_table import CameraTable
+
+
+def _camera(camera_id: str, km: float, x: float | None, y: float | None) -> dict:
+    return {
+        "camera_id": camera_id,
+        "camera_km_point": km,
+        "camera_view": "N",
+        "camera_type": "img",
+        "coords": {"X": x, "Y": y},
+    }
+
+
+DATA = [
+    {
+        "highway": {
+            "name": "A-1",
+            "country": "ES",
+            "cameras": [
+                _camera("1", 10.5, -3.7, 40.4),
+                _camera("2", 12.0, None, None),
+                {**_camera("3", 15.0, -3.6, 40.5), "url": "https://example.com/3.jpg"},
+                # camera_km_point missing
+                {
+                    "camera_id": "4",
+                    "camera_view": "S",
+                    "camera_type": "vid",
+                    "coords": {"X": -3.5, "Y": 40.6},
+                },
+                # camera_km_point as int
+                {**_camera("5", 0.0, -3.4, 40.7), "camera_km_point": 20},
+                # coords missing
+                {
+                    "camera_id": "6",
+                    "camera_km_point": 21.5,
+                    "camera_view": "N",
+                    "camera_type": "img",
+                },
+                # km point and coords missing
+                {"camera_id": 7, "camera_type": "img"},
+            ],
+        }
+    },
+    {"highway": {"name": "A-2", "country": "ES", "cameras": []}},
+    {"highway": {"cameras": [_camera("8", 1.0, 2.0, 3.0)], "name": "M25"}},
+]
+
+
+def test_round_trip_matches_input() -> None:
+    data = copy.deepcopy(DATA)
+    table = CameraTable(data)
+
+    exported = table.to_json()
+    assert exported == DATA
+    # Key order is part of the output format
+    assert json.dumps(exported) == json.dumps(DATA)
+    assert data == DATA
+
+
+def test_columns_hold_missing_values_as_nan() -> None:
+    table = CameraTable(DATA)
+
+    assert len(table) == 8
+    assert table.camera_counts() == [("A-1", 7), ("A-2", 0), ("M25", 1)]
+    assert table.km[[0, 1, 2, 4, 7]].tolist() == [10.5, 12.0, 15.0, 20.0, 1.0]
+    assert all(map(math.isnan, (table.km[3], table.x[1], table.x[5], table.km[6])))
+
+
+def test_rejects_entry_without_camera_list() -> None:
+    with pytest.raises(TypeError):
+        CameraTable([{"highway": {"name": "A-1", "country": "ES"}}])
+    with pytest.raises(TypeError):
+        CameraTable(["A-1"])
@@ -0,0 +1,94 @@
+import itertools
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from DatexParser.datex_filter import FilterConfig, FilterResult, HeuristicFilter
+from DatexParser.datex_models import AlertConfidence, TruckDashboardAlert
+
+NOW = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
+CONFIG = FilterConfig(suspicious_threshold=0.75)
+
+CAUSES = [
+    None, "accident", "Accident", "vehicleObstruction", "obstruction",
+    "roadMaintenance", "infrastructureDamageObstruction", "poorWeatherConditions",
+]
+SEVERITIES = [None, "", "low", "Low", "medium", "high", "highest", "HIGHEST"]
+MANAGEMENTS = [None, "roadClosed", "roadclosed", "laneClosures", "narrowLanes", "narrowlanes"]
+TIMEZONES = [UTC, timezone(timedelta(hours=2)), timezone(timedelta(hours=-5, minutes=-30))]
+
+
+def _ages() -> list[timedelta | None]:
+    """Missing, future, recent and old ages, and ages exactly on every TTL boundary."""
+    ages: list[timedelta | None] = [
+        None, timedelta(days=-3), timedelta(hours=1), timedelta(days=400), timedelta(days=5000),
+    ]
+    ttls = (
+        CONFIG.transient_ttl_days,
+        CONFIG.roadworks_ttl_days,
+        CONFIG.infrastructure_ttl_days,
+        CONFIG.low_severity_ttl_days,
+        CONFIG.transient_ttl_days + CONFIG.highest_road_closed_bonus,
+    )
+    for ttl in ttls:
+        for factor in (CONFIG.suspicious_threshold, 1.0):
+            boundary = timedelta(days=ttl * factor)
+            ages += [boundary - timedelta(microseconds=1), boundary, boundary + timedelta(microseconds=1)]
+    return ages
+
+
+def make_alerts() -> list[TruckDashboardAlert]:
+    alerts = []
+    combinations = itertools.product(CAUSES, SEVERITIES, MANAGEMENTS, _ages())
+    for i, (cause, severity, management, age) in enumerate(combinations):
+        tz = TIMEZONES[i % len(TIMEZONES)]
+        reference = None if age is None else (NOW - age).astimezone(tz)
+        # Age from version_time, or from start_time when there is no version_time
+        from_version = i % 4 != 0
+        alerts.append(
+            TruckDashboardAlert(
+                situation_id=f"SIT{i}",
+                record_id=f"SIT{i}_R0",
+                cause_type=cause,
+                severity=severity,
+                management_type=management,
+                version_time=reference if from_version else None,
+                start_time=(NOW - timedelta(days=i % 7)).astimezone(tz) if from_version else reference,
+            )
+        )
+    return alerts
+
+
+def _summary(result: FilterResult) -> tuple[list[str], list[str], int]:
+    return (
+        [a.record_id for a in result.active],
+        [a.record_id for a in result.suspicious],
+        result.dropped_count,
+    )
+
+
+@pytest.mark.parametrize("now", [NOW, NOW.astimezone(timezone(timedelta(hours=9)))])
+def test_vectorized_filter_matches_scalar(now: datetime) -> None:
+    heuristic = HeuristicFilter(CONFIG)
+    alerts = make_alerts()
+
+    scalar = heuristic.filter(alerts, vectorized=False, now=now)
+    batch = heuristic.filter(alerts, vectorized=True, now=now)
+    replay = heuristic.filter(alerts, now=now, columns=heuristic.columns(alerts))
+
+    assert _summary(batch) == _summary(scalar)
+    assert _summary(replay) == _summary(scalar)
+    # Every confidence bucket is exercised
+    assert {heuristic._classify(a, now) for a in alerts} == set(AlertConfidence)
+
+
+def test_naive_times_are_rejected_by_both_paths() -> None:
+    naive = NOW.replace(tzinfo=None) - timedelta(days=10)
+    alert = TruckDashboardAlert.model_construct(
+        situation_id="SIT", record_id="SIT_R0", version_time=naive, start_time=naive
+    )
+    heuristic = HeuristicFilter(CONFIG)
+    with pytest.raises(TypeError):
+        heuristic.filter([alert], vectorized=False, now=NOW)
+    with pytest.raises(TypeError):
+        heuristic.filter([alert], vectorized=True, now=NOW)
@@ -0,0 +1,72 @@
+import math
+import random
+
+from DatexParser.datex_index import AttributeIndex, LocationIndex
+from DatexParser.datex_models import LocationPoint, TruckDashboardAlert
+from tools.utils import haversine_km
+
+ROADS = ["AP-7", "A-7", "N-340", None, "ap-7", "A-70", "Vía Augusta"]
+
+
+def _index() -> AttributeIndex:
+    return AttributeIndex(
+        [
+            TruckDashboardAlert(situation_id=str(i), record_id=str(i), road_name=road)
+            for i, road in enumerate(ROADS)
+        ]
+    )
+
+
+def _scan(predicate) -> list[int]:
+    return [i for i, road in enumerate(ROADS) if road and predicate(road.casefold())]
+
+
+def test_road_lookups() -> None:
+    index = _index()
+    assert index.road("AP-7") == [0]
+    assert index.road_prefix("ap-") == _scan(lambda road: road.startswith("ap-"))
+    assert index.road_substring("7") == _scan(lambda road: "7" in road)
+    assert index.road_substring("-7") == [0, 1, 4, 5]
+    assert index.road_substring("VIA") == [6]
+    assert index.road_substring("missing") == []
+
+
+def _point(lat: float | None, lon: float | None) -> LocationPoint:
+    return LocationPoint(latitude=lat, longitude=lon)
+
+
+def test_location_index_matches_scalar_scan() -> None:
+    rng = random.Random(0)
+    alerts = []
+    for i in range(2000):
+        point = _point(rng.uniform(36.0, 44.0), rng.uniform(-9.5, 3.5))
+        other = rng.choice([None, _point(None, 1.0), _point(math.nan, 1.0), _point(40.0, math.nan), point])
+        alerts.append(
+            TruckDashboardAlert(situation_id=str(i), record_id=str(i), location_from=point, location_to=other)
+        )
+    index = LocationIndex(alerts)
+    assert len(index) == sum(
+        1
+        for a in alerts
+        for p in (a.location_from, a.location_to)
+        if p is not None and p.latitude is not None and p.longitude is not None
+        and math.isfinite(p.latitude) and math.isfinite(p.longitude)
+    )
+
+    def scan(lat: float, lon: float, radius_km: float) -> list[int]:
+        return [
+            i
+            for i, a in enumerate(alerts)
+            if any(
+                p is not None and p.latitude is not None and p.longitude is not None
+                and haversine_km(lat, lon, p.latitude, p.longitude) <= radius_km
+                for p in (a.location_from, a.location_to)
+            )
+        ]
+
+    for _ in range(200):
+        lat, lon = rng.uniform(36.0, 44.0), rng.uniform(-9.5, 3.5)
+        target = rng.choice(alerts).location_from
+        # Radii exactly on an endpoint's distance, where batch and scalar trig may round differently
+        for radius in (rng.uniform(0, 300), haversine_km(lat, lon, target.latitude, target.longitude)):
+            assert index.query(lat, lon, radius) == scan(lat, lon, radius)
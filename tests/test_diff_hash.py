@@ -0,0 +1,63 @@
+import random
+
+import pybktree
+import pytest
+
+from tools import diff_hash
+from tools.diff_hash import Camera
+
+
+def _hashes(seed: int) -> list[Camera]:
+    """Random 128-bit hashes, with near and exact duplicates of some of them."""
+    rng = random.Random(seed)
+    cameras = [Camera(rng.getrandbits(128), f"cam{i}") for i in range(300)]
+    for i in range(150):
+        base = rng.choice(cameras)
+        bits = base.bits
+        for bit in rng.sample(range(128), rng.randint(0, 10)):
+            bits ^= 1 << bit
+        cameras.append(Camera(bits, f"near{i}"))
+    for i in range(20):
+        cameras.append(Camera(rng.choice(cameras).bits, f"exact{i}"))
+    rng.shuffle(cameras)
+    return cameras
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+@pytest.mark.parametrize("max_distance", [0, 1, diff_hash.MAX_HASH_DISTANCE])
+def test_vectorized_matches_bktree(monkeypatch, seed, max_distance) -> None:
+    cameras = _hashes(seed)
+    monkeypatch.setattr(diff_hash, "MAX_HASH_DISTANCE", max_distance)
+    tree = pybktree.BKTree(diff_hash.item_distance, cameras)
+
+    expected = diff_hash.get_duplicates(tree, cameras)
+
+    assert expected
+    assert diff_hash.get_duplicates_vectorized(cameras) == expected
+    assert diff_hash.find_duplicates(cameras, vectorized=True) == expected
+    assert diff_hash.find_duplicates(cameras, vectorized=False) == expected
+
+
+@pytest.mark.parametrize("max_distance", [0, 1, diff_hash.MAX_HASH_DISTANCE])
+def test_hash_neighbours_match_bktree(max_distance) -> None:
+    cameras = _hashes(2)
+    tree = pybktree.BKTree(diff_hash.item_distance, cameras)
+
+    neighbours = diff_hash.get_hash_neighbours(cameras, max_distance)
+
+    for index, cam in enumerate(cameras):
+        expected = sorted(
+            (distance, match.id)
+            for distance, match in tree.find(cam, max_distance)
+            if match is not cam
+        )
+        got = sorted((distance, cameras[j].id) for distance, j in neighbours[index])
+        assert got == expected
+
+
+def test_exact_duplicates_only_at_distance_zero(monkeypatch) -> None:
+    cameras = [Camera(5, "a"), Camera(5, "b"), Camera(7, "c"), Camera(1 << 100, "d")]
+    monkeypatch.setattr(diff_hash, "MAX_HASH_DISTANCE", 0)
+
+    assert diff_hash.find_duplicates(cameras) == {"a", "b"}
+    assert diff_hash.find_duplicates(cameras, vectorized=False) == {"a", "b"}
@@ -0,0 +1,114 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from tools import host_limiter
+from tools.host_limiter import HostConcurrencyController, _HostState
+
+
+def _response_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(None, (), status=status)
+
+
+def test_slow_start_then_additive_increase() -> None:
+    state = _HostState(initial=4, min_limit=1, max_limit=100)
+
+    # +1 per success during slow start
+    for expected in (5, 6, 7, 8):
+        state.on_success(0.1)
+        assert state.limit == expected
+
+    state.on_congestion(0.0)
+    assert not state.slow_start
+    assert state.limit == 4
+    # About +1 per window of successes afterwards
+    for _ in range(4):
+        state.on_success(0.1)
+    assert 4.9 < state.limit < 5.0
+    state.on_success(0.1)
+    assert int(state.limit) == 5
+
+
+def test_slow_responses_stop_the_increase() -> None:
+    state = _HostState(initial=4, min_limit=1, max_limit=100)
+    state.on_success(0.1)
+
+    state.on_success(0.1 * host_limiter.HOST_LATENCY_TOLERANCE + 0.01)
+    assert state.limit == 5
+    state.on_success(0.1 * host_limiter.HOST_LATENCY_TOLERANCE)
+    assert state.limit == 6
+
+
+def test_multiplicative_decrease_once_per_latency_window() -> None:
+    state = _HostState(initial=32, min_limit=1, max_limit=100)
+
+    state.on_congestion(0.0)
+    assert state.limit == 32 * host_limiter.HOST_BACKOFF_FACTOR
+    # Requests in flight at the same time fail together, only the first one backs off
+    state.on_congestion(60.0)
+    assert state.limit == 32 * host_limiter.HOST_BACKOFF_FACTOR
+    state.on_congestion(0.0)
+    assert state.limit == 32 * host_limiter.HOST_BACKOFF_FACTOR**2
+    assert (state.backoffs, state.requests) == (2, 3)
+
+
+def test_window_stays_within_bounds() -> None:
+    assert _HostState(initial=50, min_limit=2, max_limit=10).limit == 10
+    assert _HostState(initial=0, min_limit=2, max_limit=10).limit == 2
+
+    state = _HostState(initial=4, min_limit=2, max_limit=10)
+    for _ in range(50):
+        state.on_success(0.1)
+    assert state.limit == 10
+    assert state.peak == 10
+    for _ in range(10):
+        state.on_congestion(0.0)
+    assert state.limit == 2
+
+
+@pytest.mark.parametrize(
+    ("error", "congestion"),
+    [
+        (TimeoutError(), True),
+        (aiohttp.ServerDisconnectedError(), True),
+        (_response_error(429), True),
+        (_response_error(503), True),
+        (_response_error(404), False),
+        (ValueError("invalid content"), False),
+    ],
+)
+def test_slot_classifies_errors(error, congestion) -> None:
+    async def run() -> HostConcurrencyController:
+        controller = HostConcurrencyController(max_limit=16, initial=8)
+        with pytest.raises(type(error)):
+            async with controller.slot("https://cams.example/1.jpg"):
+                raise error
+        return controller
+
+    controller = asyncio.run(run())
+    assert controller.limits() == {"cams.example": 4 if congestion else 8}
+
+
+def test_slot_limits_concurrency_per_host() -> None:
+    async def run() -> tuple[int, int]:
+        controller = HostConcurrencyController(max_limit=2, initial=2)
+        in_flight = peak = 0
+
+        async def request(url: str) -> None:
+            nonlocal in_flight, peak
+            async with controller.slot(url):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request(f"https://a.example/{i}") for i in range(6)))
+        single_host_peak = peak
+        peak = 0
+        await asyncio.gather(
+            *(request(f"https://{host}.example/{i}") for host in "ab" for i in range(6))
+        )
+        return single_host_peak, peak
+
+    assert asyncio.run(run()) == (2, 4)
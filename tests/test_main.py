@@ -0,0 +1,78 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from DatexParser.datex_models import TruckDashboardAlert
+from main import (
+    CONNECTION_BUDGET,
+    COUNTRY_RATE_LIMITS,
+    alert_priority,
+    split_connection_budget,
+)
+
+NOW = datetime(2026, 1, 15, 12, tzinfo=UTC)
+
+
+def _alert(record_id: str, severity: str | None, age_h: float | None) -> TruckDashboardAlert:
+    version_time = None if age_h is None else NOW - timedelta(hours=age_h)
+    return TruckDashboardAlert(
+        situation_id=record_id, record_id=record_id, severity=severity, version_time=version_time
+    )
+
+
+def test_alert_priority_most_severe_then_newest_first() -> None:
+    alerts = [
+        _alert("low-new", "low", 0),
+        _alert("high-old", "high", 10),
+        _alert("high-untimed", "High", None),
+        _alert("unknown", None, 1),
+        _alert("highest-old", "highest", 48),
+        _alert("high-new", "high", 1),
+        _alert("medium", "medium", 2),
+    ]
+    ordered = [a.record_id for a in sorted(alerts, key=alert_priority, reverse=True)]
+    assert ordered == [
+        "highest-old",
+        "high-new",
+        "high-old",
+        "high-untimed",
+        "medium",
+        "low-new",
+        "unknown",
+    ]
+
+
+def test_split_connection_budget_keeps_rate_limits_that_fit() -> None:
+    countries = list(COUNTRY_RATE_LIMITS)
+    total = sum(COUNTRY_RATE_LIMITS.values())
+    assert split_connection_budget(countries, total) == COUNTRY_RATE_LIMITS
+    assert split_connection_budget(countries, total * 2) == COUNTRY_RATE_LIMITS
+
+
+def test_split_connection_budget_shrinks_proportionally() -> None:
+    countries = list(COUNTRY_RATE_LIMITS)
+    shares = split_connection_budget(countries, sum(COUNTRY_RATE_LIMITS.values()) // 2)
+    assert sum(shares.values()) <= sum(COUNTRY_RATE_LIMITS.values()) // 2
+    for country, share in shares.items():
+        assert 1 <= share <= COUNTRY_RATE_LIMITS[country]
+
+
+def test_split_connection_budget_stays_within_budget() -> None:
+    countries = list(COUNTRY_RATE_LIMITS)
+    for budget in range(len(countries), sum(COUNTRY_RATE_LIMITS.values()) + 1):
+        shares = split_connection_budget(countries, budget)
+        assert sum(shares.values()) <= budget
+        for country, share in shares.items():
+            assert 1 <= share <= COUNTRY_RATE_LIMITS[country]
+    assert split_connection_budget(countries, 4) == dict.fromkeys(countries, 1)
+
+
+def test_split_connection_budget_rejects_less_than_one_per_country() -> None:
+    with pytest.raises(ValueError):
+        split_connection_budget(list(COUNTRY_RATE_LIMITS), 3)
+
+
+def test_default_budget_constrains_concurrent_run() -> None:
+    countries = list(COUNTRY_RATE_LIMITS)
+    assert CONNECTION_BUDGET < sum(COUNTRY_RATE_LIMITS.values())
+    assert sum(split_connection_budget(countries).values()) <= CONNECTION_BUDGET
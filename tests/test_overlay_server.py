@@ -0,0 +1,67 @@
+import asyncio
+import socket
+
+import aiohttp
+
+from DatexParser.overlay_server import _CLIENT_QUEUE_SIZE, OverlayServer
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_clients(server: OverlayServer, count: int) -> None:
+    for _ in range(200):
+        if server.clients == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{server.clients} clients connected, expected {count}")
+
+
+def test_stop_with_full_client_queue() -> None:
+    async def run() -> None:
+        server = OverlayServer(port=_free_port())
+        await server.start()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(_CLIENT_QUEUE_SIZE)
+        for _ in range(_CLIENT_QUEUE_SIZE):
+            queue.put_nowait(b"data: stale\n\n")
+        server._clients.add(queue)
+
+        await server.stop()
+
+        assert server.clients == 0
+        assert server._runner is None
+        assert queue.get_nowait() is None
+
+    asyncio.run(run())
+
+
+def test_clients_are_removed_on_disconnect_and_stop() -> None:
+    async def run() -> None:
+        port = _free_port()
+        server = OverlayServer(port=port, keepalive_s=0.05)
+        await server.start()
+        server.publish({"alerts": []})
+        url = f"http://127.0.0.1:{port}/events"
+        try:
+            async with aiohttp.ClientSession() as session:
+                # A client that goes away is dropped on the next write
+                response = await session.get(url)
+                await response.content.readline()
+                await _wait_for_clients(server, 1)
+                response.close()
+                await _wait_for_clients(server, 0)
+
+                # Stopping ends the streams of connected clients
+                response = await session.get(url)
+                await _wait_for_clients(server, 1)
+                await server.stop()
+                assert server.clients == 0
+                assert await asyncio.wait_for(response.content.read(), 5)
+                response.close()
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
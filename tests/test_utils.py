@@ -0,0 +1,118 @@
+import datetime
+import enum
+import json
+import math
+import uuid
+
+import numpy as np
+import pytest
+
+import tools.utils as utils
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+CASES = {
+    "nested": {"a": [{"b": None, "c": True, "d": 1.5}], "é": "ü"},
+    "non_finite": [math.nan, {"a": -math.inf}, np.float64("nan")],
+    "big_int": [2**70, np.float64(1.5)],
+    "enum_uuid": [Color.RED, uuid.UUID(int=5)],
+    "non_str_keys": {
+        2: 1,
+        math.inf: 3,
+        Color.RED: 4,
+        uuid.UUID(int=5): 5,
+        datetime.datetime(2020, 1, 1, 5, 6, 7, 123, tzinfo=datetime.UTC): 6,
+    },
+    "datetime_value": [math.nan, datetime.date(2020, 1, 1)],
+    "numpy_array": {"a": np.arange(2)},
+}
+
+
+def _dump(json_data, compact):
+    try:
+        return utils.dump_json(json_data, compact)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.skipif(utils.orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("name", CASES)
+def test_dump_json_backends_match(monkeypatch, name, compact) -> None:
+    expected = _dump(CASES[name], compact)
+    monkeypatch.setattr(utils, "orjson", None)
+    assert _dump(CASES[name], compact) == expected
+
+
+def test_dump_json_pretty_output_is_indented_by_4_spaces() -> None:
+    data = {"a": [{"b": "line\n  indented", "c": []}, {}], "d": {"e": [1, [2]]}}
+    expected = json.dumps(data, ensure_ascii=False, indent=4).encode()
+    assert utils.dump_json(data) == expected
+
+
+def _random_points(rng: np.random.Generator, count: int) -> tuple[np.ndarray, np.ndarray]:
+    return rng.uniform(-89.0, 89.0, count), rng.uniform(-180.0, 180.0, count)
+
+
+def test_haversine_km_many_matches_scalar() -> None:
+    lats, lons = _random_points(np.random.default_rng(0), 50)
+    lats[3] = np.nan
+
+    distances = utils.haversine_km_many(40.4, -3.7, lats.tolist(), lons.tolist())
+
+    assert distances.shape == (50,)
+    assert math.isnan(distances[3])
+    for i in set(range(50)) - {3}:
+        assert distances[i] == pytest.approx(utils.haversine_km(40.4, -3.7, lats[i], lons[i]))
+    assert utils.haversine_km_many(40.4, -3.7, [40.4], [-3.7])[0] == 0.0
+
+
+@pytest.mark.parametrize("block_elements", [1, 7, 21, 1_000_000])
+def test_haversine_km_blocks_cover_every_pair(block_elements) -> None:
+    rng = np.random.default_rng(1)
+    lats1, lons1 = _random_points(rng, 10)
+    lats2, lons2 = _random_points(rng, 7)
+
+    rows = []
+    for start, block in utils.haversine_km_blocks(lats1, lons1, lats2, lons2, block_elements):
+        assert start == len(rows)
+        assert block.shape[1] == 7
+        rows.extend(block)
+
+    # 7 columns per row: 21 elements give blocks of 3 rows, which don't divide the 10 rows
+    assert len(rows) == 10
+    for i, row in enumerate(rows):
+        for j, distance in enumerate(row):
+            assert distance == pytest.approx(utils.haversine_km(lats1[i], lons1[i], lats2[j], lons2[j]))
+
+
+@pytest.mark.parametrize("block_elements", [5, 1_000_000])
+def test_nearest_km_matches_scalar(block_elements) -> None:
+    rng = np.random.default_rng(2)
+    lats, lons = _random_points(rng, 12)
+    ref_lats, ref_lons = _random_points(rng, 5)
+    lats[0] = np.nan
+    ref_lats[1] = np.nan
+
+    indexes, distances = utils.nearest_km(lats, lons, ref_lats, ref_lons, block_elements)
+
+    assert (indexes[0], distances[0]) == (-1, math.inf)
+    for i in range(1, 12):
+        expected = [
+            utils.haversine_km(lats[i], lons[i], ref_lats[j], ref_lons[j]) if j != 1 else math.inf
+            for j in range(5)
+        ]
+        assert indexes[i] == expected.index(min(expected))
+        assert distances[i] == pytest.approx(min(expected))
+
+
+def test_nearest_km_without_reference_points() -> None:
+    indexes, distances = utils.nearest_km([40.0, 41.0], [-3.0, -4.0], [], [])
+    assert indexes.tolist() == [-1, -1]
+    assert distances.tolist() == [math.inf, math.inf]
+
+    indexes, distances = utils.nearest_km([40.0], [-3.0], [math.nan], [math.nan])
+    assert (indexes.tolist(), distances.tolist()) == ([-1], [math.inf])
@@ -1,4 +1,6 @@
 import asyncio
+import contextlib
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -6,15 +8,23 @@ import aiohttp
 import winloop
 from tqdm.asyncio import tqdm
 
-from tools.utils import load_json, create_url, save_json, get_country
+from tools.utils import atomic_write, load_json, create_url, save_json, get_country
+from tools.camera_health import CameraHealthStore
+from tools.host_limiter import HostConcurrencyController
 import tools.diff_hash as diff_hash
-from Downloaders.base_downloader import GenericDownloader, HTTPError
+from Downloaders.base_downloader import BaseDownloader, GenericDownloader, HTTPError
 from config import CONSTANTS
 
 SEP: str = CONSTANTS.COMMON.SEPARATOR
 DEFAULT_RATE_LIMIT: int = CONSTANTS.COMMON.RATE_LIMIT
 JSON_OUTPUT_DIR: Path = CONSTANTS.COMMON.DATA_DIR
 IMAGE_DIR: Path = CONSTANTS.COMMON.IMG_DIR
+VIDEO_EXTENSIONS: tuple[str] = CONSTANTS.COMMON.VIDEO_EXTENSIONS
+DEBUG_IMAGES: bool = CONSTANTS.COMMON.DEBUG_IMAGES
+INCREMENTAL_CHECK: bool = CONSTANTS.COMMON.INCREMENTAL_CHECK
+PROBE_MIN_BYTES: int = CONSTANTS.COMMON.PROBE_MIN_BYTES
+VIDEO_PROBE_BYTES: int = CONSTANTS.COMMON.VIDEO_PROBE_BYTES
+PROBE_DRAIN_BYTES: int = CONSTANTS.COMMON.PROBE_DRAIN_BYTES
 
 
 async def save_image(
@@ -31,7 +41,65 @@ async def save_image(
     """
     filename = f"{camera_id}{ext}"
     file_path = output_dir / filename
-    await asyncio.to_thread(file_path.write_bytes, img_bytes)
+    # Atomic, so the slideshow never shows a half-written image
+    await asyncio.to_thread(atomic_write, file_path, img_bytes, durable=False)
+
+
+class ConnectionReuse:
+    """
+    Counts the connections opened and reused by a session, through an aiohttp trace config.
+    """
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    async def _on_create(self, *_: Any) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, *_: Any) -> None:
+        self.reused += 1
+
+
+async def read_probe(
+    response: aiohttp.ClientResponse, limit: int | None
+) -> tuple[bytes, bool]:
+    """
+    Reads a response body, or only its first bytes.
+    When the body is longer than `limit`, the rest is read anyway if its Content-Length is at most
+    PROBE_DRAIN_BYTES, so the connection can be reused. Otherwise the connection is closed and the
+    rest is never downloaded.
+
+    Args:
+        response (aiohttp.ClientResponse): The response to read.
+        limit (int | None): The maximum number of bytes to read, None reads the full body.
+
+    Returns:
+        tuple[bytes, bool]: The bytes read, and whether the body was cut short.
+    """
+    if limit is None:
+        return await response.read(), False
+
+    chunks: list[bytes] = []
+    size = 0
+    while size < limit:
+        chunk = await response.content.read(limit - size)
+        if not chunk:
+            return b"".join(chunks), False
+        chunks.append(chunk)
+        size += len(chunk)
+
+    if response.content.at_eof():
+        return b"".join(chunks), False
+    content_length = response.content_length
+    if content_length is not None and content_length <= PROBE_DRAIN_BYTES:
+        chunks.append(await response.content.read())
+        return b"".join(chunks), False
+    response.close()
+    return b"".join(chunks), True
 
 
 def get_camera_data(json_data: list[dict[str, Any]]) -> list[Any]:
@@ -70,6 +138,9 @@ async def check_camera(
     rate_limiter: asyncio.Semaphore,
     download: bool = True,
     output_dir: Path | None = None,
+    hash_executor: Executor | None = None,
+    host_limiter: HostConcurrencyController | None = None,
+    probe: bool = True,
 ) -> dict[str, Any]:
     """
     Checks the status of a single camera and optionally downloads its latest image/video.
@@ -79,18 +150,44 @@ async def check_camera(
         source (str): The country code.
         camera_id (str | int): The camera identifier.
         camera_type (str): The camera type or URL.
-        rate_limiter (asyncio.Semaphore): Concurrency limit semaphore.
-        download (bool): Whether to download the media to disk. Defaults to True.
+        rate_limiter (asyncio.Semaphore): Overall concurrency limit semaphore.
+        download (bool): Whether to keep the downloaded media for duplicate checks. Defaults to True.
         output_dir (Path | None, optional): Directory to save downloaded media. Defaults to None.
+        hash_executor (Executor | None, optional): Worker pool hashing the media in memory,
+            the result is returned under 'hash'. Defaults to None.
+        host_limiter (HostConcurrencyController | None, optional): Adaptive per-host concurrency
+            limiter, fed with the outcome of the request. Defaults to None.
+        probe (bool, optional): Whether to only read as much of the body as needed: PROBE_MIN_BYTES
+            for a liveness check, VIDEO_PROBE_BYTES to hash a video's first frame. Images are
+            always read in full when downloading, and a video is downloaded again in full when
+            its first frame can't be decoded from the probe. Defaults to True.
 
     Returns:
-        dict[str, Any]: A dictionary containing the camera 'id' and 'status' (HTML response code or False if failed).
+        dict[str, Any]: A dictionary containing the camera 'id' and 'status' (HTML response code or False if failed),
+            the 'len' of the body read, its 'content_length' (None if unknown), whether it was
+            'truncated', and its 'hash' (diff_hash.Camera | None) when hashing, with 'retried' set
+            when the full body had to be downloaded to hash it.
     """
 
     def _validate_response(bytes_: bytes) -> None:
-        if len(bytes_) < 1000:
+        if len(bytes_) < PROBE_MIN_BYTES:
             raise HTTPError(f"Response too small: {len(bytes_)} bytes")
 
+    async def _get(limit: int | None) -> tuple[int, int | None, bool]:
+        nonlocal response_bytes
+        # The host slot is taken first so requests queued for a throttled host don't hold overall slots,
+        # errors are raised inside it so the host limiter sees them
+        host_slot = host_limiter.slot(url) if host_limiter else contextlib.nullcontext()
+        async with host_slot as timer, rate_limiter:
+            if timer is not None:
+                # Waiting for an overall slot isn't part of the host's latency
+                timer.restart()
+            async with client.get(url, allow_redirects=True) as response:
+                response.raise_for_status()
+                response_bytes, truncated = await read_probe(response, limit)
+                _validate_response(response_bytes)
+                return response.status, response.content_length, truncated
+
     if source != "IT":
         # Create the URL based on the source and camera type
         url, ext = create_url(source, camera_id, camera_type)
@@ -98,24 +195,90 @@ async def check_camera(
         # Special case for Italy where urls are in the data directly
         url = camera_type
         ext = CONSTANTS.ITALY.VIDEO_EXT
-
-    async with rate_limiter:
-        response_bytes = b""
-        try:
-            async with client.get(url, allow_redirects=True) as response:
-                response.raise_for_status()
-                response_bytes = await response.read()
-                status_code = response.status
-                _validate_response(response_bytes)
-
-            if not download:
-                return {"id": camera_id, "status": status_code}
+    is_video = (ext or "").lower() in VIDEO_EXTENSIONS
+
+    probe_limit = None
+    if probe and not download:
+        probe_limit = PROBE_MIN_BYTES
+    elif probe and is_video:
+        probe_limit = max(VIDEO_PROBE_BYTES, PROBE_MIN_BYTES)
+
+    response_bytes = b""
+    try:
+        status_code, content_length, truncated = await _get(probe_limit)
+    except TimeoutError, HTTPError, aiohttp.ClientError, aiohttp.ClientPayloadError:
+        return {"id": camera_id, "status": False, "len": len(response_bytes)}
+
+    # The connection slot is released, downloads keep running while this camera is processed
+    result: dict[str, Any] = {
+        "id": camera_id,
+        "status": status_code,
+        "len": len(response_bytes),
+        "content_length": content_length,
+        "truncated": truncated,
+    }
+    if not download:
+        return result
+    if hash_executor is not None:
+        loop = asyncio.get_running_loop()
+        cam_hash = await loop.run_in_executor(
+            hash_executor, diff_hash.get_bytes_hash, camera_id, response_bytes, is_video
+        )
+        if cam_hash is None and truncated:
+            # The first frame may need data past the probe, e.g. an MP4 with its moov atom at the end
+            result["retried"] = True
+            try:
+                await _get(None)
+            except TimeoutError, HTTPError, aiohttp.ClientError, aiohttp.ClientPayloadError:
+                pass
             else:
-                if output_dir:
-                    await save_image(camera_id, ext or "", response_bytes, output_dir)
-                return {"id": camera_id, "status": status_code}
-        except TimeoutError, HTTPError, aiohttp.ClientError, aiohttp.ClientPayloadError:
-            return {"id": camera_id, "status": False, "len": len(response_bytes)}
+                result["len"] += len(response_bytes)
+                result["truncated"] = False
+                cam_hash = await loop.run_in_executor(
+                    hash_executor, diff_hash.get_bytes_hash, camera_id, response_bytes, is_video
+                )
+        result["hash"] = cam_hash
+    if output_dir:
+        await save_image(camera_id, ext or "", response_bytes, output_dir)
+    return result
+
+
+def print_probe_savings(
+    source: str,
+    results: list[dict[str, Any]],
+    connections: ConnectionReuse | None = None,
+) -> None:
+    """
+    Prints how much was downloaded by the probes and how much full downloads would have added,
+    based on the Content-Length of the responses, and how the probes affected connection reuse.
+
+    Args:
+        source (str): The country code.
+        results (list[dict[str, Any]]): The check_camera results.
+        connections (ConnectionReuse | None, optional): The connection counters of the session
+            used for the checks. Defaults to None.
+    """
+    read_bytes = sum(res.get("len", 0) for res in results)
+    known = [res for res in results if res.get("content_length") is not None]
+    saved_bytes = sum(max(0, res["content_length"] - res["len"]) for res in known)
+    unknown = sum(1 for res in results if res["status"]) - len(known)
+    print(
+        f"{source}: probes read {read_bytes / 1e6:.1f} MB, "
+        f"saved {saved_bytes / 1e6:.1f} MB compared with full downloads"
+        + (f" ({unknown} responses without Content-Length)" if unknown else "")
+        + "."
+    )
+    closed = sum(1 for res in results if res.get("truncated"))
+    retried = sum(1 for res in results if res.get("retried"))
+    line = f"{source}: {closed} connections closed by probes, {retried} videos downloaded again in full"
+    if connections is not None:
+        total = connections.created + connections.reused
+        reuse_percent = connections.reused / total * 100 if total else 0.0
+        line += (
+            f", {connections.created} connections opened, "
+            f"{connections.reused} reused ({reuse_percent:.1f}%)"
+        )
+    print(line + ".")
 
 
 def remove_offline_cameras(
@@ -164,6 +327,10 @@ async def main(
     save_file: bool = False,
     output_dir: Path = JSON_OUTPUT_DIR,
     image_dir: Path = IMAGE_DIR,
+    stream_hash: bool = True,
+    debug_images: bool = DEBUG_IMAGES,
+    incremental: bool = INCREMENTAL_CHECK,
+    probe: bool = True,
 ) -> list[dict[str, Any]]:
     """
     Main orchestration routine to verify all cameras in a JSON dataset,
@@ -171,48 +338,124 @@ async def main(
 
     Args:
         camera_json (list[dict[str, Any]]): The input camera data.
-        rate_limit (int, optional): The concurrency limit for checking. Defaults to DEFAULT_RATE_LIMIT -> 50.
+        rate_limit (int, optional): The overall concurrency limit for checking, also the maximum for a single host.
+            Defaults to DEFAULT_RATE_LIMIT -> 50.
         download (bool, optional): Whether to download images to check for visual duplication. Defaults to True.
         save_file (bool, optional): Whether to save the verified JSON data to disk. Defaults to False.
         output_dir (Path, optional): Directory to save the verified JSON. Defaults to JSON_OUTPUT_DIR -> './data'.
         image_dir (Path, optional): Directory to temporarily save verification images. Defaults to IMAGE_DIR -> './data/images'.
+        stream_hash (bool, optional): Whether to hash the downloaded media in memory while the checks run,
+            instead of saving it to `image_dir` and hashing the folder afterwards. Defaults to True.
+        debug_images (bool, optional): Whether to also keep the streamed images in `image_dir`.
+            Defaults to DEBUG_IMAGES -> False.
+        incremental (bool, optional): Whether to only probe the cameras that are due according to the
+            camera health store, and build the results from the store. Always hashes in memory.
+            Defaults to INCREMENTAL_CHECK -> False.
+        probe (bool, optional): Whether to stop reading responses once enough bytes are in,
+            see check_camera. Defaults to True.
 
     Returns:
         list[dict[str, Any]]: The cleaned list of verified cameras.
     """
     # Get camera data from json output
     source, camera_ids = get_camera_data(camera_json)
-
-    if download:
-        has_dir = await asyncio.to_thread(image_dir.exists)
+    cameras_to_check = camera_ids
+
+    health_store = None
+    if incremental:
+        # Hashes have to be kept per camera in the store
+        stream_hash = True
+        health_store = await asyncio.to_thread(CameraHealthStore)
+        due_ids = set(
+            await asyncio.to_thread(
+                health_store.due, source, [str(cam_id) for cam_id, _ in camera_ids]
+            )
+        )
+        cameras_to_check = [cam for cam in camera_ids if str(cam[0]) in due_ids]
+        print(f"{len(cameras_to_check)}/{len(camera_ids)} cameras are due for a check.")
+
+    # Media only goes to disk for folder hashing, or to inspect it when debugging
+    save_dir = image_dir if download and (debug_images or not stream_hash) else None
+    if save_dir:
+        has_dir = await asyncio.to_thread(save_dir.exists)
         if not has_dir:
-            await asyncio.to_thread(image_dir.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(save_dir.mkdir, parents=True, exist_ok=True)
 
-    # Set up aiohttp client
+    # Reuse the shared aiohttp session, concurrency adapts per host and is bounded overall by the semaphore
     rate_limiter = asyncio.Semaphore(rate_limit)
+    host_limiter = HostConcurrencyController(max_limit=rate_limit)
     downloader = GenericDownloader(
         timeout_int=CONSTANTS.COMMON.HTTP_TIMEOUT, rate_limit=rate_limit
     )
-    headers, timeout, connector = await downloader.get_settings()
+    shared_session = downloader.get_session()
+    # Same pool as the shared session, traced to measure connection reuse
+    connections = ConnectionReuse()
+    session = aiohttp.ClientSession(
+        headers=shared_session.headers,
+        timeout=shared_session.timeout,
+        connector=shared_session.connector,
+        connector_owner=False,
+        trace_configs=[connections.trace_config],
+    )
 
-    # Run the checks
-    async with aiohttp.ClientSession(
-        headers=headers, connector=connector, timeout=timeout
-    ) as session:
+    # Run the checks, hashing each response as soon as it lands
+    hash_executor = ProcessPoolExecutor() if download and stream_hash else None
+    try:
         tasks = [
             check_camera(
-                session, source, cam_id, cam_type, rate_limiter, download, image_dir
+                session,
+                source,
+                cam_id,
+                cam_type,
+                rate_limiter,
+                download,
+                save_dir,
+                hash_executor,
+                host_limiter,
+                probe,
             )
-            for cam_id, cam_type in camera_ids
+            for cam_id, cam_type in cameras_to_check
         ]
         results = await tqdm.gather(*tasks, desc="Checking cameras", unit="cam")
+    finally:
+        await session.close()
+        if hash_executor is not None:
+            hash_executor.shutdown()
+
+    host_limiter.print_report()
+    print_probe_savings(source, results, connections)
+    if hash_executor is not None:
+        unhashed = sum(1 for res in results if res["status"] and res.get("hash") is None)
+        if unhashed:
+            print(f"{unhashed} online cameras could not be hashed, they are not checked for duplicates.")
+
+    if health_store is not None:
+        # The store now holds the latest known state of every listed camera
+        try:
+            await asyncio.to_thread(health_store.record, source, results)
+            records = await asyncio.to_thread(health_store.get, source)
+        finally:
+            health_store.close()
+        results = []
+        for cam_id, _ in camera_ids:
+            record = records[str(cam_id)]
+            cam_hash = (
+                diff_hash.Camera(record.dhash, record.camera_id)
+                if record.dhash is not None
+                else None
+            )
+            results.append({"id": cam_id, "status": record.status, "hash": cam_hash})
 
     # Separate successful and failed cameras
     alive_cameras = [res["id"] for res in results if res["status"]]
     errored_cameras = [res["id"] for res in results if not res["status"]]
     if download:
         print("Verifying sample images...")
-        probably_offline_cams = diff_hash.folder_hash(image_dir)
+        if stream_hash:
+            hash_list = [res["hash"] for res in results if res.get("hash")]
+            probably_offline_cams = diff_hash.find_duplicates(hash_list)
+        else:
+            probably_offline_cams = diff_hash.folder_hash(image_dir)
         if probably_offline_cams:
             print(f"{len(probably_offline_cams)} cameras are probably offline.")
             errored_cameras.extend(probably_offline_cams)
@@ -234,7 +477,7 @@ async def main(
     if save_file:
         filename = f"cameras_{str(source).lower()}_online.json"
         save_path = Path.joinpath(output_dir, filename)
-        save_json(camera_json, save_path)
+        await asyncio.to_thread(save_json, camera_json, save_path)
         print(SEP)
         print(f"Saved alive cameras json file to: {filename}")
 
@@ -242,5 +485,11 @@ async def main(
 
 
 if __name__ == "__main__":
+
+    async def _main(camera_json: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await main(camera_json=camera_json)
+
     camera_file = load_json("data/spain_original.json")
-    winloop.run(main(camera_json=camera_file))
+    winloop.run(_main(camera_file))
@@ -0,0 +1,198 @@
+import sqlite3
+import time
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+from config import CONSTANTS
+from tools.utils import check_parent_dir
+
+HEALTH_DB_PATH: Path = CONSTANTS.COMMON.HEALTH_DB_PATH
+HEALTHY_RECHECK_INTERVAL: int = CONSTANTS.COMMON.HEALTHY_RECHECK_INTERVAL
+FAILING_RECHECK_INTERVAL: int = CONSTANTS.COMMON.FAILING_RECHECK_INTERVAL
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS camera_health (
+    country TEXT NOT NULL,
+    camera_id TEXT NOT NULL,
+    status INTEGER,
+    dhash TEXT,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    last_checked REAL NOT NULL,
+    next_check REAL NOT NULL,
+    PRIMARY KEY (country, camera_id)
+)
+"""
+
+
+class CameraHealth(NamedTuple):
+    camera_id: str
+    status: int | None
+    dhash: int | None
+    consecutive_failures: int
+    last_checked: float
+    next_check: float
+
+
+class CameraHealthStore:
+    """
+    SQLite-backed store of camera probe results, keyed by (country, camera_id).
+
+    Keeps the last HTTP status (None when the probe failed), the last dhash,
+    the number of consecutive failures and when the camera was last checked,
+    so that checks can re-probe only the cameras that are due.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = HEALTH_DB_PATH,
+        healthy_interval: float = HEALTHY_RECHECK_INTERVAL,
+        failing_interval: float = FAILING_RECHECK_INTERVAL,
+    ) -> None:
+        """
+        Initializes the CameraHealthStore and creates the database if needed.
+
+        Args:
+            db_path (Path, optional): The SQLite database file.
+                Defaults to CONSTANTS.COMMON.HEALTH_DB_PATH -> './data/camera_health.sqlite3'.
+            healthy_interval (float, optional): Seconds before an online camera is due again.
+                Defaults to HEALTHY_RECHECK_INTERVAL -> 1800.
+            failing_interval (float, optional): Seconds before a failing camera is due again,
+                doubled for each consecutive failure. Defaults to FAILING_RECHECK_INTERVAL -> 120.
+        """
+        check_parent_dir(db_path)
+        self.healthy_interval = healthy_interval
+        self.failing_interval = failing_interval
+        # Accessed from worker threads (asyncio.to_thread), one call at a time
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _next_check(self, camera_id: str, ok: bool, failures: int, now: float) -> float:
+        """
+        Schedules the next probe of a camera.
+        Online cameras are spread by a stable per-camera offset so a national sweep
+        turns into a rolling probe instead of every camera being due at once.
+
+        Args:
+            camera_id (str): The camera identifier.
+            ok (bool): Whether the last probe succeeded.
+            failures (int): The number of consecutive failures.
+            now (float): The probe time (UNIX timestamp).
+
+        Returns:
+            float: When the camera is due again (UNIX timestamp).
+        """
+        if ok:
+            spread = 0.75 + (zlib.crc32(camera_id.encode()) % 1000) / 2000
+            return now + self.healthy_interval * spread
+        backoff = self.failing_interval * 2 ** min(failures - 1, 16)
+        return now + min(backoff, self.healthy_interval)
+
+    def get(self, country: str) -> dict[str, CameraHealth]:
+        """
+        Loads the stored health of every camera of a country.
+
+        Args:
+            country (str): The country code.
+
+        Returns:
+            dict[str, CameraHealth]: The camera health records, keyed by camera ID.
+        """
+        rows = self._conn.execute(
+            "SELECT camera_id, status, dhash, consecutive_failures, last_checked, next_check "
+            "FROM camera_health WHERE country = ?",
+            (country,),
+        )
+        return {
+            row[0]: CameraHealth(
+                row[0],
+                row[1],
+                int(row[2], 16) if row[2] else None,
+                row[3],
+                row[4],
+                row[5],
+            )
+            for row in rows
+        }
+
+    def due(
+        self, country: str, camera_ids: Iterable[str], now: float | None = None
+    ) -> list[str]:
+        """
+        Selects the cameras to probe: never checked, or past their scheduled check.
+
+        Args:
+            country (str): The country code.
+            camera_ids (Iterable[str]): The cameras currently listed for the country.
+            now (float | None, optional): The current UNIX timestamp. Defaults to time.time().
+
+        Returns:
+            list[str]: The due camera IDs, in the given order.
+        """
+        now = time.time() if now is None else now
+        records = self.get(country)
+        return [
+            cam_id
+            for cam_id in camera_ids
+            if (record := records.get(cam_id)) is None or record.next_check <= now
+        ]
+
+    def record(
+        self,
+        country: str,
+        results: Iterable[dict[str, Any]],
+        now: float | None = None,
+    ) -> None:
+        """
+        Stores probe results, as returned by camera_check.check_camera.
+
+        Args:
+            country (str): The country code.
+            results (Iterable[dict[str, Any]]): The results with 'id', 'status' and optionally 'hash'.
+            now (float | None, optional): The probe time (UNIX timestamp). Defaults to time.time().
+        """
+        now = time.time() if now is None else now
+        records = self.get(country)
+        rows = []
+        for res in results:
+            cam_id = str(res["id"])
+            ok = bool(res["status"])
+            previous = records.get(cam_id)
+            failures = 0 if ok else (previous.consecutive_failures if previous else 0) + 1
+            # Keep the previous hash when the media was not hashed this time
+            if "hash" in res:
+                dhash = res["hash"].bits if res["hash"] else None
+            else:
+                dhash = previous.dhash if previous else None
+            rows.append(
+                (
+                    country,
+                    cam_id,
+                    res["status"] if ok else None,
+                    f"{dhash:x}" if ok and dhash is not None else None,
+                    failures,
+                    now,
+                    self._next_check(cam_id, ok, failures, now),
+                )
+            )
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO camera_health "
+                "(country, camera_id, status, dhash, consecutive_failures, last_checked, next_check) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
@@ -0,0 +1,403 @@
+"""
+Columnar camera store for bulk, repeated queries over a camera dataset.
+
+Building a CameraTable costs a full pass over the data, so it only pays off
+when the same dataset is queried many times or by numeric column (e.g.
+centroids, km ranges). One-pass consumers such as the CLI tools read the dicts
+directly.
+"""
+
+import copy
+import math
+import sys
+from collections.abc import Iterator
+from typing import Any, NamedTuple, Self
+
+import numpy as np
+
+# Key order of BaseParser.format_camera output, optionally followed by "url"
+_CAMERA_KEYS: tuple[str, ...] = (
+    "camera_id",
+    "camera_km_point",
+    "camera_view",
+    "camera_type",
+    "coords",
+)
+_CAMERA_KEYS_URL: tuple[str, ...] = (*_CAMERA_KEYS, "url")
+_COORD_KEYS: tuple[str, ...] = ("X", "Y")
+_HIGHWAY_KEYS: tuple[str, ...] = ("name", "country", "cameras")
+
+
+class StringColumn:
+    """
+    Immutable column of strings stored as one concatenated string plus offsets.
+
+    Slicing shares the underlying string and offsets, so it copies nothing.
+    """
+
+    __slots__ = ("_text", "offsets")
+
+    def __init__(self, text: str, offsets: np.ndarray) -> None:
+        """
+        Initializes the StringColumn.
+
+        Args:
+            text (str): The concatenated values.
+            offsets (np.ndarray): The int64 start of every value in `text`, followed by the end of the last one.
+        """
+        self._text = text
+        self.offsets = offsets
+
+    @classmethod
+    def from_list(cls, values: list[str]) -> Self:
+        """
+        Builds a column from a list of strings.
+
+        Args:
+            values (list[str]): The values.
+
+        Returns:
+            StringColumn: The column.
+        """
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, values), dtype=np.int64, count=len(values)), out=offsets[1:])
+        return cls("".join(values), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self._text[self.offsets[index] : self.offsets[index + 1]]
+
+    def slice(self, start: int, stop: int) -> Self:
+        """
+        Returns the values from `start` to `stop` without copying them.
+
+        Args:
+            start (int): The first row.
+            stop (int): The row after the last one.
+
+        Returns:
+            StringColumn: A column sharing this column's storage.
+        """
+        return type(self)(self._text, self.offsets[start : stop + 1])
+
+    def tolist(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The values as Python strings.
+        """
+        text = self._text
+        bounds = self.offsets.tolist()
+        return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used, in bytes (the shared text is counted in full)."""
+        return sys.getsizeof(self._text) + self.offsets.nbytes
+
+
+class CameraRow(NamedTuple):
+    camera_id: str
+    highway: str
+    km_point: float
+    view: str
+    camera_type: str
+    x: float
+    y: float
+    url: str | None
+
+
+class HighwaySlice(NamedTuple):
+    """
+    The cameras of one highway entry, as views on the table columns.
+    """
+
+    name: str
+    country: str
+    ids: StringColumn
+    km: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    type_codes: np.ndarray
+
+
+class CameraTable:
+    """
+    Columnar, NumPy-backed store of a camera dataset in the highway list format
+    (`[{"highway": {"name", "country", "cameras": [...]}}]`).
+
+    Cameras are rows, in dataset order, so the cameras of a highway entry are a
+    contiguous range and every per-highway access is a zero-copy slice.
+    Coordinates and km points are float64 columns (NaN when missing), views and
+    types are small integer codes into `views` / `types`, and IDs and URLs are
+    `StringColumn`s. Cameras or entries that do not have the exact layout of
+    `BaseParser.format_camera` (extra keys, other key order, non-float values)
+    are also kept verbatim, so `to_json` always returns the original data.
+    """
+
+    def __init__(self, data: list[dict[str, Any]]) -> None:
+        """
+        Initializes the CameraTable from parsed camera data.
+
+        Args:
+            data (list[dict[str, Any]]): The camera data, as produced by the parsers or load_json.
+
+        Raises:
+            TypeError: If an entry has no "highway" dict with a "cameras" list.
+        """
+        self.names: list[str] = []
+        self.countries: list[str] = []
+        self.views: list[str] = []
+        self.types: list[str] = []
+        # Row / entry -> original value, when it cannot be rebuilt from the columns
+        self._camera_extras: dict[int, dict[str, Any]] = {}
+        self._entry_extras: dict[int, dict[str, Any]] = {}
+
+        view_codes: dict[str, int] = {}
+        type_codes: dict[str, int] = {}
+        starts: list[int] = [0]
+        ids: list[str] = []
+        urls: list[str] = []
+        has_url: list[bool] = []
+        kms: list[float] = []
+        xs: list[float] = []
+        ys: list[float] = []
+        views: list[int] = []
+        types: list[int] = []
+
+        for index, entry in enumerate(data):
+            highway = entry.get("highway") if isinstance(entry, dict) else None
+            if not isinstance(highway, dict) or not isinstance(highway.get("cameras"), list):
+                raise TypeError(f"Entry {index} has no highway camera list")
+            name, country = highway.get("name"), highway.get("country")
+            self.names.append(name if isinstance(name, str) else str(name))
+            self.countries.append(country if isinstance(country, str) else str(country))
+            if (
+                tuple(entry) != ("highway",)
+                or tuple(highway) != _HIGHWAY_KEYS
+                or not isinstance(name, str)
+                or not isinstance(country, str)
+            ):
+                kept = {**entry, "highway": {**highway, "cameras": None}}
+                self._entry_extras[index] = copy.deepcopy(kept)
+
+            for cam in highway["cameras"]:
+                row = len(ids)
+                coords = cam.get("coords")
+                coords = coords if isinstance(coords, dict) else {}
+                camera_id = cam.get("camera_id")
+                km = cam.get("camera_km_point")
+                view = cam.get("camera_view")
+                camera_type = cam.get("camera_type")
+                x, y = coords.get("X"), coords.get("Y")
+                url = cam.get("url")
+
+                keys = tuple(cam)
+                if not (
+                    keys in (_CAMERA_KEYS, _CAMERA_KEYS_URL)
+                    and tuple(coords) == _COORD_KEYS
+                    and isinstance(camera_id, str)
+                    and type(km) is float
+                    and math.isfinite(km)
+                    and isinstance(view, str)
+                    and isinstance(camera_type, str)
+                    and (x is None or (type(x) is float and math.isfinite(x)))
+                    and (y is None or (type(y) is float and math.isfinite(y)))
+                    and (keys == _CAMERA_KEYS or isinstance(url, str))
+                ):
+                    self._camera_extras[row] = copy.deepcopy(cam)
+
+                ids.append(camera_id if isinstance(camera_id, str) else str(camera_id or ""))
+                kms.append(_as_float(km))
+                xs.append(_as_float(x))
+                ys.append(_as_float(y))
+                view = view if isinstance(view, str) else ""
+                camera_type = camera_type if isinstance(camera_type, str) else ""
+                if view not in view_codes:
+                    view_codes[view] = len(self.views)
+                    self.views.append(view)
+                if camera_type not in type_codes:
+                    type_codes[camera_type] = len(self.types)
+                    self.types.append(camera_type)
+                views.append(view_codes[view])
+                types.append(type_codes[camera_type])
+                has_url.append("url" in cam)
+                urls.append(url if isinstance(url, str) else "")
+            starts.append(len(ids))
+
+        self.starts = np.array(starts, dtype=np.int64)
+        self.highway_index = np.repeat(
+            np.arange(len(self.names), dtype=np.int32), np.diff(self.starts)
+        )
+        self.ids = StringColumn.from_list(ids)
+        self.urls = StringColumn.from_list(urls)
+        self.has_url = np.array(has_url, dtype=np.bool_)
+        self.km = np.array(kms, dtype=np.float64)
+        self.x = np.array(xs, dtype=np.float64)
+        self.y = np.array(ys, dtype=np.float64)
+        self.view_codes = np.array(views, dtype=np.int16)
+        self.type_codes = np.array(types, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return len(self.km)
+
+    @property
+    def highway_count(self) -> int:
+        """Number of highway entries."""
+        return len(self.names)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns, in bytes."""
+        arrays = (
+            self.starts, self.highway_index, self.has_url, self.km,
+            self.x, self.y, self.view_codes, self.type_codes,
+        )
+        strings = self.names + self.countries + self.views + self.types
+        return (
+            sum(a.nbytes for a in arrays)
+            + self.ids.nbytes
+            + self.urls.nbytes
+            + sum(sys.getsizeof(s) for s in strings)
+        )
+
+    def highway(self, index: int) -> HighwaySlice:
+        """
+        Returns the cameras of a highway entry without copying them.
+
+        Args:
+            index (int): The entry index, in dataset order.
+
+        Returns:
+            HighwaySlice: The entry's name, country and column views.
+        """
+        start, stop = int(self.starts[index]), int(self.starts[index + 1])
+        return HighwaySlice(
+            self.names[index],
+            self.countries[index],
+            self.ids.slice(start, stop),
+            self.km[start:stop],
+            self.x[start:stop],
+            self.y[start:stop],
+            self.type_codes[start:stop],
+        )
+
+    def camera_counts(self) -> list[tuple[str, int]]:
+        """
+        Returns:
+            list[tuple[str, int]]: The name and camera count of every highway entry, in dataset order.
+        """
+        return list(zip(self.names, np.diff(self.starts).tolist(), strict=True))
+
+    def rows(self) -> Iterator[CameraRow]:
+        """
+        Iterates over the cameras in dataset order.
+        Rows are materialized from the columns, so walking the columns directly is faster.
+
+        Returns:
+            Iterator[CameraRow]: The camera fields, with NaN for missing numbers and None for a missing URL.
+        """
+        urls = [
+            url if has_url else None
+            for url, has_url in zip(self.urls.tolist(), self.has_url.tolist(), strict=True)
+        ]
+        return map(
+            CameraRow._make,
+            zip(
+                self.ids.tolist(),
+                _decode(self.names, self.highway_index),
+                self.km.tolist(),
+                _decode(self.views, self.view_codes),
+                _decode(self.types, self.type_codes),
+                self.x.tolist(),
+                self.y.tolist(),
+                urls,
+                strict=True,
+            ),
+        )
+
+    def to_json(self) -> list[dict[str, Any]]:
+        """
+        Exports the table to the highway list format.
+
+        Returns:
+            list[dict[str, Any]]: Data equal to the one the table was built from, key order included.
+        """
+        ids = self.ids.tolist()
+        urls = self.urls.tolist()
+        kms = self.km.tolist()
+        xs = self.x.tolist()
+        ys = self.y.tolist()
+        views = self.view_codes.tolist()
+        types = self.type_codes.tolist()
+        has_url = self.has_url.tolist()
+        starts = self.starts.tolist()
+
+        data: list[dict[str, Any]] = []
+        for index, name in enumerate(self.names):
+            cameras: list[dict[str, Any]] = []
+            for row in range(starts[index], starts[index + 1]):
+                kept = self._camera_extras.get(row)
+                if kept is not None:
+                    cameras.append(copy.deepcopy(kept))
+                    continue
+                x, y = xs[row], ys[row]
+                cam: dict[str, Any] = {
+                    "camera_id": ids[row],
+                    "camera_km_point": kms[row],
+                    "camera_view": self.views[views[row]],
+                    "camera_type": self.types[types[row]],
+                    "coords": {
+                        "X": None if math.isnan(x) else x,
+                        "Y": None if math.isnan(y) else y,
+                    },
+                }
+                if has_url[row]:
+                    cam["url"] = urls[row]
+                cameras.append(cam)
+
+            kept_entry = self._entry_extras.get(index)
+            if kept_entry is not None:
+                entry = copy.deepcopy(kept_entry)
+                entry["highway"]["cameras"] = cameras
+            else:
+                entry = {
+                    "highway": {
+                        "name": name,
+                        "country": self.countries[index],
+                        "cameras": cameras,
+                    }
+                }
+            data.append(entry)
+        return data
+
+
+def _decode(vocabulary: list[str], codes: np.ndarray) -> list[str]:
+    """
+    Maps integer codes to their values.
+
+    Args:
+        vocabulary (list[str]): The values, indexed by code.
+        codes (np.ndarray): The codes.
+
+    Returns:
+        list[str]: The value of every code.
+    """
+    return np.array(vocabulary, dtype=object)[codes].tolist()
+
+
+def _as_float(value: Any) -> float:
+    """
+    Converts a column value to float, NaN when it is missing or not a number.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        float: The value as float.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
@@ -5,7 +5,7 @@ from typing import Any
 
 from natsort import natsorted
 
-from tools.utils import create_url, load_json, get_country
+from tools.utils import atomic_write, create_url, load_json, get_country
 from config import CONSTANTS
 
 COUNTRY_MAP: dict[str, str] = CONSTANTS.COMMON.COUNTRY_MAP
@@ -629,9 +629,7 @@ def main(args: argparse.Namespace) -> None:
 
     output_path = Path(f"{args.output_dir}\\{args.output_file}")
     try:
-        if not output_path.parent.exists():
-            Path(output_path.parent).mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding="utf-8")
+        atomic_write(output_path, html_content)
         print(f"HTML slideshow created: {output_path}")
     except Exception as e:
         print(f"Error writing HTML file: {e}")
@@ -1,8 +1,12 @@
+import io
+import os
+import tempfile
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import NamedTuple
 
 import dhash
+import numpy as np
 import pybktree
 import ffmpeg
 import ffmpeg.filters
@@ -12,6 +16,12 @@ from config import CONSTANTS
 SEP: str = CONSTANTS.COMMON.SEPARATOR
 IMAGE_EXTENSIONS: tuple[str] = CONSTANTS.COMMON.IMAGE_EXTENSIONS
 VIDEO_EXTENSIONS: tuple[str] = CONSTANTS.COMMON.VIDEO_EXTENSIONS
+VIDEO_FRAME_SIZE: tuple[int, int] = CONSTANTS.COMMON.VIDEO_FRAME_SIZE
+# Maximum Hamming distance between two hashes of the same picture
+MAX_HASH_DISTANCE: int = 8
+# Number of hash pairs compared per vectorized block, bounds the temporary arrays (~8 bytes each)
+HAMMING_BLOCK_PAIRS: int = 1 << 22
+_WORD_MASK: int = (1 << 64) - 1
 
 
 class Camera(NamedTuple):
@@ -19,22 +29,82 @@ class Camera(NamedTuple):
     id: str
 
 
-def get_video_frame(video_file: Path) -> None:
+def _read_first_frame(source: str, video_bytes: bytes | None = None) -> bytes:
     """
-    Extracts the first frame of a video file and saves it as a PNG, then deletes the video.
+    Decodes the first frame of a video with ffmpeg, as raw grayscale pixels.
 
     Args:
-        video_file (Path): Path to the video file.
+        source (str): The ffmpeg input, "pipe:" to read `video_bytes` from stdin, or a file path.
+        video_bytes (bytes | None, optional): The data piped to ffmpeg. Defaults to None.
+
+    Returns:
+        bytes: The frame scaled to VIDEO_FRAME_SIZE, empty if ffmpeg failed to decode it.
+    """
+    width, height = VIDEO_FRAME_SIZE
+    input_stream = ffmpeg.input(source, ss="00:00:00")
+    try:
+        # scale all frames to the same size
+        frame_bytes, _ = ffmpeg.output(
+            input_stream,
+            filename="pipe:",
+            vframes=1,
+            vf=f"scale={width}:{height}",
+            f="rawvideo",
+            pix_fmt="gray",
+        ).run(input=video_bytes, capture_stdout=True, quiet=True)
+    except ffmpeg.FFMpegExecuteError:
+        return b""
+    return frame_bytes
+
+
+def get_video_frame(video_bytes: bytes) -> Image.Image:
+    """
+    Extracts the first frame of an in-memory video as a grayscale image.
+    The video is piped to ffmpeg's stdin and the raw frame is read from its stdout,
+    so no intermediate PNG is encoded. Videos that can't be decoded from a pipe
+    (e.g. an MP4 with its moov atom at the end, which needs seeking) are written
+    to a temporary file and decoded from there.
+
+    Args:
+        video_bytes (bytes): The raw video data.
+
+    Returns:
+        Image.Image: The first frame, scaled to VIDEO_FRAME_SIZE, in 'L' mode.
+    """
+    width, height = VIDEO_FRAME_SIZE
+    frame_bytes = _read_first_frame("pipe:", video_bytes)
+    if len(frame_bytes) < width * height:
+        # Closed before ffmpeg opens it (required on Windows), deleted when the block exits
+        with tempfile.NamedTemporaryFile(delete_on_close=False) as video_file:
+            video_file.write(video_bytes)
+            video_file.close()
+            frame_bytes = _read_first_frame(video_file.name)
+    return Image.frombytes("L", VIDEO_FRAME_SIZE, frame_bytes)
+
+
+def get_bytes_hash(
+    camera_id: str | int, data: bytes, is_video: bool = False
+) -> Camera | None:
     """
-    output_path = video_file.with_suffix(".png")
-    input_file = ffmpeg.input(str(video_file), ss="00:00:00")
-    # scale all images to the same size
-    # save the first frame as a PNG
-    ffmpeg.output(input_file, filename=str(output_path), vframes=1, vf='scale=352:288').run(
-        overwrite_output=True, quiet=True
-    )
-    # remove the video
-    video_file.unlink()
+    Hashes an in-memory image (or the first frame of a video) without touching the disk.
+
+    Args:
+        camera_id (str | int): The camera identifier.
+        data (bytes): The raw image or video data.
+        is_video (bool, optional): Whether the data is a video. Defaults to False.
+
+    Returns:
+        Camera | None: The computed hash and ID, or None if processing fails.
+    """
+    try:
+        img = get_video_frame(data) if is_video else Image.open(io.BytesIO(data))
+        with img:
+            h_bits = dhash.dhash_int(img, size=8)
+            return Camera(h_bits, str(camera_id))
+
+    except Exception as e:
+        print(f"Error processing {camera_id}: {e}")
+        return None
 
 
 def get_image_hash(img_file: Path | str) -> Camera | None:
@@ -59,6 +129,19 @@ def get_image_hash(img_file: Path | str) -> Camera | None:
         return None
 
 
+def get_video_hash(video_file: Path) -> Camera | None:
+    """
+    Hashes the first frame of a video file.
+
+    Args:
+        video_file (Path): Path to the video file.
+
+    Returns:
+        Camera | None: The computed hash and ID, or None if processing fails.
+    """
+    return get_bytes_hash(video_file.stem, video_file.read_bytes(), is_video=True)
+
+
 def item_distance(x: Camera, y: Camera) -> int:
     """
     Calculates the Hamming distance between two hash bit integers.
@@ -86,8 +169,8 @@ def get_duplicates(tree: pybktree.BKTree, hash_list: list[Camera]) -> set[str]:
     """
     dupes: set[str] = set()
     for cam in hash_list:
-        # find duplicates within 4 bits of difference
-        matches = tree.find(cam, 8)
+        # find duplicates within 8 bits of difference
+        matches = tree.find(cam, MAX_HASH_DISTANCE)
         duplicates = [m[1].id for m in matches if m[1].id != cam.id]
 
         if duplicates and cam.id not in dupes:
@@ -100,6 +183,112 @@ def get_duplicates(tree: pybktree.BKTree, hash_list: list[Camera]) -> set[str]:
     return dupes
 
 
+def get_hash_neighbours(
+    hash_list: list[Camera], max_distance: int = MAX_HASH_DISTANCE
+) -> list[list[tuple[int, int]]]:
+    """
+    Finds, for every hash, the other hashes within a Hamming distance, using NumPy.
+    The 128-bit dhashes (row + column gradients) are split in two uint64 words and
+    compared block by block with XOR + popcount, each pair only once.
+
+    Args:
+        hash_list (list[Camera]): The list of all camera hashes.
+        max_distance (int, optional): The maximum Hamming distance. Defaults to MAX_HASH_DISTANCE -> 8.
+
+    Returns:
+        list[list[tuple[int, int]]]: For each hash, the (distance, index) pairs of its neighbours.
+    """
+    count = len(hash_list)
+    words = np.array(
+        [(cam.bits >> 64, cam.bits & _WORD_MASK) for cam in hash_list], dtype=np.uint64
+    ).reshape(count, 2)
+    neighbours: list[list[tuple[int, int]]] = [[] for _ in range(count)]
+    rows_per_block = max(1, HAMMING_BLOCK_PAIRS // max(count, 1))
+
+    for start in range(0, count, rows_per_block):
+        block = words[start : start + rows_per_block]
+        # Only compare with the hashes from this block on, earlier pairs are already known
+        others = words[start:]
+        # The first words alone rule out almost every pair, the second ones are only
+        # compared for the remaining candidates
+        high = np.bitwise_count(block[:, None, 0] ^ others[None, :, 0])
+        rows, cols = np.nonzero(high <= max_distance)
+        upper = cols > rows
+        rows, cols = rows[upper], cols[upper]
+        distances = high[rows, cols] + np.bitwise_count(
+            block[rows, 1] ^ others[cols, 1]
+        )
+        close = distances <= max_distance
+        for i, j, distance in zip(
+            (rows[close] + start).tolist(),
+            (cols[close] + start).tolist(),
+            distances[close].tolist(),
+            strict=True,
+        ):
+            neighbours[i].append((distance, j))
+            neighbours[j].append((distance, i))
+    return neighbours
+
+
+def get_duplicates_vectorized(hash_list: list[Camera]) -> set[str]:
+    """
+    Finds duplicated images based on Hamming distance with vectorized NumPy comparisons.
+    Returns the same set as `get_duplicates`, matches at equal distance are listed in input order.
+
+    Args:
+        hash_list (list[Camera]): The list of all camera hashes.
+
+    Returns:
+        set[str]: A set of duplicate camera IDs.
+    """
+    neighbours = get_hash_neighbours(hash_list, MAX_HASH_DISTANCE)
+    dupes: set[str] = set()
+    for cam, cam_neighbours in zip(hash_list, neighbours, strict=True):
+        duplicates = [
+            hash_list[j].id for _, j in sorted(cam_neighbours) if hash_list[j].id != cam.id
+        ]
+
+        if duplicates and cam.id not in dupes:
+            print(f"Camera: {cam.id} | Duplicates found: {', '.join(duplicates)}")
+            dupes.add(cam.id)
+            for d in duplicates:
+                dupes.add(d)
+    if not dupes:
+        print("No duplicates found.")
+    return dupes
+
+
+def find_duplicates(
+    hash_list: list[Camera], vectorized: bool = True
+) -> set[str] | None:
+    """
+    Detects duplicates among camera hashes.
+
+    Args:
+        hash_list (list[Camera]): The list of all camera hashes.
+        vectorized (bool, optional): Whether to compare the hashes in bulk with NumPy
+            instead of querying a BK-Tree for each one. Defaults to True.
+
+    Returns:
+        set[str] | None: A set of duplicate camera IDs, or None if there are no hashes.
+    """
+    if not hash_list:
+        print("No files processed.")
+        return None
+
+    if vectorized:
+        print(SEP)
+        print("Searching for duplicates...")
+        return get_duplicates_vectorized(hash_list)
+
+    tree = pybktree.BKTree(item_distance, hash_list)
+
+    print(SEP)
+    print("Searching for duplicates...")
+
+    return get_duplicates(tree, hash_list)
+
+
 def main(file_path: Path | None = None) -> set[str] | None:
     """
     Processes a directory of images/videos, hashes them, and detects duplicates.
@@ -124,31 +313,21 @@ def main(file_path: Path | None = None) -> set[str] | None:
         elif ext in IMAGE_EXTENSIONS:
             image_files.append(f)
 
+    results: list[Camera | None] = []
     if video_files:
-        with ThreadPoolExecutor() as thread_executor:
-            list(thread_executor.map(get_video_frame, video_files))
+        # ffmpeg does the decoding in its own process, threads only wait on the pipes
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as thread_executor:
+            results.extend(thread_executor.map(get_video_hash, video_files))
 
-    results: list[Camera | None] = []
-    if image_files or video_files:
+    if image_files:
         with ProcessPoolExecutor() as process_executor:
-            results = list(
+            results.extend(
                 process_executor.map(get_image_hash, image_files, chunksize=100)
             )
 
     hash_list: list[Camera] = [r for r in results if r is not None]
 
-    if not hash_list:
-        print("No files processed.")
-        return None
-
-    tree = pybktree.BKTree(item_distance, hash_list)
-
-    print(SEP)
-    print("Searching for duplicates...")
-
-    duplicate_ids: set[str] = get_duplicates(tree, hash_list)
-
-    return duplicate_ids
+    return find_duplicates(hash_list)
 
 
 def cleanup_folder(folder_path: Path) -> None:
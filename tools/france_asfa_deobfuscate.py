@@ -3,7 +3,7 @@ import aiohttp
 import re
 
 from config import CONSTANTS
-from Downloaders.base_downloader import GenericDownloader
+from Downloaders.base_downloader import BaseDownloader, GenericDownloader
 
 
 BASE_URL: str = CONSTANTS.FRANCE.ASFA.BASE_URL
@@ -177,20 +177,22 @@ async def get_complete_url() -> str:
         str: Expected data URL.
     """
     downloader = GenericDownloader()
-    headers, timeout, connector = await downloader.get_settings()
-    async with aiohttp.ClientSession(
-        headers=headers, connector=connector, timeout=timeout
-    ) as session:
-        auth_key = await get_auth_key(session, BASE_URL)
-        if not auth_key:
-            raise ValueError("Failed to get auth key.")
-        phase_2_url = await get_phase2(session, auth_key, downloader)
-        phase_2_list = await parse_phase2(session, phase_2_url, downloader)
-        resolved_vars = resolve_js_variables(phase_2_list)
-        full_url = assemble_url(phase_2_list, resolved_vars)
-    return full_url
+    session = downloader.get_session()
+    auth_key = await get_auth_key(session, BASE_URL)
+    if not auth_key:
+        raise ValueError("Failed to get auth key.")
+    phase_2_url = await get_phase2(session, auth_key, downloader)
+    phase_2_list = await parse_phase2(session, phase_2_url, downloader)
+    resolved_vars = resolve_js_variables(phase_2_list)
+    return assemble_url(phase_2_list, resolved_vars)
 
 
 if __name__ == "__main__":
-    asfa_data = winloop.run(get_complete_url())
+
+    async def _main() -> str:
+        # Release the shared connection pool on exit
+        async with BaseDownloader.session_pool():
+            return await get_complete_url()
+
+    asfa_data = winloop.run(_main())
     print(f"ASFA data URL: {asfa_data}")
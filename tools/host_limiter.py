@@ -0,0 +1,250 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from config import CONSTANTS
+
+HOST_INITIAL_CONCURRENCY: int = CONSTANTS.COMMON.HOST_INITIAL_CONCURRENCY
+HOST_MIN_CONCURRENCY: int = CONSTANTS.COMMON.HOST_MIN_CONCURRENCY
+HOST_BACKOFF_FACTOR: float = CONSTANTS.COMMON.HOST_BACKOFF_FACTOR
+HOST_LATENCY_TOLERANCE: float = CONSTANTS.COMMON.HOST_LATENCY_TOLERANCE
+
+
+def is_congestion_error(exc: BaseException) -> bool:
+    """
+    Checks whether an error means the host is overloaded.
+
+    Args:
+        exc (BaseException): The raised error.
+
+    Returns:
+        bool: True for timeouts, dropped connections, 429 and 5xx responses.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, TimeoutError | aiohttp.ServerDisconnectedError)
+
+
+class _HostState:
+    """
+    AIMD concurrency window of a single host, with a FIFO queue of waiting requests.
+    """
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int) -> None:
+        """
+        Initializes the _HostState.
+
+        Args:
+            initial (int): The starting concurrency, clamped to the bounds.
+            min_limit (int): The lowest concurrency the window is cut to.
+            max_limit (int): The highest concurrency the window grows to.
+        """
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.peak = int(self.limit)
+        self.backoffs = 0
+        self.requests = 0
+        self.min_latency = float("inf")
+        self.slow_start = True
+        self._last_backoff = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """
+        Waits until the window has a free slot and takes it, in arrival order.
+
+        Raises:
+            asyncio.CancelledError: If the wait is cancelled, no slot is held then.
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """
+        Frees a slot taken by `acquire()` and hands it to the next waiting request.
+        """
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hands free slots to the waiting requests, in arrival order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def on_success(self, latency: float) -> None:
+        """
+        Additive increase (exponential during slow start) while latency stays healthy.
+        A response slower than HOST_LATENCY_TOLERANCE times the fastest one keeps the window as is.
+
+        Args:
+            latency (float): The request latency in seconds.
+        """
+        self.requests += 1
+        self.min_latency = min(self.min_latency, latency)
+        if latency > self.min_latency * HOST_LATENCY_TOLERANCE:
+            return
+        # Roughly +1 per window of completed requests, +1 per request in slow start
+        step = 1.0 if self.slow_start else 1.0 / self.limit
+        self.limit = min(self.max_limit, self.limit + step)
+        self.peak = max(self.peak, int(self.limit))
+        self._wake()
+
+    def on_congestion(self, latency: float) -> None:
+        """
+        Multiplicative decrease, at most once per latency window as in-flight requests fail together.
+        Also ends the slow start.
+
+        Args:
+            latency (float): The latency of the failed request in seconds.
+        """
+        self.requests += 1
+        now = time.monotonic()
+        if now - self._last_backoff < latency:
+            return
+        self._last_backoff = now
+        self.slow_start = False
+        self.backoffs += 1
+        self.limit = max(self.min_limit, self.limit * HOST_BACKOFF_FACTOR)
+
+    def on_neutral(self) -> None:
+        """
+        Counts a request failing for other reasons (404, invalid content), which does not change the window.
+        """
+        self.requests += 1
+
+
+class SlotTimer:
+    """
+    Start of the request latency measured by a host slot.
+    Call `restart()` once every other limit is held, so time spent waiting for them isn't counted.
+    """
+
+    __slots__ = ("start",)
+
+    def __init__(self) -> None:
+        """
+        Initializes the SlotTimer, starting it now.
+        """
+        self.start = time.monotonic()
+
+    def restart(self) -> None:
+        """
+        Starts the timer again from now.
+        """
+        self.start = time.monotonic()
+
+    def elapsed(self) -> float:
+        """
+        Returns the time since the timer was started or last restarted.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        return time.monotonic() - self.start
+
+
+class HostConcurrencyController:
+    """
+    Adaptive per-host concurrency limiter for camera probing.
+
+    Each target host gets its own AIMD window: it grows while responses stay
+    fast and successful, and is cut on timeouts, dropped connections, 429 and
+    5xx responses. Hosts are keyed by URL host name, so one country's cameras
+    spread over several servers are throttled independently.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial: int = HOST_INITIAL_CONCURRENCY,
+        min_limit: int = HOST_MIN_CONCURRENCY,
+    ) -> None:
+        """
+        Initializes the HostConcurrencyController.
+
+        Args:
+            max_limit (int): The maximum concurrency of any host.
+            initial (int, optional): The starting concurrency of a host. Defaults to HOST_INITIAL_CONCURRENCY -> 4.
+            min_limit (int, optional): The minimum concurrency of a host. Defaults to HOST_MIN_CONCURRENCY -> 1.
+        """
+        self.max_limit = max(max_limit, min_limit)
+        self.initial = initial
+        self.min_limit = min_limit
+        self._hosts: dict[str, _HostState] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[SlotTimer]:
+        """
+        Waits for a free slot on the URL's host and adapts its window to the outcome.
+        Errors raised inside the block are classified, then re-raised.
+        The latency runs from the slot being acquired, or from the last `SlotTimer.restart()`.
+
+        Args:
+            url (str): The request URL.
+
+        Yields:
+            SlotTimer: The latency timer, once the request may be sent.
+        """
+        host = urlsplit(url).hostname or ""
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(
+                self.initial, self.min_limit, self.max_limit
+            )
+
+        await state.acquire()
+        timer = SlotTimer()
+        try:
+            yield timer
+        except Exception as e:
+            if is_congestion_error(e):
+                state.on_congestion(timer.elapsed())
+            else:
+                state.on_neutral()
+            raise
+        else:
+            state.on_success(timer.elapsed())
+        finally:
+            state.release()
+
+    def limits(self) -> dict[str, int]:
+        """
+        Returns the current (converged, at the end of a run) concurrency limit per host.
+
+        Returns:
+            dict[str, int]: The concurrency limit, keyed by host name.
+        """
+        return {host: int(state.limit) for host, state in self._hosts.items()}
+
+    def print_report(self) -> None:
+        """
+        Prints the converged concurrency limit, peak and backoff count of every host.
+        """
+        print("Concurrency per host (converged / peak, backoffs, requests):")
+        for host, state in sorted(self._hosts.items()):
+            print(
+                f"  {host}: {int(state.limit)} / {state.peak}, "
+                f"{state.backoffs} backoffs, {state.requests} requests"
+            )
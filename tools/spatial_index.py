@@ -0,0 +1,129 @@
+import math
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import product
+from typing import Any
+
+from config import CONSTANTS
+
+EARTH_RADIUS_KM: float = CONSTANTS.COMMON.EARTH_RADIUS_KM
+
+# Cells are made slightly larger than the search radius so that floating-point
+# rounding can never push two matching points more than one cell apart
+_CELL_PADDING: float = 1.0 + 1e-9
+
+
+class SphereGrid:
+    """
+    Fixed-radius neighbour index over geographic points.
+
+    Points are mapped to unit-sphere vectors and bucketed in a 3D grid whose
+    cells are as wide as the search radius. Because the straight-line (chord)
+    distance is never larger than the great-circle distance, every point within
+    `radius_km` of a query lies in one of the 27 cells around it.
+    Candidates still have to be confirmed with an exact distance check.
+    """
+
+    def __init__(self, radius_km: float) -> None:
+        """
+        Initializes the SphereGrid.
+
+        Args:
+            radius_km (float): The search radius in kilometers.
+        """
+        self.cell_size = max(radius_km / EARTH_RADIUS_KM, 1e-12) * _CELL_PADDING
+        self._cells: dict[tuple[int, int, int], list[Any]] = defaultdict(list)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int, int]:
+        """
+        Computes the grid cell of a point.
+
+        Args:
+            lat (float): Latitude in degrees.
+            lon (float): Longitude in degrees.
+
+        Returns:
+            tuple[int, int, int]: The cell coordinates.
+        """
+        phi, lam = math.radians(lat), math.radians(lon)
+        cos_phi = math.cos(phi)
+        size = self.cell_size
+        return (
+            math.floor(cos_phi * math.cos(lam) / size),
+            math.floor(cos_phi * math.sin(lam) / size),
+            math.floor(math.sin(phi) / size),
+        )
+
+    def add(self, lat: float, lon: float, item: Any) -> None:
+        """
+        Adds an item at a geographic position.
+
+        Args:
+            lat (float): Latitude in degrees.
+            lon (float): Longitude in degrees.
+            item (Any): The item to store.
+        """
+        self._cells[self._cell(lat, lon)].append(item)
+
+    def candidates(self, lat: float, lon: float) -> Iterator[Any]:
+        """
+        Yields every stored item that may lie within the search radius of a point.
+
+        Args:
+            lat (float): Latitude in degrees.
+            lon (float): Longitude in degrees.
+
+        Yields:
+            Any: Candidate items from the neighbouring cells.
+        """
+        cx, cy, cz = self._cell(lat, lon)
+        cells = self._cells
+        for dx, dy, dz in product((-1, 0, 1), repeat=3):
+            cell = cells.get((cx + dx, cy + dy, cz + dz))
+            if cell:
+                yield from cell
+
+
+class LineGrid:
+    """
+    Fixed-radius neighbour index over scalar values (e.g. kilometer points).
+
+    Values are bucketed in cells as wide as the search radius, so every value
+    within `radius` of a query lies in the query's cell or one of its two neighbours.
+    """
+
+    def __init__(self, radius: float) -> None:
+        """
+        Initializes the LineGrid.
+
+        Args:
+            radius (float): The search radius.
+        """
+        self.cell_size = max(radius, 1e-12) * _CELL_PADDING
+        self._cells: dict[int, list[Any]] = defaultdict(list)
+
+    def add(self, value: float, item: Any) -> None:
+        """
+        Adds an item at a position.
+
+        Args:
+            value (float): The item's position.
+            item (Any): The item to store.
+        """
+        self._cells[math.floor(value / self.cell_size)].append(item)
+
+    def candidates(self, value: float) -> Iterator[Any]:
+        """
+        Yields every stored item that may lie within the search radius of a value.
+
+        Args:
+            value (float): The query position.
+
+        Yields:
+            Any: Candidate items from the neighbouring cells.
+        """
+        cell = math.floor(value / self.cell_size)
+        for neighbour in (cell - 1, cell, cell + 1):
+            items = self._cells.get(neighbour)
+            if items:
+                yield from items
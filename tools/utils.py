@@ -1,16 +1,35 @@
 import datetime
+import enum
+import gzip
 import json
 import math
+import os
+import tempfile
+import time
+import uuid
+from collections.abc import Iterator
 from itertools import cycle
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from lambert import Lambert93, convertToWGS84Deg
+from numpy.typing import ArrayLike
 
 from config import CONSTANTS
 
+try:
+    import orjson
+except ImportError:  # Optional, installed with the "fast" extra
+    orjson = None
+
 EARTH_RADIUS_KM: float = CONSTANTS.COMMON.EARTH_RADIUS_KM
+HAVERSINE_BLOCK_ELEMENTS: int = CONSTANTS.COMMON.HAVERSINE_BLOCK_ELEMENTS
+REPLACE_ATTEMPTS: int = CONSTANTS.COMMON.REPLACE_ATTEMPTS
+REPLACE_RETRY_DELAY_S: float = CONSTANTS.COMMON.REPLACE_RETRY_DELAY_S
 DEFAULT_HEADERS: dict[str, str] = CONSTANTS.COMMON.DEFAULT_HEADERS
+# Name of the JSON library used by dump_json / parse_json
+JSON_BACKEND: str = "orjson" if orjson is not None else "json"
 
 
 def check_parent_dir(path: Path) -> None:
@@ -23,51 +42,275 @@ def check_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def check_json(json_data: Any, indent: int | None) -> str:
+def _json_default(value: Any) -> Any:
+    """
+    Serializes the types orjson supports natively, so the standard library accepts the same inputs.
+
+    Args:
+        value (Any): A value json.dumps can't serialize.
+
+    Raises:
+        TypeError: If the value isn't an enum or a UUID.
+
+    Returns:
+        Any: The enum's value, or the UUID as a string.
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_key(key: Any) -> Any:
+    """
+    Converts a dict key the way orjson's OPT_NON_STR_KEYS does, for the standard library.
+
+    Args:
+        key (Any): The key.
+
+    Returns:
+        Any: The key, as a type json.dumps accepts.
+    """
+    if isinstance(key, float) and not math.isfinite(key):
+        return None
+    if isinstance(key, enum.Enum):
+        return _json_key(key.value)
+    if isinstance(key, uuid.UUID):
+        return str(key)
+    if isinstance(key, datetime.date | datetime.time):
+        return key.isoformat()
+    return key
+
+
+def _orjson_compatible(value: Any) -> Any:
+    """
+    Returns a copy of the data with NaN and infinite floats replaced by None and dict keys converted,
+    as orjson writes them.
+
+    Args:
+        value (Any): The data.
+
+    Returns:
+        Any: The data, serializable by the standard library with the same output as orjson.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {_json_key(key): _orjson_compatible(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_orjson_compatible(item) for item in value]
+    return value
+
+
+def _stdlib_dumps(json_data: Any, compact: bool) -> str:
+    if compact:
+        return json.dumps(
+            json_data, ensure_ascii=False, allow_nan=False, default=_json_default, separators=(",", ":")
+        )
+    return json.dumps(json_data, ensure_ascii=False, allow_nan=False, default=_json_default, indent=4)
+
+
+def _indent_4(text: bytes) -> bytes:
     """
-    Validates and formats JSON data to a string.
+    Doubles the 2-space indentation of orjson's pretty output, the only width it supports.
+    JSON strings can't contain raw newlines, so each line starts with its indentation.
+
+    Args:
+        text (bytes): JSON indented by 2 spaces.
+
+    Returns:
+        bytes: The same JSON indented by 4 spaces.
+    """
+    return b"\n".join(line[: len(line) - len(line.lstrip(b" "))] + line for line in text.split(b"\n"))
+
+
+def dump_json(json_data: Any, compact: bool = False) -> bytes:
+    """
+    Serializes data to UTF-8 JSON bytes, with orjson when it is installed and the standard library otherwise.
+    Both backends accept the same inputs and produce the same output: non-ASCII characters are kept,
+    pretty output is indented by 4 spaces, NaN and infinite floats are written as null, enums as their
+    value and UUIDs as strings. Dict keys follow orjson's OPT_NON_STR_KEYS rules (e.g. dates as ISO 8601).
+    Datetime and dataclass values and other objects are rejected by both, numpy arrays and numpy
+    scalars that aren't float subclasses included.
 
     Args:
         json_data (Any): The data to serialize.
-        indent (int | None): The indentation level for pretty-printing.
+        compact (bool, optional): Drop all optional whitespace. Defaults to False.
 
     Raises:
         ValueError: If the data cannot be serialized to JSON.
 
     Returns:
-        str: The JSON formatted string.
+        bytes: The JSON document.
     """
-    if isinstance(json_data, str):
-        return json_data
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | (0 if compact else orjson.OPT_INDENT_2)
+        )
+        try:
+            output = orjson.dumps(json_data, option=option)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits and float subclasses (e.g. numpy.float64) are left to the
+            # standard library, which also raises for everything orjson rejects
+            pass
+        else:
+            return output if compact else _indent_4(output)
     try:
-        return json.dumps(json_data, ensure_ascii=False, indent=indent)
-    except (TypeError, ValueError) as e:
+        try:
+            text = _stdlib_dumps(json_data, compact)
+        except (TypeError, ValueError):
+            # Out of range floats or non-str keys, converted like orjson does
+            text = _stdlib_dumps(_orjson_compatible(json_data), compact)
+    except (TypeError, ValueError, RecursionError) as e:
         raise ValueError(f"Data is not serializable to JSON: {e}") from e
+    return text.encode("utf-8")
 
 
-def save_json(json_data: Any, output: Path | str) -> None:
+def parse_json(raw_data: str | bytes) -> Any:
     """
-    Synchronously saves JSON data to a file with proper error handling.
+    Parses a JSON document, with orjson when it is installed and the standard library otherwise.
+
+    Args:
+        raw_data (str | bytes): The JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+
+    Returns:
+        Any: The parsed data.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or integers beyond 64 bits: left to the standard library
+            pass
+    return json.loads(raw_data)
+
+
+def _replace(source: Path, target: Path) -> None:
+    """
+    Renames a file over another one.
+    On Windows the rename fails while another process has the target open (e.g. a browser source
+    reading it), so it is retried REPLACE_ATTEMPTS times with exponential backoff.
+
+    Args:
+        source (Path): The file to rename.
+        target (Path): The file to replace.
+
+    Raises:
+        PermissionError: If the target is still in use after the last attempt.
+    """
+    delay = REPLACE_RETRY_DELAY_S
+    for _ in range(REPLACE_ATTEMPTS - 1):
+        try:
+            source.replace(target)
+        except PermissionError:
+            if os.name != "nt":
+                raise
+            time.sleep(delay)
+            delay *= 2
+        else:
+            return
+    source.replace(target)
+
+
+def atomic_write(
+    output: Path | str,
+    content: str | bytes,
+    compress: bool = False,
+    durable: bool = True,
+) -> Path:
+    """
+    Writes a file atomically, so readers see either the previous or the new content, never a partial file.
+    The content is written to a temporary file in the same directory, flushed and fsynced, then renamed over the target.
+    Blocks while fsyncing and retrying the rename, call it with asyncio.to_thread from async code.
 
     Args:
-        json_data (Any): The data to save.
         output (Path | str): The output file path.
+        content (str | bytes): The content, text is encoded as UTF-8.
+        compress (bool, optional): Gzip the content. Defaults to False.
+        durable (bool, optional): Fsync the file and its directory, so the new content survives a crash.
+            Without it the write is still atomic for readers. Defaults to True.
 
     Raises:
         OSError: If the file cannot be written.
+
+    Returns:
+        Path: The written file path.
     """
     output_path = Path(output)
     check_parent_dir(output_path)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if compress:
+        # mtime=0 keeps the output identical for identical content
+        data = gzip.compress(data, mtime=0)
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    temp_path = Path(temp_name)
     try:
-        content: str = check_json(json_data, indent=4)
-        output_path.write_text(content, encoding="utf-8")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            if durable:
+                os.fsync(file.fileno())
+        # mkstemp creates the file readable by its owner only
+        mode = output_path.stat().st_mode if output_path.exists() else 0o644
+        temp_path.chmod(mode & 0o777)
+        _replace(temp_path, output_path)
     except OSError as e:
+        temp_path.unlink(missing_ok=True)
         raise OSError(f"Failed to write file {output_path}: {e}") from e
 
+    if durable and os.name == "posix":
+        # Persist the rename itself
+        dir_fd = os.open(output_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return output_path
+
+
+def save_json(
+    json_data: Any,
+    output: Path | str,
+    compact: bool = False,
+    compress: bool = False,
+) -> Path:
+    """
+    Synchronously and atomically saves JSON data to a file with proper error handling.
+    Strings are written as-is, other data is serialized with `dump_json`.
+
+    Args:
+        json_data (Any): The data to save.
+        output (Path | str): The output file path.
+        compact (bool, optional): Write without indentation or spaces, instead of a 4-space indent. Defaults to False.
+        compress (bool, optional): Gzip the file, adding a ".gz" suffix to the path if missing. Defaults to False.
+
+    Raises:
+        OSError: If the file cannot be written.
+
+    Returns:
+        Path: The written file path.
+    """
+    output_path = Path(output)
+    if compress and output_path.suffix != ".gz":
+        output_path = output_path.with_name(output_path.name + ".gz")
+    content = json_data if isinstance(json_data, str) else dump_json(json_data, compact)
+    return atomic_write(output_path, content, compress=compress)
+
 
 def load_json(json_data: Path | str | list[Any] | dict[str, Any]) -> Any:
     """
     Loads JSON data from a file, raw string, or passes it through if already dict/list.
+    Files ending in ".gz" are decompressed.
 
     Args:
         json_data (Path | str | list | dict): The source data.
@@ -82,11 +325,13 @@ def load_json(json_data: Path | str | list[Any] | dict[str, Any]) -> Any:
     if isinstance(json_data, (list, dict)):
         return json_data
     try:
+        if isinstance(json_data, Path) and json_data.suffix == ".gz":
+            with gzip.open(json_data, "rb") as infile:
+                return parse_json(infile.read())
         if isinstance(json_data, Path):
-            with Path.open(json_data, encoding="utf-8") as infile:
-                return json.load(infile)
+            return parse_json(json_data.read_bytes())
         else:
-            return json.loads(json_data)
+            return parse_json(json_data)
     except OSError as e:
         raise OSError(f"Failed to read file {json_data}: {e}") from e
     except json.JSONDecodeError as e:
@@ -214,6 +459,126 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return 2 * r * math.asin(min(1.0, math.sqrt(a)))
 
 
+def _haversine_np(
+    phi1: np.ndarray, cos_phi1: np.ndarray, lon1: np.ndarray,
+    phi2: np.ndarray, cos_phi2: np.ndarray, lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Same formula as `haversine_km` on broadcast arrays, with latitudes already in radians.
+
+    Args:
+        phi1 (np.ndarray): Latitudes of the first points, in radians.
+        cos_phi1 (np.ndarray): Their cosines.
+        lon1 (np.ndarray): Longitudes of the first points, in degrees.
+        phi2 (np.ndarray): Latitudes of the second points, in radians.
+        cos_phi2 (np.ndarray): Their cosines.
+        lon2 (np.ndarray): Longitudes of the second points, in degrees.
+
+    Returns:
+        np.ndarray: The distances in kilometers, NaN where a coordinate is NaN.
+    """
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + cos_phi1 * cos_phi2 * np.sin(np.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def haversine_km_many(lat: float, lon: float, lats: ArrayLike, lons: ArrayLike) -> np.ndarray:
+    """
+    Calculates the great-circle distances from one point to many points, in kilometers.
+
+    Args:
+        lat (float): Latitude of the point.
+        lon (float): Longitude of the point.
+        lats (ArrayLike): Latitudes of the other points.
+        lons (ArrayLike): Longitudes of the other points.
+
+    Returns:
+        np.ndarray: The distance to each point, NaN where its coordinates are NaN.
+    """
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    phi1 = math.radians(lat)
+    return _haversine_np(
+        phi1, math.cos(phi1), lon, phi2, np.cos(phi2), np.asarray(lons, dtype=np.float64)
+    )
+
+
+def haversine_km_blocks(
+    lats1: ArrayLike,
+    lons1: ArrayLike,
+    lats2: ArrayLike,
+    lons2: ArrayLike,
+    block_elements: int = HAVERSINE_BLOCK_ELEMENTS,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Calculates the great-circle distances between every point of a first set and every point of a second set,
+    one block of first-set rows at a time, so memory stays bounded whatever the set sizes.
+
+    Args:
+        lats1 (ArrayLike): Latitudes of the first set.
+        lons1 (ArrayLike): Longitudes of the first set.
+        lats2 (ArrayLike): Latitudes of the second set.
+        lons2 (ArrayLike): Longitudes of the second set.
+        block_elements (int, optional): Maximum number of distances per block.
+            Defaults to HAVERSINE_BLOCK_ELEMENTS -> 1_000_000.
+
+    Yields:
+        tuple[int, np.ndarray]: The first row of the block, and its (rows, len(second set)) distances in kilometers.
+    """
+    phi1 = np.radians(np.asarray(lats1, dtype=np.float64))
+    lon1 = np.asarray(lons1, dtype=np.float64)
+    phi2 = np.radians(np.asarray(lats2, dtype=np.float64))
+    lon2 = np.asarray(lons2, dtype=np.float64)
+    cos_phi1, cos_phi2 = np.cos(phi1), np.cos(phi2)
+    rows = max(1, block_elements // max(1, len(phi2)))
+    for start in range(0, len(phi1), rows):
+        block = slice(start, start + rows)
+        yield start, _haversine_np(
+            phi1[block, None], cos_phi1[block, None], lon1[block, None],
+            phi2, cos_phi2, lon2,
+        )
+
+
+def nearest_km(
+    lats: ArrayLike,
+    lons: ArrayLike,
+    ref_lats: ArrayLike,
+    ref_lons: ArrayLike,
+    block_elements: int = HAVERSINE_BLOCK_ELEMENTS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the nearest reference point of every query point.
+
+    Args:
+        lats (ArrayLike): Latitudes of the query points.
+        lons (ArrayLike): Longitudes of the query points.
+        ref_lats (ArrayLike): Latitudes of the reference points.
+        ref_lons (ArrayLike): Longitudes of the reference points.
+        block_elements (int, optional): Maximum number of distances computed at once.
+            Defaults to HAVERSINE_BLOCK_ELEMENTS -> 1_000_000.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: For each query point, the index of its nearest reference point
+            (the first one on ties) and the distance in kilometers; -1 and inf when no reference point
+            has valid coordinates, or the query point has none.
+    """
+    count = len(np.asarray(lats))
+    indexes = np.full(count, -1, dtype=np.int64)
+    distances = np.full(count, np.inf)
+    if len(np.asarray(ref_lats)) == 0:
+        return indexes, distances
+    for start, block in haversine_km_blocks(lats, lons, ref_lats, ref_lons, block_elements):
+        block[np.isnan(block)] = np.inf
+        best = np.argmin(block, axis=1)
+        best_distances = block[np.arange(len(best)), best]
+        found = np.isfinite(best_distances)
+        stop = start + len(best)
+        indexes[start:stop] = np.where(found, best, -1)
+        distances[start:stop] = best_distances
+    return indexes, distances
+
+
 def get_country(camera_data: list[dict[str, Any]]) -> str:
     """
     Extracts the country identifier from the parsed camera data structure.